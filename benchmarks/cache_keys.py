@@ -0,0 +1,66 @@
+"""
+Measures the response cache hit rate of business searches around a few points, with coordinates jittered the way
+device locations are, and locations spelled in different ways. Compares raw URL keys with canonical keys, without and
+with grid snapping.
+
+Usage::
+
+    python benchmarks/cache_keys.py [searches] [grid]
+"""
+
+import random
+import sys
+from typing import Callable, List, Optional, Set
+
+from yelpfusion3.business.endpoint import BusinessSearchEndpoint
+from yelpfusion3.cache import canonical_key
+from yelpfusion3.settings import Settings
+
+POINTS: List[tuple] = [(37.7749, -122.4194), (40.7128, -74.0060), (41.8781, -87.6298)]
+LOCATIONS: List[str] = ["San Francisco, CA", "san francisco,ca", "San Francisco,  CA", "SAN FRANCISCO, CA"]
+
+
+def searches(count: int) -> List[BusinessSearchEndpoint]:
+    generator: random.Random = random.Random(1)
+    endpoints: List[BusinessSearchEndpoint] = []
+    for _ in range(count):
+        if generator.random() < 0.5:
+            endpoints.append(BusinessSearchEndpoint(term="coffee", location=generator.choice(LOCATIONS)))
+            continue
+        latitude, longitude = generator.choice(POINTS)
+        endpoints.append(
+            BusinessSearchEndpoint(
+                term="coffee",
+                latitude=round(latitude + generator.uniform(-0.0004, 0.0004), 6),
+                longitude=round(longitude + generator.uniform(-0.0004, 0.0004), 6),
+            )
+        )
+    return endpoints
+
+
+def run(name: str, endpoints: List[BusinessSearchEndpoint], key: Callable[[BusinessSearchEndpoint], str]) -> None:
+    seen: Set[str] = set()
+    hits: int = 0
+    for endpoint in endpoints:
+        cache_key: str = key(endpoint)
+        hits += cache_key in seen
+        seen.add(cache_key)
+    print(f"{name:>9}: {hits / len(endpoints):6.1%} hit rate, {len(seen):5d} distinct keys")
+
+
+def canonical(grid: Optional[float]) -> Callable[[BusinessSearchEndpoint], str]:
+    url: str = f"{Settings().base_url}{BusinessSearchEndpoint._path}"
+    return lambda endpoint: canonical_key(url, endpoint.dict(), grid)
+
+
+def main() -> None:
+    count: int = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    grid: float = float(sys.argv[2]) if len(sys.argv) > 2 else 0.001
+    endpoints: List[BusinessSearchEndpoint] = searches(count)
+    run("url", endpoints, lambda endpoint: endpoint.url)
+    run("canonical", endpoints, canonical(None))
+    run("snapped", endpoints, canonical(grid))
+
+
+if __name__ == "__main__":
+    main()
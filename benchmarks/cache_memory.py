@@ -0,0 +1,72 @@
+"""
+Compares the memory used per cached business, and the latency of a hit, between the in-memory cache of parsed models
+and the compressed cache of raw bodies. Hit latency is reported for a bare lookup followed by parsing into
+``BusinessDetails``, which is what an endpoint does on a hit.
+
+Usage::
+
+    python benchmarks/cache_memory.py [businesses]
+"""
+
+import gc
+import json
+import sys
+import time
+import tracemalloc
+from typing import List
+
+from stub_server import BUSINESS_DETAILS
+
+from yelpfusion3.business.model import BusinessDetails
+from yelpfusion3.cache import Cache, CacheEntry, CompressedMemoryCache, MemoryCache
+
+
+def bodies(count: int) -> List[bytes]:
+    return [
+        json.dumps({**BUSINESS_DETAILS, "id": f"business-{index:06d}", "review_count": index}).encode()
+        for index in range(count)
+    ]
+
+
+def fill(cache: Cache, payloads: List[bytes]) -> float:
+    """
+    :return: Bytes allocated per business while filling the cache.
+    """
+
+    gc.collect()
+    tracemalloc.start()
+    for index, body in enumerate(payloads):
+        entry: CacheEntry = CacheEntry.create(body, ttl=3600)
+        # Endpoints store the model they parsed with the body.
+        entry.model = BusinessDetails.parse_raw(body)
+        cache.set(f"https://api.yelp.com/v3/businesses/business-{index:06d}", entry)
+    gc.collect()
+    allocated, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return allocated / len(payloads)
+
+
+def hits(cache: Cache, count: int) -> float:
+    """
+    :return: Microseconds per hit, including parsing when the entry has no model.
+    """
+
+    keys: List[str] = [f"https://api.yelp.com/v3/businesses/business-{index:06d}" for index in range(count)]
+    start: float = time.perf_counter()
+    for key in keys:
+        cache.get(key).parse(BusinessDetails)
+    return (time.perf_counter() - start) / count * 1e6
+
+
+def main() -> None:
+    count: int = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    payloads: List[bytes] = bodies(count)
+    print(f"{'json':>10}: {sum(map(len, payloads)) / count:9.0f} bytes per business")
+    for name, cache in (("memory", MemoryCache(max_entries=count)), ("compressed", CompressedMemoryCache())):
+        per_business: float = fill(cache, payloads)
+        latency: float = hits(cache, count)
+        print(f"{name:>10}: {per_business:9.0f} bytes per business, {latency:7.1f} µs per hit")
+
+
+if __name__ == "__main__":
+    main()
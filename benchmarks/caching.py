@@ -0,0 +1,57 @@
+"""
+Compares repeated requests for the same business with no response cache, the in-memory cache and the SQLite cache,
+against a local stub server with a fixed response latency. Also reports the latency of a bare SQLite cache lookup.
+
+Usage::
+
+    python benchmarks/caching.py [requests] [latency]
+"""
+
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Optional
+
+from stub_server import StubHandler, stub_server
+
+from yelpfusion3.business.endpoint import BusinessDetailsEndpoint
+from yelpfusion3.cache import Cache, MemoryCache, SqliteCache, set_cache
+from yelpfusion3.client import Client
+
+
+def run(name: str, cache: Optional[Cache], count: int) -> None:
+    set_cache(cache)
+    StubHandler.requests = 0
+    start: float = time.perf_counter()
+    for _ in range(count):
+        Client.business_details(business_id="WavvLdfdP6g8aZTtbBQHTw").get()
+    elapsed: float = time.perf_counter() - start
+    print(f"{name:>9}: {elapsed / count * 1e6:9.1f} µs per request, {StubHandler.requests:5d} requests sent")
+
+
+def lookup(cache: SqliteCache, count: int) -> None:
+    key: str = BusinessDetailsEndpoint(business_id="WavvLdfdP6g8aZTtbBQHTw").cache_key
+    start: float = time.perf_counter()
+    for _ in range(count):
+        cache.get(key)
+    elapsed: float = time.perf_counter() - start
+    print(f"   lookup: {elapsed / count * 1e6:9.1f} µs per SQLite hit, {cache.size} bytes stored compressed")
+
+
+def main() -> None:
+    count: int = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    StubHandler.latency = float(sys.argv[2]) if len(sys.argv) > 2 else 0.005
+    with stub_server() as base_url, tempfile.TemporaryDirectory() as directory:
+        os.environ["BASE_URL"] = base_url
+        sqlite_cache: SqliteCache = SqliteCache(path=Path(directory) / "cache.db")
+        run("uncached", None, count)
+        run("memory", MemoryCache(), count)
+        run("sqlite", sqlite_cache, count)
+        lookup(sqlite_cache, count)
+        set_cache(None)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""
+Compares category details lookups through the API, with a simulated response latency, and through the category
+catalog. Also reports the size of the saved catalog against the raw all categories response.
+
+Usage::
+
+    python benchmarks/catalog.py [categories] [latency]
+"""
+
+import json
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import List
+
+from yelpfusion3.category.catalog import CategoryCatalog, get_category_catalog, reset_category_catalogs
+from yelpfusion3.client import Client
+from yelpfusion3.settings import reset_settings
+from yelpfusion3.transport import StubResponse, StubTransport, set_transport
+
+
+def taxonomy(count: int) -> dict:
+    categories: List[dict] = [
+        {
+            "alias": f"category{index}",
+            "title": f"Category {index}",
+            "parent_aliases": [f"category{index // 10}"] if index >= 10 else [],
+            "country_whitelist": [],
+            "country_blacklist": ["JP"] if index % 50 == 0 else [],
+        }
+        for index in range(count)
+    ]
+    return {"categories": categories}
+
+
+def run(name: str, aliases: List[str]) -> None:
+    start: float = time.perf_counter()
+    for alias in aliases:
+        Client.category_details(alias=alias).get()
+    elapsed: float = time.perf_counter() - start
+    print(f"{name:>8}: {elapsed / len(aliases) * 1e6:9.1f} µs per lookup")
+
+
+def main() -> None:
+    count: int = int(sys.argv[1]) if len(sys.argv) > 1 else 1500
+    latency: float = float(sys.argv[2]) if len(sys.argv) > 2 else 0.005
+    categories: dict = taxonomy(count)
+    set_transport(
+        StubTransport(
+            routes={
+                "/categories": StubResponse(categories, latency=latency),
+                "/categories/*": lambda url: StubResponse(
+                    {"category": categories["categories"][int(url.rsplit("category", 1)[1])]}, latency=latency
+                ),
+            }
+        )
+    )
+    aliases: List[str] = [f"category{index}" for index in range(0, count, max(count // 200, 1))]
+    with tempfile.TemporaryDirectory() as directory:
+        os.environ["YELP_CATEGORY_CATALOG_DIR"] = directory
+        reset_settings()
+        run("api", aliases)
+        os.environ["YELP_CATEGORY_CATALOG"] = "true"
+        reset_settings()
+        get_category_catalog().refresh()
+        run("catalog", aliases)
+        path: Path = Path(directory) / "categories-all.json.gz"
+        start: float = time.perf_counter()
+        len(CategoryCatalog(path=path))
+        loaded: float = time.perf_counter() - start
+        print(f"    load: {loaded * 1e3:9.1f} ms for {count} categories from the saved catalog")
+        print(f"    size: {path.stat().st_size:9d} bytes saved, {len(json.dumps(categories)):9d} bytes as returned")
+    reset_category_catalogs()
+    set_transport(None)
+
+
+if __name__ == "__main__":
+    main()
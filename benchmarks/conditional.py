@@ -0,0 +1,82 @@
+"""
+Compares refreshing expired business details with a full response against revalidating them with a conditional request
+answered by ``304 Not Modified``, which renews the cached entry without transferring or parsing the body again.
+
+Usage::
+
+    python benchmarks/conditional.py [businesses] [rounds]
+"""
+
+import sys
+import time
+from typing import List, Set
+
+from stub_server import BUSINESS_DETAILS
+
+from yelpfusion3.business.endpoint import BusinessDetailsEndpoint
+from yelpfusion3.cache import MemoryCache, set_cache
+from yelpfusion3.transport import StubResponse, StubTransport, set_transport
+
+TTL: float = 1.0
+
+
+class Details:
+    """
+    Serves the business details on first request for each business and, with ``etag``, ``304 Not Modified`` on later
+    ones, counting the body bytes it serves.
+    """
+
+    def __init__(self, etag: bool) -> None:
+        self.etag: bool = etag
+        self.served: Set[str] = set()
+        self.body_bytes: int = 0
+
+    def __call__(self, url: str) -> StubResponse:
+        if self.etag and url in self.served:
+            return StubResponse(status_code=304)
+        self.served.add(url)
+        response: StubResponse = StubResponse(
+            {**BUSINESS_DETAILS, "id": url.rsplit("/", 1)[1]}, headers={"ETag": '"v1"'} if self.etag else {}
+        )
+        self.body_bytes += len(response.body)
+        return response
+
+
+def run(name: str, endpoints: List[BusinessDetailsEndpoint], rounds: int, etag: bool) -> None:
+    details: Details = Details(etag)
+    set_cache(MemoryCache())
+    set_transport(StubTransport(routes={"/businesses/*": details}))
+    for endpoint in endpoints:
+        endpoint.get()
+    details.body_bytes = 0
+    elapsed: float = 0.0
+    for _ in range(rounds):
+        # Expire every entry, but within the time an entry with an ETag is kept, so that each get refreshes it.
+        time.sleep(TTL * 1.1)
+        start: float = time.perf_counter()
+        for endpoint in endpoints:
+            endpoint.get()
+        elapsed += time.perf_counter() - start
+    refreshes: int = rounds * len(endpoints)
+    print(
+        f"{name:>12}: {elapsed / refreshes * 1e6:7.1f} µs and {details.body_bytes / refreshes:6.0f} body bytes per "
+        "refresh"
+    )
+
+
+def main() -> None:
+    count: int = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+    rounds: int = int(sys.argv[2]) if len(sys.argv) > 2 else 3
+    BusinessDetailsEndpoint._cache_ttl = TTL
+    endpoints: List[BusinessDetailsEndpoint] = [
+        BusinessDetailsEndpoint(business_id=f"business-{index:06d}") for index in range(count)
+    ]
+
+    run("full", endpoints, rounds, etag=False)
+    run("conditional", endpoints, rounds, etag=True)
+    set_cache(None)
+    set_transport(None)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""
+Compares request latency percentiles with and without hedged requests against a server with a slow tail.
+
+Usage::
+
+    python benchmarks/hedging.py [requests] [slow_ratio] [slow_delay]
+"""
+
+import os
+import sys
+import time
+from typing import List
+
+from stub_server import StubHandler, stub_server
+
+from yelpfusion3.business.endpoint import BusinessDetailsEndpoint
+from yelpfusion3.hedge import HedgeStats, get_hedger, hedging, reset_hedgers
+
+
+def percentile(latencies: List[float], percent: float) -> float:
+    ordered: List[float] = sorted(latencies)
+    return ordered[max(0, round(percent / 100 * len(ordered)) - 1)]
+
+
+def run(name: str, count: int, hedged: bool) -> None:
+    endpoint: BusinessDetailsEndpoint = BusinessDetailsEndpoint(business_id="WavvLdfdP6g8aZTtbBQHTw")
+    latencies: List[float] = []
+    StubHandler.connections = 0
+    with hedging(enabled=hedged):
+        for _ in range(count):
+            start: float = time.perf_counter()
+            endpoint.get()
+            latencies.append(time.perf_counter() - start)
+    stats: HedgeStats = get_hedger(endpoint._path).stats  # pylint: disable=protected-access
+    print(
+        f"{name:>10}: p50 {percentile(latencies, 50) * 1000:7.1f} ms, p99 {percentile(latencies, 99) * 1000:7.1f} ms,"
+        f" hedge rate {stats.hedge_rate:6.1%}, win rate {stats.win_rate:6.1%},"
+        f" {count + stats.hedged:5d} requests sent"
+    )
+
+
+def main() -> None:
+    count: int = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    StubHandler.slow_ratio = float(sys.argv[2]) if len(sys.argv) > 2 else 0.02
+    StubHandler.slow_delay = float(sys.argv[3]) if len(sys.argv) > 3 else 0.2
+    with stub_server() as base_url:
+        os.environ["BASE_URL"] = base_url
+        os.environ["YELP_COALESCE_REQUESTS"] = "false"
+        os.environ["YELP_CIRCUIT_BREAKER"] = "false"
+        run("unhedged", count, hedged=False)
+        reset_hedgers()
+        run("hedged", count, hedged=True)
+
+
+if __name__ == "__main__":
+    main()
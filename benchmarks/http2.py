@@ -0,0 +1,115 @@
+"""
+Compares connection count and latency of concurrent requests over pooled HTTP/1.1 connections and over multiplexed
+HTTP/2 connections, for both the synchronous and the asynchronous endpoint paths.
+
+The local servers speak cleartext HTTP/2 with prior knowledge, so the HTTP/2 clients are created with ``http1=False``.
+Against Yelp, HTTP/2 is negotiated through TLS and the ``YELP_HTTP2`` setting is all that is needed.
+
+Usage::
+
+    python benchmarks/http2.py [requests] [concurrency] [latency]
+"""
+
+import asyncio
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import AbstractContextManager
+from typing import Callable, List
+
+import httpx
+from stub_server import StubHandler, h2_stub_server, stub_server
+
+from yelpfusion3.business.endpoint import BusinessDetailsEndpoint
+from yelpfusion3.session import close_session
+from yelpfusion3.settings import reset_settings
+from yelpfusion3.transport import (
+    Http2Transport,
+    HttpxTransport,
+    RequestsTransport,
+    set_async_transport,
+    set_transport,
+)
+
+
+def percentile(latencies: List[float], percent: float) -> float:
+    ordered: List[float] = sorted(latencies)
+    return ordered[max(0, round(percent / 100 * len(ordered)) - 1)]
+
+
+def report(name: str, latencies: List[float], elapsed: float) -> None:
+    print(
+        f"{name:>14}: {StubHandler.connections:4d} connections, {len(latencies) / elapsed:8.1f} req/s,"
+        f" p50 {percentile(latencies, 50) * 1000:6.1f} ms, p99 {percentile(latencies, 99) * 1000:6.1f} ms"
+    )
+
+
+def timed(call: Callable[[], object], latencies: List[float]) -> None:
+    start: float = time.perf_counter()
+    call()
+    latencies.append(time.perf_counter() - start)
+
+
+def run_sync(name: str, server: Callable[[], AbstractContextManager], count: int, concurrency: int) -> None:
+    with server() as base_url:
+        os.environ["BASE_URL"] = base_url
+        reset_settings()
+        endpoints: List[BusinessDetailsEndpoint] = [
+            BusinessDetailsEndpoint(business_id=f"business-{index}") for index in range(count)
+        ]
+        latencies: List[float] = []
+        StubHandler.connections = 0
+        start: float = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            list(executor.map(lambda endpoint: timed(endpoint.get, latencies), endpoints))
+        report(name, latencies, time.perf_counter() - start)
+
+
+async def run_async(name: str, server: Callable[[], AbstractContextManager], count: int, concurrency: int) -> None:
+    with server() as base_url:
+        os.environ["BASE_URL"] = base_url
+        reset_settings()
+        semaphore: asyncio.Semaphore = asyncio.Semaphore(concurrency)
+        latencies: List[float] = []
+
+        async def fetch(endpoint: BusinessDetailsEndpoint) -> None:
+            async with semaphore:
+                start: float = time.perf_counter()
+                await endpoint.aget()
+                latencies.append(time.perf_counter() - start)
+
+        StubHandler.connections = 0
+        start: float = time.perf_counter()
+        await asyncio.gather(
+            *(fetch(BusinessDetailsEndpoint(business_id=f"business-{index}")) for index in range(count))
+        )
+        report(name, latencies, time.perf_counter() - start)
+
+
+def main() -> None:
+    count: int = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    concurrency: int = int(sys.argv[2]) if len(sys.argv) > 2 else 32
+    StubHandler.latency = float(sys.argv[3]) if len(sys.argv) > 3 else 0.01
+    os.environ["YELP_POOL_MAXSIZE"] = str(concurrency)
+    os.environ["YELP_COALESCE_REQUESTS"] = "false"
+
+    close_session()
+    set_transport(RequestsTransport())
+    run_sync("sync HTTP/1.1", stub_server, count, concurrency)
+    set_transport(Http2Transport(httpx.AsyncClient(http1=False, http2=True)))
+    run_sync("sync HTTP/2", h2_stub_server, count, concurrency)
+    set_transport(None)
+
+    async def run_both() -> None:
+        set_async_transport(HttpxTransport(httpx.AsyncClient(limits=httpx.Limits(max_connections=concurrency))))
+        await run_async("async HTTP/1.1", stub_server, count, concurrency)
+        set_async_transport(HttpxTransport(httpx.AsyncClient(http1=False, http2=True)))
+        await run_async("async HTTP/2", h2_stub_server, count, concurrency)
+        set_async_transport(None)
+
+    asyncio.run(run_both())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""
+Compares the memory held by the pages of a simulated crawl, in which the same businesses come back in many business
+searches, without and with the business identity map.
+
+Usage::
+
+    python benchmarks/identity_map.py [pages] [businesses]
+"""
+
+import gc
+import random
+import sys
+import tracemalloc
+from typing import List
+
+from stub_server import BUSINESS_DETAILS
+
+from yelpfusion3.business.endpoint import BusinessSearchEndpoint
+from yelpfusion3.business.identity import BusinessIdentityMap, set_business_identity_map
+from yelpfusion3.business.model import BusinessSearch
+from yelpfusion3.cache import caching
+from yelpfusion3.transport import StubTransport, set_transport
+
+PAGE_SIZE: int = 50
+
+
+def page(pool: int, generator: random.Random) -> dict:
+    businesses: List[dict] = [
+        {**BUSINESS_DETAILS, "id": f"business-{index:06d}", "distance": round(generator.uniform(10, 5000), 1)}
+        for index in generator.sample(range(pool), PAGE_SIZE)
+    ]
+    return {"total": pool, "businesses": businesses, "region": {"center": {"latitude": 37.8, "longitude": -122.27}}}
+
+
+def crawl(name: str, pages: int) -> None:
+    gc.collect()
+    tracemalloc.start()
+    results: List[BusinessSearch] = [
+        BusinessSearchEndpoint(location="San Francisco, CA", term=f"query {index}").get() for index in range(pages)
+    ]
+    gc.collect()
+    allocated, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    distinct: int = len({id(business) for result in results for business in result.businesses})
+    print(f"{name:>12}: {allocated / 2**20:7.1f} MiB held, {distinct:6d} Business objects")
+
+
+def main() -> None:
+    pages: int = int(sys.argv[1]) if len(sys.argv) > 1 else 400
+    pool: int = int(sys.argv[2]) if len(sys.argv) > 2 else 2000
+    generator: random.Random = random.Random(1)
+    set_transport(StubTransport(routes={"/businesses/search": lambda url: page(pool, generator)}))
+    with caching(False):
+        crawl("plain", pages)
+        set_business_identity_map(BusinessIdentityMap())
+        crawl("identity map", pages)
+    set_business_identity_map(None)
+    set_transport(None)
+
+
+if __name__ == "__main__":
+    main()
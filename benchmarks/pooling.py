@@ -0,0 +1,54 @@
+"""
+Compares request throughput with and without the shared connection pool.
+
+Usage::
+
+    python benchmarks/pooling.py [requests] [threads]
+"""
+
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable
+
+import requests
+from stub_server import StubHandler, stub_server
+
+from yelpfusion3.business.endpoint import BusinessDetailsEndpoint
+from yelpfusion3.business.model import BusinessDetails
+from yelpfusion3.session import close_session
+from yelpfusion3.settings import Settings
+
+
+def unpooled(endpoint: BusinessDetailsEndpoint) -> None:
+    BusinessDetails(**requests.get(url=endpoint.url, headers=Settings().headers, timeout=20).json())
+
+
+def pooled(endpoint: BusinessDetailsEndpoint) -> None:
+    endpoint.get()
+
+
+def run(name: str, call: Callable[[BusinessDetailsEndpoint], None], count: int, threads: int) -> None:
+    endpoint: BusinessDetailsEndpoint = BusinessDetailsEndpoint(business_id="WavvLdfdP6g8aZTtbBQHTw")
+    StubHandler.connections = 0
+    start: float = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        list(executor.map(lambda _: call(endpoint), range(count)))
+    elapsed: float = time.perf_counter() - start
+    print(f"{name:>10}: {count / elapsed:8.1f} req/s, {StubHandler.connections:5d} connections opened")
+
+
+def main() -> None:
+    count: int = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    threads: int = int(sys.argv[2]) if len(sys.argv) > 2 else 8
+    with stub_server() as base_url:
+        os.environ["BASE_URL"] = base_url
+        os.environ["YELP_POOL_MAXSIZE"] = str(threads)
+        close_session()
+        run("unpooled", unpooled, count, threads)
+        run("pooled", pooled, count, threads)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""
+Compares the JSON backends at decoding a 50-result business search and serializing the resulting models. Model
+serialization also includes pydantic's conversion of the model to a dictionary, which no backend speeds up.
+
+Usage::
+
+    python benchmarks/serialization.py [iterations]
+"""
+
+import json
+import sys
+import timeit
+from typing import Callable
+
+from stub_server import BUSINESS_DETAILS
+
+from yelpfusion3.business.model import BusinessDetails, BusinessSearch
+from yelpfusion3.serialization import BACKENDS, JsonBackend, dumps, loads, set_json_backend
+
+SEARCH: bytes = json.dumps(
+    {
+        "businesses": [{**BUSINESS_DETAILS, "id": f"business-{index}", "distance": 120.5} for index in range(50)],
+        "total": 50,
+        "region": {"center": {"latitude": 37.8, "longitude": -122.4}},
+    }
+).encode()
+
+
+def measure(name: str, call: Callable[[], object], iterations: int) -> float:
+    seconds: float = min(timeit.repeat(call, number=iterations, repeat=5)) / iterations
+    print(f"  {name:<24} {seconds * 1e6:9.1f} µs")
+    return seconds
+
+
+def main() -> None:
+    iterations: int = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    search: BusinessSearch = BusinessSearch(**json.loads(SEARCH))
+    details: BusinessDetails = BusinessDetails(**BUSINESS_DETAILS)
+    payload: dict = json.loads(SEARCH)
+    for name, backend in BACKENDS.items():
+        try:
+            json_backend: JsonBackend = backend()
+        except ImportError:
+            print(f"{name}: not installed")
+            continue
+        set_json_backend(json_backend)
+        print(f"{name}:")
+        measure("decode search body", lambda: loads(SEARCH), iterations)
+        measure("encode search payload", lambda: dumps(payload), iterations)
+        measure("BusinessSearch.json()", search.json, iterations)
+        measure("BusinessDetails.json()", details.json, iterations * 10)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""
+Compares read-path latency of a hot, quickly expiring business with and without stale-while-revalidate, against a
+local stub server with a fixed response latency.
+
+Usage::
+
+    python benchmarks/stale.py [seconds] [ttl] [latency]
+"""
+
+import os
+import sys
+import time
+from typing import List
+
+from stub_server import StubHandler, stub_server
+
+from yelpfusion3.business.endpoint import BusinessDetailsEndpoint
+from yelpfusion3.cache import MemoryCache, get_revalidator, set_cache
+from yelpfusion3.client import Client
+from yelpfusion3.settings import reset_settings
+
+
+def run(name: str, duration: float) -> None:
+    set_cache(MemoryCache())
+    StubHandler.requests = 0
+    latencies: List[float] = []
+    end: float = time.perf_counter() + duration
+    while time.perf_counter() < end:
+        start: float = time.perf_counter()
+        Client.business_details(business_id="WavvLdfdP6g8aZTtbBQHTw").get()
+        latencies.append(time.perf_counter() - start)
+    while get_revalidator().pending:
+        time.sleep(0.01)
+    latencies.sort()
+    print(
+        f"{name:>24}: p50 {latencies[len(latencies) // 2] * 1000:6.2f} ms,"
+        f" p99.9 {latencies[int(len(latencies) * 0.999)] * 1000:6.2f} ms, max {latencies[-1] * 1000:6.2f} ms,"
+        f" {StubHandler.requests:3d} requests sent"
+    )
+
+
+def main() -> None:
+    duration: float = float(sys.argv[1]) if len(sys.argv) > 1 else 3.0
+    BusinessDetailsEndpoint._cache_ttl = float(sys.argv[2]) if len(sys.argv) > 2 else 0.2
+    StubHandler.latency = float(sys.argv[3]) if len(sys.argv) > 3 else 0.05
+    with stub_server() as base_url:
+        os.environ["BASE_URL"] = base_url
+        os.environ["YELP_CACHE_STALE_WHILE_REVALIDATE"] = "false"
+        reset_settings()
+        run("expire and refetch", duration)
+        os.environ["YELP_CACHE_STALE_WHILE_REVALIDATE"] = "true"
+        reset_settings()
+        run("stale-while-revalidate", duration)
+        set_cache(None)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""
+Compares peak memory of decoding a large response with ``get()`` and with ``stream()``.
+
+Usage::
+
+    python benchmarks/streaming.py [categories]
+"""
+
+import json
+import os
+import sys
+import time
+import tracemalloc
+from typing import Callable
+
+from stub_server import StubHandler, stub_server
+
+from yelpfusion3.category.endpoint import AllCategoriesEndpoint
+
+
+def category(index: int) -> dict:
+    return {
+        "alias": f"category{index}",
+        "title": f"Category {index}",
+        "parent_aliases": ["restaurants"],
+        "country_whitelist": ["US", "CA", "GB"],
+        "country_blacklist": [],
+    }
+
+
+def loaded() -> int:
+    return len(AllCategoriesEndpoint().get().categories)
+
+
+def streamed() -> int:
+    return sum(1 for _ in AllCategoriesEndpoint().stream())
+
+
+def run(name: str, decode: Callable[[], int]) -> None:
+    decode()
+    tracemalloc.start()
+    start: float = time.perf_counter()
+    count: int = decode()
+    elapsed: float = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{name:>8}: {count} categories, peak {peak / 1024:9.1f} KiB, {elapsed * 1000:7.1f} ms")
+
+
+def main() -> None:
+    count: int = int(sys.argv[1]) if len(sys.argv) > 1 else 1500
+    StubHandler.body = json.dumps({"categories": [category(index) for index in range(count)]}).encode()
+    print(f"response body: {len(StubHandler.body) / 1024:.1f} KiB")
+    with stub_server() as base_url:
+        os.environ["BASE_URL"] = base_url
+        run("get", loaded)
+        run("stream", streamed)
+
+
+if __name__ == "__main__":
+    main()
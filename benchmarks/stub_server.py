@@ -0,0 +1,178 @@
+"""
+Tiny local HTTP/1.1 and HTTP/2 servers that answer every GET with a canned Yelp Fusion payload. Used by the benchmarks
+so they can run without an API key or network access.
+"""
+
+import json
+import random
+import socket
+import time
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from threading import Lock, Thread
+from typing import Iterator, List, Tuple
+
+try:
+    import h2.config
+    import h2.connection
+    import h2.events
+except ImportError:  # pragma: no cover
+    h2 = None
+
+BUSINESS_DETAILS: dict = {
+    "id": "WavvLdfdP6g8aZTtbBQHTw",
+    "alias": "gary-danko-san-francisco",
+    "name": "Gary Danko",
+    "image_url": "https://s3-media3.fl.yelpcdn.com/bphoto/eyYUz3Xl7NtcJeN7x7SQwg/o.jpg",
+    "is_claimed": True,
+    "is_closed": False,
+    "url": "https://www.yelp.com/biz/gary-danko-san-francisco",
+    "phone": "+14157492060",
+    "display_phone": "(415) 749-2060",
+    "review_count": 5748,
+    "categories": [{"alias": "newamerican", "title": "American (New)"}],
+    "rating": 4.5,
+    "location": {
+        "address1": "800 N Point St",
+        "city": "San Francisco",
+        "zip_code": "94109",
+        "country": "US",
+        "state": "CA",
+        "display_address": ["800 N Point St", "San Francisco, CA 94109"],
+    },
+    "coordinates": {"latitude": 37.80587, "longitude": -122.42058},
+    "photos": [],
+    "price": "$$$$",
+    "transactions": [],
+}
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    """
+    Request handler that always responds with :py:data:`BUSINESS_DETAILS` over a keep-alive connection. Every response
+    is delayed by ``latency`` seconds, and a ``slow_ratio`` share of them by another ``slow_delay`` seconds to simulate
+    tail latency. New connections are delayed by ``handshake`` seconds to simulate DNS resolution and TLS setup.
+    """
+
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    body: bytes = json.dumps(BUSINESS_DETAILS).encode()
+    connections: int = 0
+    requests: int = 0
+    latency: float = 0.0
+    handshake: float = 0.0
+    slow_ratio: float = 0.0
+    slow_delay: float = 0.0
+
+    def setup(self) -> None:
+        super().setup()
+        StubHandler.connections += 1
+        time.sleep(self.handshake)
+
+    def do_GET(self) -> None:  # pylint: disable=invalid-name
+        StubHandler.requests += 1
+        time.sleep(self.delay())
+        self.do_HEAD()
+        self.wfile.write(self.body)
+
+    def do_HEAD(self) -> None:  # pylint: disable=invalid-name
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(self.body)))
+        self.end_headers()
+
+    def log_message(self, format: str, *args: object) -> None:  # pylint: disable=redefined-builtin
+        pass
+
+    @classmethod
+    def delay(cls) -> float:
+        """
+        :return: Seconds to wait before sending the next response.
+        """
+        return cls.latency + (cls.slow_delay if random.random() < cls.slow_ratio else 0.0)  # nosec B311
+
+
+class H2StubConnection(Thread):
+    """
+    Serves one cleartext HTTP/2 connection (with prior knowledge, as there is no TLS to negotiate it), answering every
+    request like :py:class:`StubHandler`. Streams are answered concurrently, each from its own thread.
+    """
+
+    def __init__(self, sock: socket.socket) -> None:
+        super().__init__(daemon=True)
+        self.sock: socket.socket = sock
+        self.lock: Lock = Lock()
+        self.connection: h2.connection.H2Connection = h2.connection.H2Connection(
+            config=h2.config.H2Configuration(client_side=False)
+        )
+
+    def run(self) -> None:
+        with self.lock:
+            self.connection.initiate_connection()
+            self.sock.sendall(self.connection.data_to_send())
+        with self.sock:
+            while data := self.sock.recv(65535):
+                with self.lock:
+                    for event in self.connection.receive_data(data):
+                        if isinstance(event, h2.events.RequestReceived):
+                            Thread(target=self.respond, args=(event.stream_id,), daemon=True).start()
+                    self.sock.sendall(self.connection.data_to_send())
+
+    def respond(self, stream_id: int) -> None:
+        time.sleep(StubHandler.delay())
+        headers: List[Tuple[str, str]] = [
+            (":status", "200"),
+            ("content-type", "application/json"),
+            ("content-length", str(len(StubHandler.body))),
+        ]
+        with self.lock:
+            self.connection.send_headers(stream_id, headers)
+            self.connection.send_data(stream_id, StubHandler.body, end_stream=True)
+            self.sock.sendall(self.connection.data_to_send())
+
+
+@contextmanager
+def h2_stub_server() -> Iterator[str]:
+    """
+    Runs a cleartext HTTP/2 stub server on a free local port for the duration of the ``with`` block. Accepted
+    connections are counted in ``StubHandler.connections``.
+
+    :return: The base URL of the running server.
+    """
+
+    listener: socket.socket = socket.create_server(("127.0.0.1", 0))
+
+    def accept() -> None:
+        while True:
+            try:
+                sock, _ = listener.accept()
+            except OSError:
+                return
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            StubHandler.connections += 1
+            H2StubConnection(sock).start()
+
+    Thread(target=accept, daemon=True).start()
+    try:
+        yield f"http://127.0.0.1:{listener.getsockname()[1]}/v3"
+    finally:
+        listener.close()
+
+
+@contextmanager
+def stub_server() -> Iterator[str]:
+    """
+    Runs the stub server on a free local port for the duration of the ``with`` block.
+
+    :return: The base URL of the running server.
+    """
+
+    server: ThreadingHTTPServer = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+    server.daemon_threads = True
+    thread: Thread = Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_address[1]}/v3"
+    finally:
+        server.shutdown()
+        server.server_close()
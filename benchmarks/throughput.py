@@ -0,0 +1,49 @@
+"""
+Measures client throughput and parsing cost offline, with the in-memory stub transport in place of the network.
+
+Usage::
+
+    python benchmarks/throughput.py [requests] [threads]
+"""
+
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable
+
+from stub_server import BUSINESS_DETAILS
+
+from yelpfusion3.business.endpoint import BusinessDetailsEndpoint, BusinessSearchEndpoint
+from yelpfusion3.endpoint import Endpoint
+from yelpfusion3.transport import StubTransport, set_transport
+
+SEARCH: dict = {
+    "businesses": [{**BUSINESS_DETAILS, "id": f"business-{index}", "distance": 120.5} for index in range(50)],
+    "total": 50,
+    "region": {"center": {"latitude": 37.8, "longitude": -122.4}},
+}
+
+
+def run(name: str, endpoint: Endpoint, call: Callable[[Endpoint], object], count: int, threads: int) -> None:
+    start: float = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        list(executor.map(lambda _: call(endpoint), range(count)))
+    elapsed: float = time.perf_counter() - start
+    print(f"{name:>24}: {count / elapsed:9.1f} req/s, {elapsed / count * threads * 1e6:9.1f} µs per request")
+
+
+def main() -> None:
+    count: int = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    threads: int = int(sys.argv[2]) if len(sys.argv) > 2 else 4
+    os.environ["YELP_COALESCE_REQUESTS"] = "false"
+    set_transport(StubTransport(routes={"/businesses/search": SEARCH, "/businesses/*": BUSINESS_DETAILS}))
+    details: BusinessDetailsEndpoint = BusinessDetailsEndpoint(business_id="WavvLdfdP6g8aZTtbBQHTw")
+    search: BusinessSearchEndpoint = BusinessSearchEndpoint(location="San Francisco")
+    run("business details get()", details, lambda endpoint: endpoint.get(), count, threads)
+    run("business search get()", search, lambda endpoint: endpoint.get(), count // 10, threads)
+    run("business search stream()", search, lambda endpoint: list(endpoint.stream()), count // 10, threads)
+
+
+if __name__ == "__main__":
+    main()
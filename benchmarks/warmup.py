@@ -0,0 +1,68 @@
+"""
+Measures the latency of the first concurrent requests made by a fresh worker process, with and without
+:py:meth:`~yelpfusion3.client.Client.warmup` at startup. The stub server delays every new connection to simulate DNS
+resolution and the TLS handshake, which the local server does not otherwise pay for.
+
+Usage::
+
+    python benchmarks/warmup.py [threads] [handshake]
+"""
+
+import os
+import subprocess  # nosec B404
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import List
+
+from stub_server import StubHandler, stub_server
+
+
+def worker(warm: bool, threads: int) -> None:
+    """
+    Runs in a fresh process: optionally warms up, then times one round of concurrent first requests.
+    """
+
+    from yelpfusion3.client import Client  # pylint: disable=import-outside-toplevel
+
+    if warm:
+        Client.warmup(connections=threads)
+
+    def first(index: int) -> float:
+        start: float = time.perf_counter()
+        Client.business_details(business_id=f"business-{index}").get()
+        return time.perf_counter() - start
+
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        latencies: List[float] = sorted(executor.map(first, range(threads)))
+    print(f"p50 {latencies[len(latencies) // 2] * 1000:6.1f} ms, max {latencies[-1] * 1000:6.1f} ms")
+
+
+def main() -> None:
+    threads: int = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    StubHandler.handshake = float(sys.argv[2]) if len(sys.argv) > 2 else 0.05
+    StubHandler.latency = 0.005
+    with stub_server() as base_url:
+        environment: dict = {
+            **os.environ,
+            "BASE_URL": base_url,
+            "YELP_POOL_MAXSIZE": str(threads),
+            "YELP_COALESCE_REQUESTS": "false",
+        }
+        for warm in (False, True):
+            StubHandler.connections = 0
+            output: str = subprocess.run(  # nosec B603
+                [sys.executable, __file__, "--worker", str(int(warm)), str(threads)],
+                env=environment,
+                check=True,
+                capture_output=True,
+                text=True,
+            ).stdout.strip()
+            print(f"{'warm' if warm else 'cold'} first requests: {output}, {StubHandler.connections} connections")
+
+
+if __name__ == "__main__":
+    if sys.argv[1:2] == ["--worker"]:
+        worker(warm=sys.argv[2] == "1", threads=int(sys.argv[3]))
+    else:
+        main()
@@ -0,0 +1,191 @@
+"""
+Bounded, concurrent fan-out of many endpoint requests.
+"""
+
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from contextvars import copy_context
+from dataclasses import dataclass, field
+from functools import partial
+from statistics import mean
+from threading import Lock
+from typing import Deque, Iterable, Iterator, List, Optional, Tuple
+
+from yelpfusion3.endpoint import Endpoint
+from yelpfusion3.model import Model
+
+
+@dataclass(frozen=True)
+class BatchResult:
+    """
+    The outcome of a single endpoint request within a :py:class:`Batch`.
+    """
+
+    index: int
+    """
+    Position of the endpoint in the iterable passed to the batch.
+    """
+
+    endpoint: Endpoint
+    """
+    The endpoint that was requested.
+    """
+
+    result: Optional[Model] = None
+    """
+    The parsed response, or ``None`` if the request failed.
+    """
+
+    error: Optional[BaseException] = None
+    """
+    The exception raised by the request, or ``None`` if it succeeded.
+    """
+
+    latency: float = 0.0
+    """
+    Wall-clock duration of the request in seconds.
+    """
+
+    @property
+    def ok(self) -> bool:
+        """
+        :return: ``True`` if the request succeeded.
+        :rtype: bool
+        """
+        return self.error is None
+
+
+@dataclass
+class BatchStats:
+    """
+    Throughput and latency statistics for a :py:class:`Batch`. Values are updated as results are yielded.
+    """
+
+    succeeded: int = 0
+    failed: int = 0
+    elapsed: float = 0.0
+    latencies: List[float] = field(default_factory=list, repr=False)
+
+    @property
+    def completed(self) -> int:
+        """
+        :return: Number of requests that finished, successfully or not.
+        :rtype: int
+        """
+        return self.succeeded + self.failed
+
+    @property
+    def throughput(self) -> float:
+        """
+        :return: Completed requests per second of wall-clock time.
+        :rtype: float
+        """
+        return self.completed / self.elapsed if self.elapsed else 0.0
+
+    @property
+    def mean_latency(self) -> float:
+        """
+        :return: Mean request latency in seconds.
+        :rtype: float
+        """
+        return mean(self.latencies) if self.latencies else 0.0
+
+    def percentile(self, percent: float) -> float:
+        """
+        Returns the request latency at the given percentile, using the nearest-rank method.
+
+        :param percent: Percentile between 0 and 100, like ``99`` for p99.
+        :type percent: float
+        :return: Latency in seconds.
+        :rtype: float
+        """
+
+        if not self.latencies:
+            return 0.0
+        ordered: List[float] = sorted(self.latencies)
+        rank: int = max(0, min(len(ordered) - 1, round(percent / 100 * len(ordered)) - 1))
+        return ordered[rank]
+
+
+class Batch:
+    """
+    Resolves many endpoints on a bounded pool of worker threads. Iterate over the batch to receive a
+    :py:class:`BatchResult` per endpoint, either in input order or as requests complete. A failed request is reported
+    on its result instead of aborting the batch.
+
+    At most ``max_workers * 2`` requests are queued at any time, so arbitrarily large (or lazy) iterables of endpoints
+    can be processed with bounded memory. Each request runs in a copy of the context active when the batch is
+    iterated, so a surrounding :py:func:`~yelpfusion3.timeout.deadline` applies to every request of the batch.
+    """
+
+    def __init__(self, endpoints: Iterable[Endpoint], max_workers: int = 8, ordered: bool = True) -> None:
+        """
+        :param endpoints: The endpoints to request.
+        :type endpoints: Iterable[Endpoint]
+        :param max_workers: Maximum number of concurrent requests.
+        :type max_workers: int
+        :param ordered: Yield results in input order when ``True``, or as soon as they complete when ``False``.
+        :type ordered: bool
+        """
+
+        if max_workers < 1:
+            raise ValueError("'max_workers' must be at least 1.")
+        self._endpoints: Iterable[Endpoint] = endpoints
+        self._max_workers: int = max_workers
+        self._ordered: bool = ordered
+        self._lock: Lock = Lock()
+        self.stats: BatchStats = BatchStats()
+
+    def __iter__(self) -> Iterator[BatchResult]:
+        start: float = time.perf_counter()
+        pending: Deque[Future[BatchResult]] = deque()
+        endpoints: Iterator[Tuple[int, Endpoint]] = enumerate(self._endpoints)
+
+        with ThreadPoolExecutor(max_workers=self._max_workers, thread_name_prefix="yelpfusion3-batch") as executor:
+            self._submit(executor, endpoints, pending)
+            while pending:
+                for future in self._next_done(pending):
+                    result: BatchResult = future.result()
+                    self._record(result, start)
+                    yield result
+                self._submit(executor, endpoints, pending)
+
+    def _submit(
+        self,
+        executor: ThreadPoolExecutor,
+        endpoints: Iterator[Tuple[int, Endpoint]],
+        pending: Deque[Future[BatchResult]],
+    ) -> None:
+        while len(pending) < self._max_workers * 2:
+            item: Optional[Tuple[int, Endpoint]] = next(endpoints, None)
+            if item is None:
+                return
+            pending.append(executor.submit(partial(copy_context().run, self._resolve, *item)))
+
+    def _next_done(self, pending: Deque[Future[BatchResult]]) -> List[Future[BatchResult]]:
+        if self._ordered:
+            return [pending.popleft()]
+        done, _ = wait(pending, return_when=FIRST_COMPLETED)
+        for future in done:
+            pending.remove(future)
+        return list(done)
+
+    def _record(self, result: BatchResult, start: float) -> None:
+        with self._lock:
+            if result.ok:
+                self.stats.succeeded += 1
+            else:
+                self.stats.failed += 1
+            self.stats.latencies.append(result.latency)
+            self.stats.elapsed = time.perf_counter() - start
+
+    @staticmethod
+    def _resolve(index: int, endpoint: Endpoint) -> BatchResult:
+        start: float = time.perf_counter()
+        try:
+            return BatchResult(
+                index=index, endpoint=endpoint, result=endpoint.get(), latency=time.perf_counter() - start
+            )
+        except Exception as error:  # pylint: disable=broad-except
+            return BatchResult(index=index, endpoint=endpoint, error=error, latency=time.perf_counter() - start)
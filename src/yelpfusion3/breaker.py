@@ -0,0 +1,299 @@
+"""
+Per-endpoint circuit breakers that fail fast while Yelp Fusion is degraded.
+"""
+
+import asyncio
+import time
+from collections import deque
+from enum import Enum
+from threading import Lock
+from typing import Awaitable, Callable, Deque, Dict, Optional, Tuple, Type, TypeVar
+
+import requests
+import urllib3
+
+from yelpfusion3.exceptions import CircuitOpenError, DeadlineExceededError
+from yelpfusion3.settings import Settings, get_settings
+from yelpfusion3.timeout import remaining
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover
+    httpx = None
+
+ResponseT = TypeVar("ResponseT")
+
+_TIMEOUT_ERRORS: Tuple[Type[BaseException], ...] = (requests.Timeout, urllib3.exceptions.TimeoutError) + (
+    (httpx.TimeoutException,) if httpx else ()
+)
+
+
+class CircuitState(str, Enum):
+    """
+    States of a :py:class:`CircuitBreaker`.
+    """
+
+    CLOSED = "closed"
+    """
+    Requests flow normally while outcomes are recorded.
+    """
+
+    OPEN = "open"
+    """
+    Requests fail immediately with :py:class:`~yelpfusion3.exceptions.CircuitOpenError`.
+    """
+
+    HALF_OPEN = "half_open"
+    """
+    A single probe request is let through to decide whether to close or re-open the circuit.
+    """
+
+
+class CircuitBreaker:
+    """
+    Tracks the outcome of the most recent requests to one endpoint path and opens when too many of them failed or were
+    slow. A request fails when it raises an exception or receives a 5xx status code, and is slow when it takes longer
+    than ``slow_call_duration`` seconds. Requests that are cancelled or that exceed the caller's deadline, including
+    timeouts shortened to fit the deadline, are not recorded.
+
+    Once ``minimum_calls`` outcomes are recorded within the ``window_size`` most recent ones, the circuit opens if the
+    failure rate reaches ``failure_rate_threshold`` or the slow call rate reaches ``slow_call_rate_threshold``. After
+    ``open_duration`` seconds it turns half-open and lets one probe request through: the circuit closes if the probe
+    succeeds quickly, and opens again otherwise.
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        path: str,
+        failure_rate_threshold: float = 0.5,
+        slow_call_duration: float = 10.0,
+        slow_call_rate_threshold: float = 0.8,
+        window_size: int = 20,
+        minimum_calls: int = 10,
+        open_duration: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if not 0 < failure_rate_threshold <= 1 or not 0 < slow_call_rate_threshold <= 1:
+            raise ValueError("Rate thresholds must be greater than 0 and at most 1.")
+        if not 1 <= minimum_calls <= window_size:
+            raise ValueError("'minimum_calls' must be between 1 and 'window_size'.")
+
+        self.path: str = path
+        self.failure_rate_threshold: float = failure_rate_threshold
+        self.slow_call_duration: float = slow_call_duration
+        self.slow_call_rate_threshold: float = slow_call_rate_threshold
+        self.minimum_calls: int = minimum_calls
+        self.open_duration: float = open_duration
+        self._clock: Callable[[], float] = clock
+        self._lock: Lock = Lock()
+        self._outcomes: Deque[Tuple[bool, bool]] = deque(maxlen=window_size)
+        self._state: CircuitState = CircuitState.CLOSED
+        self._opened_at: float = 0.0
+        self._probing: bool = False
+
+    @property
+    def state(self) -> CircuitState:
+        """
+        :return: The current state of the circuit.
+        :rtype: CircuitState
+        """
+        with self._lock:
+            return self._current_state()
+
+    @property
+    def failure_rate(self) -> float:
+        """
+        :return: Share of failed requests among the recorded outcomes.
+        :rtype: float
+        """
+        with self._lock:
+            return sum(failed for failed, _ in self._outcomes) / len(self._outcomes) if self._outcomes else 0.0
+
+    @property
+    def slow_call_rate(self) -> float:
+        """
+        :return: Share of slow requests among the recorded outcomes.
+        :rtype: float
+        """
+        with self._lock:
+            return sum(slow for _, slow in self._outcomes) / len(self._outcomes) if self._outcomes else 0.0
+
+    def before_call(self) -> None:
+        """
+        Admits a request, or rejects it while the circuit is open or a half-open probe is already in flight.
+
+        :raise CircuitOpenError: If the request must not be sent.
+        """
+
+        with self._lock:
+            state: CircuitState = self._current_state()
+            if state is CircuitState.CLOSED:
+                return
+            if state is CircuitState.HALF_OPEN and not self._probing:
+                self._probing = True
+                return
+            raise CircuitOpenError(path=self.path, retry_after=self._retry_after())
+
+    def record(self, failed: bool, duration: float) -> None:
+        """
+        Records the outcome of an admitted request.
+
+        :param failed: Whether the request failed.
+        :type failed: bool
+        :param duration: How long the request took, in seconds.
+        :type duration: float
+        """
+
+        slow: bool = duration > self.slow_call_duration
+        with self._lock:
+            if self._probing:
+                self._probing = False
+                self._outcomes.clear()
+                self._transition(CircuitState.OPEN if failed or slow else CircuitState.CLOSED)
+                return
+            self._outcomes.append((failed, slow))
+            if self._tripped():
+                self._transition(CircuitState.OPEN)
+
+    def call(self, send: Callable[[], ResponseT]) -> ResponseT:
+        """
+        Sends a request through the circuit and records its outcome.
+
+        :param send: Performs a single HTTP request.
+        :raise CircuitOpenError: If the circuit is open.
+        :return: The response returned by ``send``.
+        """
+
+        self.before_call()
+        start: float = self._clock()
+        try:
+            response: ResponseT = send()
+        except (asyncio.CancelledError, DeadlineExceededError):
+            self._abandon()
+            raise
+        except BaseException as error:
+            self._fail(error, self._clock() - start)
+            raise
+        self.record(failed=response.status_code >= 500, duration=self._clock() - start)  # type: ignore[attr-defined]
+        return response
+
+    async def acall(self, send: Callable[[], Awaitable[ResponseT]]) -> ResponseT:
+        """
+        Awaits a request through the circuit and records its outcome.
+
+        :param send: Performs a single HTTP request.
+        :raise CircuitOpenError: If the circuit is open.
+        :return: The response returned by ``send``.
+        """
+
+        self.before_call()
+        start: float = self._clock()
+        try:
+            response: ResponseT = await send()
+        except (asyncio.CancelledError, DeadlineExceededError):
+            self._abandon()
+            raise
+        except BaseException as error:
+            self._fail(error, self._clock() - start)
+            raise
+        self.record(failed=response.status_code >= 500, duration=self._clock() - start)  # type: ignore[attr-defined]
+        return response
+
+    def reset(self) -> None:
+        """
+        Closes the circuit and forgets all recorded outcomes.
+        """
+
+        with self._lock:
+            self._outcomes.clear()
+            self._probing = False
+            self._state = CircuitState.CLOSED
+
+    def _abandon(self) -> None:
+        # Requests cancelled by the caller or stopped by its deadline say nothing about the health of the endpoint, so
+        # they are not recorded, but an abandoned probe makes way for the next one.
+        with self._lock:
+            self._probing = False
+
+    def _fail(self, error: BaseException, duration: float) -> None:
+        # A timeout that fires once the deadline has passed was shortened to the time left before the deadline, so it
+        # is abandoned like a DeadlineExceededError rather than blamed on the endpoint.
+        seconds: Optional[float] = remaining()
+        if isinstance(error, _TIMEOUT_ERRORS) and seconds is not None and seconds <= 0:
+            self._abandon()
+        else:
+            self.record(failed=True, duration=duration)
+
+    def _current_state(self) -> CircuitState:
+        if self._state is CircuitState.OPEN and self._retry_after() <= 0:
+            self._state = CircuitState.HALF_OPEN
+        return self._state
+
+    def _retry_after(self) -> float:
+        return max(0.0, self._opened_at + self.open_duration - self._clock())
+
+    def _tripped(self) -> bool:
+        calls: int = len(self._outcomes)
+        if calls < self.minimum_calls:
+            return False
+        failures: int = sum(failed for failed, _ in self._outcomes)
+        slow_calls: int = sum(slow for _, slow in self._outcomes)
+        return failures / calls >= self.failure_rate_threshold or slow_calls / calls >= self.slow_call_rate_threshold
+
+    def _transition(self, state: CircuitState) -> None:
+        self._state = state
+        if state is CircuitState.OPEN:
+            self._opened_at = self._clock()
+
+
+_lock: Lock = Lock()
+_circuit_breakers: Dict[str, CircuitBreaker] = {}
+
+
+def get_circuit_breaker(path: str) -> CircuitBreaker:
+    """
+    Returns the circuit breaker guarding an endpoint path, creating it from the ``breaker_*`` settings on first use.
+
+    :param path: Endpoint path, like ``/businesses/search`` or ``/businesses/{business_id}/reviews``.
+    :type path: str
+    :return: The circuit breaker for ``path``.
+    :rtype: CircuitBreaker
+    """
+
+    circuit_breaker: Optional[CircuitBreaker] = _circuit_breakers.get(path)
+    if circuit_breaker is None:
+        with _lock:
+            circuit_breaker = _circuit_breakers.get(path)
+            if circuit_breaker is None:
+                settings: Settings = get_settings()
+                circuit_breaker = _circuit_breakers[path] = CircuitBreaker(
+                    path=path,
+                    failure_rate_threshold=settings.breaker_failure_rate,
+                    slow_call_duration=settings.breaker_slow_call_duration,
+                    slow_call_rate_threshold=settings.breaker_slow_call_rate,
+                    window_size=settings.breaker_window_size,
+                    minimum_calls=settings.breaker_minimum_calls,
+                    open_duration=settings.breaker_open_duration,
+                )
+    return circuit_breaker
+
+
+def circuit_breakers() -> Dict[str, CircuitBreaker]:
+    """
+    Returns every circuit breaker created so far, keyed by endpoint path, so their state can be inspected.
+
+    :return: A snapshot of the circuit breaker registry.
+    :rtype: Dict[str, CircuitBreaker]
+    """
+
+    with _lock:
+        return dict(_circuit_breakers)
+
+
+def reset_circuit_breakers() -> None:
+    """
+    Discards every circuit breaker. New breakers are created from the current settings on next use.
+    """
+
+    with _lock:
+        _circuit_breakers.clear()
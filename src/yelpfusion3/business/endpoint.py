@@ -2,16 +2,17 @@
 Abstractions for Yelp Fusion business endpoints.
 """
 
-from typing import List, Literal, Optional
+from typing import AsyncIterator, Iterator, List, Literal, Optional
 from urllib.parse import urlencode
 
 import pycountry
 import validators
 from pydantic import confloat, conint, constr, validator
-from requests import Response
 
+from yelpfusion3.business.identity import BusinessIdentityMap, get_business_identity_map
 from yelpfusion3.business.model import (
     Autocomplete,
+    Business,
     BusinessDetails,
     BusinessMatches,
     BusinessSearch,
@@ -20,7 +21,9 @@ from yelpfusion3.business.model import (
     TransactionSearch,
 )
 from yelpfusion3.endpoint import Endpoint
-from yelpfusion3.settings import Settings
+from yelpfusion3.model import Model
+from yelpfusion3.settings import Settings, get_settings
+from yelpfusion3.timeout import Timeout
 
 
 class BusinessDetailsEndpoint(Endpoint):
@@ -37,6 +40,12 @@ class BusinessDetailsEndpoint(Endpoint):
 
     _path: str = "/businesses"
 
+    _cache_ttl: Optional[float] = 3600.0
+
+    _cache_max_stale: Optional[float] = 86400.0
+
+    _negative_ttl: Optional[float] = 600.0
+
     business_id: constr(regex=r"^[A-Za-z0-9\-]+$")
     """
     Unique Yelp ID of the business to query for.
@@ -60,15 +69,17 @@ class BusinessDetailsEndpoint(Endpoint):
             key: value for key, value in self.dict().items() if value is not None and key != "business_id"
         }
         parameters = urlencode(query=non_none_fields)
-        settings: Settings = Settings()
+        settings: Settings = get_settings()
         if parameters:
             return f"{settings.base_url}{self._path}/{self.business_id}?{parameters}"
 
         return f"{settings.base_url}{self._path}/{self.business_id}"
 
     def get(self) -> BusinessDetails:
-        response: Response = self._get()
-        return BusinessDetails(**response.json())
+        return self._fetch(BusinessDetails)
+
+    async def aget(self) -> BusinessDetails:
+        return await self._afetch(BusinessDetails)
 
 
 class BusinessMatchesEndpoint(Endpoint):
@@ -82,6 +93,10 @@ class BusinessMatchesEndpoint(Endpoint):
 
     _path: str = "/businesses/matches"
 
+    _cache_ttl: Optional[float] = 3600.0
+
+    _negative_ttl: Optional[float] = 600.0
+
     name: constr(min_length=1, max_length=64, regex=r"^[\da-zA-Z\s\!#$%&+,./:?@']+$")
     """
     Required. The name of the business. Maximum length is 64; only digits, letters, spaces, and ``!#$%&+,./:?@'``
@@ -167,8 +182,16 @@ class BusinessMatchesEndpoint(Endpoint):
     """
 
     def get(self) -> BusinessMatches:
-        response: Response = self._get()
-        return BusinessMatches(**response.json())
+        return self._fetch(BusinessMatches)
+
+    async def aget(self) -> BusinessMatches:
+        return await self._afetch(BusinessMatches)
+
+    def _received(self, result: Model) -> None:
+        _intern(result)
+
+    def _is_negative(self, result: Model) -> bool:
+        return isinstance(result, BusinessMatches) and not result.businesses
 
     @validator("country")
     def check_country(cls, value: str) -> str:  # pylint: disable=E0213
@@ -199,6 +222,10 @@ class BusinessSearchEndpoint(Endpoint):
 
     _path: str = "/businesses/search"
 
+    _canonical_cache_key: bool = True
+
+    _timeout: Timeout = Timeout(read=30.0)
+
     term: Optional[constr(min_length=1)]
     """
     Optional. Search term, for example ``food`` or ``restaurants``. The term may also be business names, such as
@@ -310,8 +337,32 @@ class BusinessSearchEndpoint(Endpoint):
     """
 
     def get(self) -> BusinessSearch:
-        response: Response = self._get()
-        return BusinessSearch(**response.json())
+        return self._fetch(BusinessSearch)
+
+    async def aget(self) -> BusinessSearch:
+        return await self._afetch(BusinessSearch)
+
+    def _received(self, result: Model) -> None:
+        _intern(result)
+
+    def stream(self) -> Iterator[Business]:
+        """
+        Performs a GET request to the endpoint and yields the ``businesses`` of the response one at a time, as they are
+        read from the connection, without holding the whole response in memory.
+
+        :return: The businesses found.
+        :rtype: Iterator[Business]
+        """
+        return self._stream("businesses", Business)
+
+    def astream(self) -> AsyncIterator[Business]:
+        """
+        Asynchronous counterpart of :py:meth:`stream`.
+
+        :return: The businesses found.
+        :rtype: AsyncIterator[Business]
+        """
+        return self._astream("businesses", Business)
 
     @validator("price")
     def _check_price(cls, value: str) -> str:  # pylint: disable=E0213
@@ -353,6 +404,10 @@ class PhoneSearchEndpoint(Endpoint):
 
     _path: str = "/businesses/search/phone"
 
+    _cache_ttl: Optional[float] = 3600.0
+
+    _negative_ttl: Optional[float] = 600.0
+
     phone: constr(min_length=12, regex=r"^\+\d+")
     """
     Required. Phone number of the business you want to search for. It must start with + and include the country code,
@@ -366,8 +421,16 @@ class PhoneSearchEndpoint(Endpoint):
     """
 
     def get(self) -> PhoneSearch:
-        response: Response = self._get()
-        return PhoneSearch(**response.json())
+        return self._fetch(PhoneSearch)
+
+    async def aget(self) -> PhoneSearch:
+        return await self._afetch(PhoneSearch)
+
+    def _received(self, result: Model) -> None:
+        _intern(result)
+
+    def _is_negative(self, result: Model) -> bool:
+        return isinstance(result, PhoneSearch) and not result.businesses
 
 
 class ReviewsEndpoint(Endpoint):
@@ -379,6 +442,8 @@ class ReviewsEndpoint(Endpoint):
 
     _path: str = "/businesses/{business_id}/reviews"
 
+    _cache_ttl: Optional[float] = 3600.0
+
     business_id: constr(min_length=1, regex=r"^[A-Za-z0-9\-]+$")
     """
     Unique Yelp ID of the business to query for.
@@ -402,7 +467,7 @@ class ReviewsEndpoint(Endpoint):
             key: value for key, value in self.dict().items() if value is not None and key != "business_id"
         }
         parameters = urlencode(query=non_none_fields)
-        settings: Settings = Settings()
+        settings: Settings = get_settings()
         path: str = self._path.format(business_id=self.business_id)
 
         if parameters:
@@ -411,8 +476,10 @@ class ReviewsEndpoint(Endpoint):
         return f"{settings.base_url}{path}"
 
     def get(self) -> Reviews:
-        response: Response = self._get()
-        return Reviews(**response.json())
+        return self._fetch(Reviews)
+
+    async def aget(self) -> Reviews:
+        return await self._afetch(Reviews)
 
 
 class TransactionSearchEndpoint(Endpoint):
@@ -424,6 +491,8 @@ class TransactionSearchEndpoint(Endpoint):
 
     _path = "/transactions/delivery/search"
 
+    _canonical_cache_key: bool = True
+
     latitude: Optional[confloat(ge=-90.0, le=90.0)]
     """
     Required when ``location`` isn't provided. Latitude of the location you want to deliver to.
@@ -440,8 +509,32 @@ class TransactionSearchEndpoint(Endpoint):
     """
 
     def get(self) -> TransactionSearch:
-        response: Response = self._get()
-        return TransactionSearch(**response.json())
+        return self._fetch(TransactionSearch)
+
+    async def aget(self) -> TransactionSearch:
+        return await self._afetch(TransactionSearch)
+
+    def _received(self, result: Model) -> None:
+        _intern(result)
+
+    def stream(self) -> Iterator[Business]:
+        """
+        Performs a GET request to the endpoint and yields the ``businesses`` of the response one at a time, as they are
+        read from the connection, without holding the whole response in memory.
+
+        :return: The businesses found.
+        :rtype: Iterator[Business]
+        """
+        return self._stream("businesses", Business)
+
+    def astream(self) -> AsyncIterator[Business]:
+        """
+        Asynchronous counterpart of :py:meth:`stream`.
+
+        :return: The businesses found.
+        :rtype: AsyncIterator[Business]
+        """
+        return self._astream("businesses", Business)
 
 
 class AutocompleteEndpoint(Endpoint):
@@ -452,6 +545,8 @@ class AutocompleteEndpoint(Endpoint):
 
     _path = "/autocomplete"
 
+    _timeout: Timeout = Timeout(connect=0.5, read=1.0)
+
     text: constr(min_length=1)
     """
     Required. Text to return autocomplete suggestions for.
@@ -476,5 +571,22 @@ class AutocompleteEndpoint(Endpoint):
     """
 
     def get(self) -> Autocomplete:
-        response: Response = self._get()
-        return Autocomplete(**response.json())
+        return self._fetch(Autocomplete)
+
+    async def aget(self) -> Autocomplete:
+        return await self._afetch(Autocomplete)
+
+
+def _intern(result: Model) -> None:
+    """
+    Replaces the businesses of a response with their shared records when there is a business identity map, and keeps
+    their distances in the response. See :py:mod:`yelpfusion3.business.identity`.
+    """
+
+    identity_map: Optional[BusinessIdentityMap] = get_business_identity_map()
+    if identity_map is None:
+        return
+    if isinstance(result, BusinessMatches):
+        identity_map.intern_all(result.businesses)
+    elif isinstance(result, (BusinessSearch, PhoneSearch, TransactionSearch)):
+        result.distances = identity_map.intern_all(result.businesses)
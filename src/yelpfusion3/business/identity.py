@@ -0,0 +1,201 @@
+"""
+An identity map that keeps one shared record per business across responses.
+
+Business searches, phone searches, transaction searches and business matches return the same businesses again and again
+over a crawl, each response with its own copy. When the ``business_identity_map`` setting is enabled, those endpoints
+replace each business of the responses they receive with the record the identity map holds for its ID, so that a
+business seen in many responses is held in memory once. The distance of a business from the search location depends on
+the request, so it is not part of the shared record: responses keep it in their ``distances`` instead.
+"""
+
+import time
+from collections import OrderedDict
+from threading import Lock
+from typing import Callable, List, Optional, Tuple, Type, TypeVar, Union, cast
+
+from yelpfusion3.business.model import Business, BusinessMatch
+from yelpfusion3.settings import Settings, get_settings
+
+BusinessT = TypeVar("BusinessT", Business, BusinessMatch)
+
+
+class BusinessIdentityMap:
+    """
+    Shared :py:class:`~yelpfusion3.business.model.Business` and :py:class:`~yelpfusion3.business.model.BusinessMatch`
+    records by business ID, with when each was last seen. Beyond ``max_entries`` records, the least recently seen ones
+    are evicted.
+
+    A business seen again is merged into its record: the fields of the new appearance replace those of the record, and
+    fields missing from it keep the value of earlier appearances. Records are shared by every response they appear in,
+    so they should not be modified. Records hold no ``distance``, which depends on the request: :py:meth:`intern_all`
+    returns the distances of the businesses it replaces.
+    """
+
+    def __init__(self, max_entries: int = 100_000, clock: Callable[[], float] = time.time) -> None:
+        """
+        :param max_entries: Maximum number of records kept.
+        :type max_entries: int
+        :param clock: Returns the current time, in seconds since the epoch.
+        :raise ValueError: If ``max_entries`` is not positive.
+        """
+
+        if max_entries < 1:
+            raise ValueError("'max_entries' must be positive.")
+        self.max_entries: int = max_entries
+        self._clock: Callable[[], float] = clock
+        self._lock: Lock = Lock()
+        # The record of each business and when it was last seen, least recently seen first.
+        self._records: "OrderedDict[Tuple[type, str], Tuple[Union[Business, BusinessMatch], float]]" = OrderedDict()
+        self._evictions: int = 0
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    @property
+    def evictions(self) -> int:
+        """
+        :return: Number of records evicted to stay within ``max_entries``.
+        :rtype: int
+        """
+        return self._evictions
+
+    def intern(self, business: BusinessT) -> BusinessT:
+        """
+        Returns the record of a business, after merging ``business`` into it, or makes ``business`` the record of a
+        business seen for the first time. The distance of ``business``, if any, is dropped.
+
+        :param business: A business from a response.
+        :type business: Union[Business, BusinessMatch]
+        :return: The shared record of the business.
+        :rtype: Union[Business, BusinessMatch]
+        """
+
+        key: Tuple[type, str] = (type(business), business.id)
+        _take_distance(business)
+        now: float = self._clock()
+        with self._lock:
+            found: Optional[Tuple[Union[Business, BusinessMatch], float]] = self._records.get(key)
+            # Records are keyed by model, so the record found is an instance of the model of ``business``.
+            record: BusinessT = business if found is None else cast(BusinessT, found[0])
+            if record is not business:
+                _merge(record, business)
+            self._records[key] = (record, now)
+            self._records.move_to_end(key)
+            while len(self._records) > self.max_entries:
+                self._records.popitem(last=False)
+                self._evictions += 1
+        return record
+
+    def intern_all(self, businesses: List[BusinessT]) -> List[Optional[float]]:
+        """
+        Replaces each business of a response, in place, with its shared record.
+
+        :param businesses: The businesses of a response.
+        :type businesses: List[Union[Business, BusinessMatch]]
+        :return: The distance of each business from the search location, in the order of ``businesses``, or ``None``
+            for businesses without one.
+        :rtype: List[Optional[float]]
+        """
+
+        distances: List[Optional[float]] = [_take_distance(business) for business in businesses]
+        businesses[:] = [self.intern(business) for business in businesses]
+        return distances
+
+    def get(
+        self, business_id: str, model: Type[Union[Business, BusinessMatch]] = Business
+    ) -> Optional[Union[Business, BusinessMatch]]:
+        """
+        :param business_id: Yelp ID of the business.
+        :type business_id: str
+        :param model: :py:class:`~yelpfusion3.business.model.Business` or
+            :py:class:`~yelpfusion3.business.model.BusinessMatch`, which are recorded separately.
+        :type model: Type[Union[Business, BusinessMatch]]
+        :return: The record of the business, if it is held.
+        :rtype: Optional[Union[Business, BusinessMatch]]
+        """
+
+        found: Optional[Tuple[Union[Business, BusinessMatch], float]] = self._records.get((model, business_id))
+        return found[0] if found is not None else None
+
+    def last_seen(self, business_id: str, model: Type[Union[Business, BusinessMatch]] = Business) -> Optional[float]:
+        """
+        :param business_id: Yelp ID of the business.
+        :type business_id: str
+        :param model: :py:class:`~yelpfusion3.business.model.Business` or
+            :py:class:`~yelpfusion3.business.model.BusinessMatch`, which are recorded separately.
+        :type model: Type[Union[Business, BusinessMatch]]
+        :return: When the business last appeared in a response, in seconds since the epoch, if it is held.
+        :rtype: Optional[float]
+        """
+
+        found: Optional[Tuple[Union[Business, BusinessMatch], float]] = self._records.get((model, business_id))
+        return found[1] if found is not None else None
+
+    def clear(self) -> None:
+        """
+        Removes every record.
+        """
+
+        with self._lock:
+            self._records.clear()
+
+
+def _take_distance(business: Union[Business, BusinessMatch]) -> Optional[float]:
+    # Removes the distance from a business about to become, or be merged into, a shared record.
+    if not isinstance(business, Business):
+        return None
+    distance: Optional[float] = business.distance
+    business.__dict__["distance"] = None
+    business.__fields_set__.discard("distance")
+    return distance
+
+
+def _merge(record: BusinessT, business: BusinessT) -> None:
+    values: dict = {name: business.__dict__[name] for name in business.__fields_set__}
+    # Both are instances of the same model, so the values are already validated and can be copied as they are.
+    record.__dict__.update((name, value) for name, value in values.items() if value is not None)
+    record.__fields_set__.update(values)
+
+
+_lock: Lock = Lock()
+_identity_map: Optional[BusinessIdentityMap] = None
+_configured: bool = False
+
+
+def get_business_identity_map() -> Optional[BusinessIdentityMap]:
+    """
+    Returns the identity map that the business search, phone search, transaction search and business matches endpoints
+    intern the businesses of their responses into. Unless replaced with :py:func:`set_business_identity_map`, it is
+    created on first use from the ``business_identity_map`` settings, and businesses are not interned when that is not
+    enabled.
+
+    :return: The shared identity map, if any.
+    :rtype: Optional[BusinessIdentityMap]
+    """
+
+    global _identity_map, _configured  # pylint: disable=global-statement
+    if not _configured:
+        with _lock:
+            if not _configured:
+                settings: Settings = get_settings()
+                _identity_map = (
+                    BusinessIdentityMap(max_entries=settings.business_identity_map_size)
+                    if settings.business_identity_map
+                    else None
+                )
+                _configured = True
+    return _identity_map
+
+
+def set_business_identity_map(identity_map: Optional[BusinessIdentityMap]) -> None:
+    """
+    Replaces the identity map. Pass ``None`` to recreate it from settings on next use.
+
+    :param identity_map: The identity map to use.
+    :type identity_map: BusinessIdentityMap
+    """
+
+    global _identity_map, _configured  # pylint: disable=global-statement
+    with _lock:
+        _identity_map = identity_map
+        _configured = identity_map is not None
@@ -65,7 +65,8 @@ class Business(Model):
 
     distance: Optional[float] = None
     """
-    Distance in meters from the search location. This returns meters regardless of the locale.
+    Distance in meters from the search location. This returns meters regardless of the locale. ``None`` when the
+    ``business_identity_map`` setting is enabled, which keeps it in the ``distances`` of the response instead.
     """
 
     id: constr(min_length=1)
@@ -504,6 +505,12 @@ class BusinessSearch(Model):
     List of business Yelp finds based on the search criteria.
     """
 
+    distances: Optional[List[Optional[float]]] = None
+    """
+    Distance in meters from the search location of each business, in the order of :py:attr:`businesses`, when the
+    ``business_identity_map`` setting moves it out of the shared business records. ``None`` otherwise.
+    """
+
     region: Region
     """
     Suggested area in a map to display results in.
@@ -526,6 +533,12 @@ class PhoneSearch(Model):
     A list of business Yelp finds based on the search criteria.
     """
 
+    distances: Optional[List[Optional[float]]] = None
+    """
+    Distance in meters from the search location of each business, in the order of :py:attr:`businesses`, when the
+    ``business_identity_map`` setting moves it out of the shared business records. ``None`` otherwise.
+    """
+
 
 class User(Model):
     """
@@ -626,6 +639,12 @@ class TransactionSearch(Model):
     A list of business Yelp finds based on the search criteria.
     """
 
+    distances: Optional[List[Optional[float]]] = None
+    """
+    Distance in meters from the search location of each business, in the order of :py:attr:`businesses`, when the
+    ``business_identity_map`` setting moves it out of the shared business records. ``None`` otherwise.
+    """
+
 
 class Term(Model):
     """
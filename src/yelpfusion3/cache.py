@@ -0,0 +1,904 @@
+"""
+Response caches that answer repeated endpoint requests without a network call or API quota.
+"""
+
+import asyncio
+import sqlite3
+import time
+import zlib
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from contextvars import Context, ContextVar
+from dataclasses import dataclass, field, replace
+from pathlib import Path
+from threading import Lock, local
+from typing import Any, Callable, Coroutine, Dict, Iterator, List, Mapping, Optional, Set, Tuple, Type, TypeVar, Union
+from urllib.parse import quote, urlencode
+
+from yelpfusion3.model import Model
+from yelpfusion3.serialization import loads
+from yelpfusion3.settings import Settings, get_settings
+
+ModelT = TypeVar("ModelT", bound=Model)
+
+_caching: ContextVar[bool] = ContextVar("yelpfusion3_caching", default=True)
+
+
+@dataclass
+class CacheEntry:
+    """
+    A cached response: the raw JSON body, when it expires and, once parsed, the model built from it.
+
+    An expired entry may be served until :py:attr:`stale_until` while it is refreshed and, when it has validators, is
+    kept until :py:attr:`keep_until` to be revalidated with a conditional request.
+    """
+
+    body: bytes
+    """
+    The raw response body.
+    """
+
+    expires_at: float
+    """
+    When the entry expires, in seconds since the epoch.
+    """
+
+    stored_at: float = field(default_factory=time.time)
+    """
+    When the response was stored, in seconds since the epoch.
+    """
+
+    stale_until: Optional[float] = None
+    """
+    Until when the entry may still be served after it expired, in seconds since the epoch. Defaults to
+    :py:attr:`expires_at`.
+    """
+
+    keep_until: Optional[float] = None
+    """
+    Until when the entry is kept, in seconds since the epoch. Defaults to :py:attr:`stale_until`.
+    """
+
+    negative: bool = False
+    """
+    Whether the entry records a request that Yelp answered as not found, with a
+    :py:class:`~yelpfusion3.model.NegativeResult` body.
+    """
+
+    etag: Optional[str] = None
+    """
+    The ``ETag`` header of the response, if any.
+    """
+
+    last_modified: Optional[str] = None
+    """
+    The ``Last-Modified`` header of the response, if any.
+    """
+
+    model: Optional[Model] = field(default=None, compare=False, repr=False)
+    """
+    The model parsed from :py:attr:`body` by the last :py:meth:`parse`, if any.
+    """
+
+    def __post_init__(self) -> None:
+        if self.stale_until is None:
+            self.stale_until = self.expires_at
+        if self.keep_until is None:
+            self.keep_until = self.stale_until
+
+    @classmethod
+    def create(  # pylint: disable=too-many-arguments
+        cls,
+        body: bytes,
+        ttl: float,
+        model: Optional[Model] = None,
+        max_stale: float = 0.0,
+        negative: bool = False,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+    ) -> "CacheEntry":
+        """
+        Creates an entry for a response received now. An entry with validators is kept for at least another ``ttl``
+        after it expires, so that it can be revalidated rather than fetched again, but is only served stale within
+        ``max_stale``.
+
+        :param body: The raw response body.
+        :type body: bytes
+        :param ttl: Seconds until the entry expires.
+        :type ttl: float
+        :param model: The model already parsed from ``body``, if any.
+        :type model: Model
+        :param max_stale: Seconds after expiring during which the entry may still be served while it is refreshed.
+        :type max_stale: float
+        :param negative: Whether ``body`` is a :py:class:`~yelpfusion3.model.NegativeResult`.
+        :type negative: bool
+        :param etag: The ``ETag`` header of the response, if any.
+        :type etag: Optional[str]
+        :param last_modified: The ``Last-Modified`` header of the response, if any.
+        :type last_modified: Optional[str]
+        :return: A new entry.
+        :rtype: CacheEntry
+        """
+        now: float = time.time()
+        kept: float = max(max_stale, ttl) if etag or last_modified else max_stale
+        return cls(
+            body=body,
+            expires_at=now + ttl,
+            stored_at=now,
+            stale_until=now + ttl + max_stale,
+            keep_until=now + ttl + kept,
+            negative=negative,
+            etag=etag,
+            last_modified=last_modified,
+            model=model,
+        )
+
+    def renew(
+        self, ttl: float, max_stale: float = 0.0, etag: Optional[str] = None, last_modified: Optional[str] = None
+    ) -> "CacheEntry":
+        """
+        Creates a copy of the entry, fresh for another ``ttl``, after the server answered a conditional request with
+        ``304 Not Modified``. The copy shares the body and the parsed model of the entry.
+
+        :param ttl: Seconds until the copy expires.
+        :type ttl: float
+        :param max_stale: Seconds after expiring during which the copy may still be served while it is refreshed.
+        :type max_stale: float
+        :param etag: The ``ETag`` header of the ``304`` response, if any, replacing the one of the entry.
+        :type etag: Optional[str]
+        :param last_modified: The ``Last-Modified`` header of the ``304`` response, if any, replacing the one of the
+            entry.
+        :type last_modified: Optional[str]
+        :return: The renewed entry.
+        :rtype: CacheEntry
+        """
+        return CacheEntry.create(
+            self.body,
+            ttl,
+            model=self.model,
+            max_stale=max_stale,
+            negative=self.negative,
+            etag=etag or self.etag,
+            last_modified=last_modified or self.last_modified,
+        )
+
+    @property
+    def validators(self) -> Dict[str, str]:
+        """
+        :return: The headers of a conditional request for the entry: ``If-None-Match`` and ``If-Modified-Since``, for
+            the validators it has.
+        :rtype: Dict[str, str]
+        """
+        headers: Dict[str, str] = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+    @property
+    def expired(self) -> bool:
+        """
+        :return: ``True`` once the entry has outlived its time to live.
+        :rtype: bool
+        """
+        return time.time() >= self.expires_at
+
+    @property
+    def usable(self) -> bool:
+        """
+        :return: ``True`` while the entry may be served, fresh or stale.
+        :rtype: bool
+        """
+        return time.time() < self.stale_until
+
+    @property
+    def kept(self) -> bool:
+        """
+        :return: ``True`` while the entry is kept, to be served or revalidated.
+        :rtype: bool
+        """
+        return time.time() < self.keep_until
+
+    def parse(self, model: Type[ModelT]) -> ModelT:
+        """
+        Returns the body as a ``model`` instance, parsing it only on first use. The instance is shared by every hit on
+        the entry, so it should not be modified.
+
+        :param model: The model class to parse the body into.
+        :type model: Type[Model]
+        :return: The parsed model.
+        :rtype: Model
+        """
+        if not isinstance(self.model, model):
+            self.model = model(**loads(self.body))
+        return self.model
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    """
+    A snapshot of the lookups a :py:class:`Cache` has answered.
+    """
+
+    hits: int = 0
+    """
+    Number of lookups answered from the cache.
+    """
+
+    misses: int = 0
+    """
+    Number of lookups for keys that were absent, or expired and past the time they may be served stale.
+    """
+
+    stale: int = 0
+    """
+    Number of hits that returned an expired entry, to be served while it is refreshed.
+    """
+
+    evictions: int = 0
+    """
+    Number of unexpired entries dropped to make room for new ones.
+    """
+
+    @property
+    def hit_rate(self) -> float:
+        """
+        :return: Share of lookups answered from the cache.
+        :rtype: float
+        """
+        lookups: int = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class Cache(ABC):
+    """
+    Stores response bodies by request key. Implementations are thread-safe, and return expired entries only until
+    their :py:attr:`~CacheEntry.keep_until` time. An entry returned past its :py:attr:`~CacheEntry.stale_until` time,
+    to be revalidated, counts as a miss.
+    """
+
+    blocking: bool = False
+    """
+    Whether lookups and writes wait on I/O, in which case asynchronous endpoints run them in a worker thread rather
+    than on the event loop.
+    """
+
+    @property
+    @abstractmethod
+    def stats(self) -> CacheStats:
+        """
+        :return: Hit, miss and eviction counts so far.
+        :rtype: CacheStats
+        """
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[CacheEntry]:
+        """
+        Looks up an entry.
+
+        :param key: The request key.
+        :type key: str
+        :return: The entry, or ``None`` if it is absent or past its ``keep_until`` time.
+        :rtype: Optional[CacheEntry]
+        """
+
+    @abstractmethod
+    def set(self, key: str, entry: CacheEntry) -> None:
+        """
+        Stores an entry, replacing any previous entry for the same key.
+
+        :param key: The request key.
+        :type key: str
+        :param entry: The entry to store.
+        :type entry: CacheEntry
+        """
+
+    @abstractmethod
+    def delete(self, key: str) -> None:
+        """
+        Removes an entry, if present.
+
+        :param key: The request key.
+        :type key: str
+        """
+
+    @abstractmethod
+    def clear(self) -> None:
+        """
+        Removes every entry.
+        """
+
+
+class MemoryCache(Cache):
+    """
+    In-process cache that keeps up to ``max_entries`` entries and evicts the least recently used one to make room for
+    a new one. Parsed models stay attached to their entries, so hits skip parsing as well as the network.
+    """
+
+    def __init__(self, max_entries: int = 1024) -> None:
+        if max_entries < 1:
+            raise ValueError("'max_entries' must be at least 1.")
+
+        self.max_entries: int = max_entries
+        self._lock: Lock = Lock()
+        self._entries: "OrderedDict[str, CacheEntry]" = OrderedDict()
+        self._hits: int = 0
+        self._misses: int = 0
+        self._stale: int = 0
+        self._evictions: int = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def stats(self) -> CacheStats:
+        with self._lock:
+            return CacheStats(hits=self._hits, misses=self._misses, stale=self._stale, evictions=self._evictions)
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        with self._lock:
+            entry: Optional[CacheEntry] = self._entries.get(key)
+            if entry is not None and not entry.kept:
+                del self._entries[key]
+                entry = None
+            if entry is None:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            if entry.usable:
+                self._hits += 1
+                self._stale += entry.expired
+            else:
+                # Past the time it may be served stale, the entry is only returned to be revalidated.
+                self._misses += 1
+            return entry
+
+    def set(self, key: str, entry: CacheEntry) -> None:
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                _, evicted = self._entries.popitem(last=False)
+                if evicted.usable:
+                    self._evictions += 1
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+class CompressedMemoryCache(Cache):
+    """
+    In-process cache that keeps raw response bodies compressed with zlib, within a budget of ``max_bytes``, and evicts
+    the least recently used entries to stay within it. Parsed models, which take several times the memory of the JSON
+    they came from, are not kept: each hit decompresses the body and parses it again.
+
+    The budget counts the compressed bodies and their keys, which account for most of the memory used by the cache.
+    """
+
+    def __init__(self, max_bytes: int = 64 * 1024 * 1024, compression_level: int = 1) -> None:
+        """
+        :param max_bytes: Size of the compressed bodies and keys above which entries are evicted.
+        :type max_bytes: int
+        :param compression_level: zlib compression level, from 0 (none) to 9 (smallest).
+        :type compression_level: int
+        :raise ValueError: If ``max_bytes`` is not positive, or ``compression_level`` is out of range.
+        """
+
+        if max_bytes < 1:
+            raise ValueError("'max_bytes' must be at least 1.")
+        if not 0 <= compression_level <= 9:
+            raise ValueError("'compression_level' must be between 0 and 9.")
+        self.max_bytes: int = max_bytes
+        self.compression_level: int = compression_level
+        self._lock: Lock = Lock()
+        self._entries: "OrderedDict[str, CacheEntry]" = OrderedDict()
+        self._size: int = 0
+        self._hits: int = 0
+        self._misses: int = 0
+        self._stale: int = 0
+        self._evictions: int = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def size(self) -> int:
+        """
+        :return: Size of the compressed bodies and keys in the cache, in bytes.
+        :rtype: int
+        """
+        return self._size
+
+    @property
+    def stats(self) -> CacheStats:
+        with self._lock:
+            return CacheStats(hits=self._hits, misses=self._misses, stale=self._stale, evictions=self._evictions)
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        with self._lock:
+            compressed: Optional[CacheEntry] = self._entries.get(key)
+            if compressed is not None and not compressed.kept:
+                self._remove(key)
+                compressed = None
+            if compressed is None:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            if compressed.usable:
+                self._hits += 1
+                self._stale += compressed.expired
+            else:
+                # Past the time it may be served stale, the entry is only returned to be revalidated.
+                self._misses += 1
+        return replace(compressed, body=zlib.decompress(compressed.body))
+
+    def set(self, key: str, entry: CacheEntry) -> None:
+        compressed: CacheEntry = replace(entry, body=zlib.compress(entry.body, self.compression_level), model=None)
+        with self._lock:
+            self._remove(key)
+            self._entries[key] = compressed
+            self._size += _footprint(key, compressed)
+            while self._size > self.max_bytes and len(self._entries) > 1:
+                evicted: CacheEntry = self._remove(next(iter(self._entries)))
+                self._evictions += evicted.usable
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._remove(key)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+    def _remove(self, key: str) -> Optional[CacheEntry]:
+        entry: Optional[CacheEntry] = self._entries.pop(key, None)
+        if entry is not None:
+            self._size -= _footprint(key, entry)
+        return entry
+
+
+def _footprint(key: str, entry: CacheEntry) -> int:
+    return len(key) + len(entry.body)
+
+
+def _check_sqlite_arguments(max_bytes: int, compression_level: int, sweep_interval: int) -> None:
+    if max_bytes < 1:
+        raise ValueError("'max_bytes' must be at least 1.")
+    if not 0 <= compression_level <= 9:
+        raise ValueError("'compression_level' must be between 0 and 9.")
+    if sweep_interval < 1:
+        raise ValueError("'sweep_interval' must be at least 1.")
+
+
+class SqliteCache(Cache):
+    """
+    Cache kept in a SQLite database, so that it survives restarts and is shared by every process on the host that opens
+    the same file. Bodies are stored compressed with zlib, and the database runs in WAL mode so that readers never
+    wait for writers.
+
+    Entries that can no longer be served are deleted, and the entries closest to expiry after them, whenever the
+    compressed bodies outgrow ``max_bytes``. The sweep runs every ``sweep_interval`` writes, and can be run explicitly
+    with :py:meth:`sweep`.
+    """
+
+    blocking: bool = True
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        path: Union[str, Path],
+        max_bytes: int = 256 * 1024 * 1024,
+        compression_level: int = 6,
+        sweep_interval: int = 100,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        """
+        :param path: Location of the SQLite database. It is created if it doesn't exist.
+        :type path: Union[str, Path]
+        :param max_bytes: Size of the compressed bodies above which a sweep evicts entries.
+        :type max_bytes: int
+        :param compression_level: zlib compression level, from 0 (none) to 9 (smallest).
+        :type compression_level: int
+        :param sweep_interval: Number of writes by this instance between sweeps.
+        :type sweep_interval: int
+        :param clock: Wall-clock time, in seconds since the epoch. Override for testing.
+        :type clock: Callable[[], float]
+        """
+
+        _check_sqlite_arguments(max_bytes, compression_level, sweep_interval)
+        self.path: Path = Path(path)
+        self.max_bytes: int = max_bytes
+        self.compression_level: int = compression_level
+        self.sweep_interval: int = sweep_interval
+        self._clock: Callable[[], float] = clock
+        self._local: local = local()
+        self._lock: Lock = Lock()
+        self._writes: int = 0
+        self._hits: int = 0
+        self._misses: int = 0
+        self._stale: int = 0
+        self._evictions: int = 0
+
+        self._create_schema(self._connection())
+
+    def __len__(self) -> int:
+        count: int = self._connection().execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+        return count
+
+    @property
+    def size(self) -> int:
+        """
+        :return: Total size of the compressed bodies in the database, in bytes.
+        :rtype: int
+        """
+        size: int = self._connection().execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        return size
+
+    @property
+    def stats(self) -> CacheStats:
+        with self._lock:
+            return CacheStats(hits=self._hits, misses=self._misses, stale=self._stale, evictions=self._evictions)
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        now: float = self._clock()
+        row: Optional[Tuple[bytes, float, float, float, float, int, Optional[str], Optional[str]]] = (
+            self._connection()
+            .execute(
+                "SELECT body, stored_at, expires_at, stale_until, keep_until, negative, etag, last_modified "
+                "FROM responses WHERE key = ? AND keep_until > ?",
+                (key, now),
+            )
+            .fetchone()
+        )
+        with self._lock:
+            # Past the time it may be served stale, an entry is only returned to be revalidated.
+            if row is None or row[3] <= now:
+                self._misses += 1
+            else:
+                self._hits += 1
+                self._stale += row[2] <= now
+        if row is None:
+            return None
+        return CacheEntry(
+            body=zlib.decompress(row[0]),
+            stored_at=row[1],
+            expires_at=row[2],
+            stale_until=row[3],
+            keep_until=row[4],
+            negative=bool(row[5]),
+            etag=row[6],
+            last_modified=row[7],
+        )
+
+    def set(self, key: str, entry: CacheEntry) -> None:
+        body: bytes = zlib.compress(entry.body, self.compression_level)
+        self._connection().execute(
+            "INSERT OR REPLACE INTO responses "
+            "(key, body, size, stored_at, expires_at, stale_until, keep_until, negative, etag, last_modified) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                key,
+                body,
+                len(body),
+                entry.stored_at,
+                entry.expires_at,
+                entry.stale_until,
+                entry.keep_until,
+                entry.negative,
+                entry.etag,
+                entry.last_modified,
+            ),
+        )
+        with self._lock:
+            self._writes += 1
+            sweep: bool = self._writes % self.sweep_interval == 0
+        if sweep:
+            self.sweep()
+
+    def delete(self, key: str) -> None:
+        self._connection().execute("DELETE FROM responses WHERE key = ?", (key,))
+
+    def clear(self) -> None:
+        self._connection().execute("DELETE FROM responses")
+
+    def sweep(self) -> int:
+        """
+        Deletes entries past their ``keep_until`` time and then, while the compressed bodies are larger than
+        ``max_bytes``, the entries that are closest to expiry.
+
+        :return: The number of entries deleted.
+        :rtype: int
+        """
+
+        connection: sqlite3.Connection = self._connection()
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            expired: int = connection.execute("DELETE FROM responses WHERE keep_until <= ?", (self._clock(),)).rowcount
+            evicted: int = self._evict(connection, self.size - self.max_bytes)
+            connection.execute("COMMIT")
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+        with self._lock:
+            self._evictions += evicted
+        return expired + evicted
+
+    @staticmethod
+    def _create_schema(connection: sqlite3.Connection) -> None:
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            "key TEXT PRIMARY KEY, body BLOB NOT NULL, size INTEGER NOT NULL, "
+            "stored_at REAL NOT NULL, expires_at REAL NOT NULL, stale_until REAL NOT NULL, "
+            "keep_until REAL NOT NULL, negative INTEGER NOT NULL, etag TEXT, last_modified TEXT)"
+        )
+        connection.execute("CREATE INDEX IF NOT EXISTS responses_expires_at ON responses (expires_at)")
+        connection.execute("CREATE INDEX IF NOT EXISTS responses_keep_until ON responses (keep_until)")
+
+    @staticmethod
+    def _evict(connection: sqlite3.Connection, excess: int) -> int:
+        keys: List[Tuple[str]] = []
+        rows: Iterator[Tuple[str, int]] = connection.execute("SELECT key, size FROM responses ORDER BY expires_at")
+        while excess > 0:
+            key, size = next(rows)
+            keys.append((key,))
+            excess -= size
+        connection.executemany("DELETE FROM responses WHERE key = ?", keys)
+        return len(keys)
+
+    def _connection(self) -> sqlite3.Connection:
+        connection: Optional[sqlite3.Connection] = getattr(self._local, "connection", None)
+        if connection is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            connection = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            connection.execute("PRAGMA synchronous=NORMAL")
+            self._local.connection = connection
+        return connection
+
+
+class Revalidator:
+    """
+    Refreshes expired cache entries in the background while callers are served the stale entry. Refreshes are
+    coalesced by key, so a hot key is refreshed only once however many callers hit it meanwhile.
+
+    Refreshes run without the caller's context, so they are not bound by its
+    :py:func:`~yelpfusion3.timeout.deadline`. A failed refresh leaves the stale entry in place, to be served until its
+    ``stale_until`` time and refreshed again by a later hit.
+    """
+
+    def __init__(self, max_workers: int = 4) -> None:
+        self._lock: Lock = Lock()
+        self._pending: Set[str] = set()
+        self._tasks: Set[asyncio.Task] = set()
+        self._executor: ThreadPoolExecutor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="yelpfusion3-revalidate"
+        )
+        self.failures: int = 0
+        """
+        Number of refreshes that raised an exception.
+        """
+
+    @property
+    def pending(self) -> int:
+        """
+        :return: Number of refreshes queued or in flight.
+        :rtype: int
+        """
+        with self._lock:
+            return len(self._pending)
+
+    def submit(self, key: str, refresh: Callable[[], object]) -> bool:
+        """
+        Calls ``refresh`` on a worker thread, unless a refresh for ``key`` is already pending.
+
+        :param key: The request key of the expired entry.
+        :type key: str
+        :param refresh: Fetches the response again and stores it in the cache.
+        :return: ``True`` if a refresh was started.
+        :rtype: bool
+        """
+
+        if not self._claim(key):
+            return False
+        future: Future = self._executor.submit(Context().run, refresh)
+        future.add_done_callback(lambda done: self._finish(key, done))
+        return True
+
+    def asubmit(self, key: str, refresh: Callable[[], Coroutine[Any, Any, object]]) -> bool:
+        """
+        Awaits ``refresh`` in a task on the running event loop, unless a refresh for ``key`` is already pending.
+
+        :param key: The request key of the expired entry.
+        :type key: str
+        :param refresh: Fetches the response again and stores it in the cache.
+        :return: ``True`` if a refresh was started.
+        :rtype: bool
+        """
+
+        if not self._claim(key):
+            return False
+        task: "asyncio.Task[object]" = Context().run(asyncio.get_running_loop().create_task, refresh())
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        task.add_done_callback(lambda done: self._finish(key, done))
+        return True
+
+    def _claim(self, key: str) -> bool:
+        with self._lock:
+            if key in self._pending:
+                return False
+            self._pending.add(key)
+            return True
+
+    def _finish(self, key: str, done: Union[Future, asyncio.Future]) -> None:
+        failed: bool = not done.cancelled() and done.exception() is not None
+        with self._lock:
+            self._pending.discard(key)
+            self.failures += failed
+
+
+_revalidator: Revalidator = Revalidator()
+
+
+def get_revalidator() -> Revalidator:
+    """
+    :return: The revalidator that refreshes stale responses served by endpoints.
+    :rtype: Revalidator
+    """
+
+    return _revalidator
+
+
+def _sqlite_cache(settings: Settings) -> SqliteCache:
+    if settings.cache_path is None:
+        raise ValueError("The 'sqlite' response cache requires the 'cache_path' setting.")
+    return SqliteCache(path=settings.cache_path, max_bytes=settings.cache_max_bytes)
+
+
+CACHES: Dict[str, Callable[[Settings], Cache]] = {
+    "memory": lambda settings: MemoryCache(max_entries=settings.cache_max_entries),
+    "sqlite": _sqlite_cache,
+    "compressed": lambda settings: CompressedMemoryCache(max_bytes=settings.cache_max_memory),
+}
+"""
+Response cache backends by name, as accepted by the ``cache`` setting.
+"""
+
+_lock: Lock = Lock()
+_cache: Optional[Cache] = None
+_configured: bool = False
+
+
+def get_cache() -> Optional[Cache]:
+    """
+    Returns the response cache consulted by :py:meth:`~yelpfusion3.endpoint.Endpoint.get` and
+    :py:meth:`~yelpfusion3.endpoint.Endpoint.aget`. Unless replaced with :py:func:`set_cache`, it is created on first
+    use from the ``cache`` setting, and responses are not cached when that is not set.
+
+    :return: The shared response cache, if any.
+    :rtype: Optional[Cache]
+    """
+
+    global _cache, _configured  # pylint: disable=global-statement
+    if not _configured:
+        with _lock:
+            if not _configured:
+                settings: Settings = get_settings()
+                _cache = CACHES[settings.cache](settings) if settings.cache else None
+                _configured = True
+    return _cache
+
+
+def set_cache(cache: Optional[Cache]) -> None:
+    """
+    Replaces the response cache. Pass ``None`` to recreate it from settings on next use.
+
+    :param cache: The response cache to use.
+    :type cache: Cache
+    """
+
+    global _cache, _configured  # pylint: disable=global-statement
+    with _lock:
+        _cache = cache
+        _configured = cache is not None
+
+
+@contextmanager
+def caching(enabled: bool = True) -> Iterator[None]:
+    """
+    Turns the response cache on or off for requests made within the ``with`` block. Requests made with caching turned
+    off neither read from nor write to the cache.
+
+    .. code-block:: python
+
+        with caching(False):
+            business = Client.business_details(business_id="WavvLdfdP6g8aZTtbBQHTw").get()
+
+    :param enabled: Whether to use the response cache.
+    :type enabled: bool
+    """
+
+    token = _caching.set(enabled)
+    try:
+        yield
+    finally:
+        _caching.reset(token)
+
+
+def caching_enabled() -> bool:
+    """
+    :return: ``True`` if requests made in the current context may use the response cache.
+    :rtype: bool
+    """
+
+    return _caching.get()
+
+
+COORDINATES: Tuple[str, ...] = ("latitude", "longitude")
+"""
+Query parameters snapped to the grid by :py:func:`canonical_key`.
+"""
+
+
+def normalize_location(location: str) -> str:
+    """
+    Normalizes a free-form location, so that spellings Yelp resolves to the same place, like ``"San Francisco,CA"`` and
+    ``" san francisco, ca "``, compare equal: it is case-folded, its whitespace collapsed and its comma-separated parts
+    joined with ``", "``.
+
+    :param location: The location, like ``"350 5th Ave, New York, NY"``.
+    :type location: str
+    :return: The normalized location.
+    :rtype: str
+    """
+
+    return ", ".join(" ".join(part.split()) for part in location.casefold().split(",") if part.strip())
+
+
+def snap(coordinate: float, grid: float) -> float:
+    """
+    Rounds a coordinate to the nearest multiple of ``grid``.
+
+    :param coordinate: Latitude or longitude, in decimal degrees.
+    :type coordinate: float
+    :param grid: Size of the grid cells, in decimal degrees.
+    :type grid: float
+    :return: The snapped coordinate.
+    :rtype: float
+    """
+
+    # The second rounding drops the binary noise of the multiplication, like 37.775000000000006, from the key.
+    return round(round(coordinate / grid) * grid, 10)
+
+
+def canonical_key(url: str, parameters: Mapping[str, Any], grid: Optional[float] = None) -> str:
+    """
+    Builds a cache key that is the same for every spelling of a request: parameters that are ``None`` are dropped, the
+    rest are sorted by name, ``location`` is normalized with :py:func:`normalize_location` and, when ``grid`` is set,
+    ``latitude`` and ``longitude`` are snapped to it with :py:func:`snap`.
+
+    :param url: The endpoint URL, without query string.
+    :type url: str
+    :param parameters: The query parameters of the request.
+    :type parameters: Mapping[str, Any]
+    :param grid: Size of the grid cells coordinates are snapped to, in decimal degrees. ``None`` keeps them as they are.
+    :type grid: Optional[float]
+    :return: The key of the request.
+    :rtype: str
+    """
+
+    canonical: Dict[str, Any] = {key: value for key, value in parameters.items() if value is not None}
+    if "location" in canonical:
+        canonical["location"] = normalize_location(str(canonical["location"]))
+    if grid is not None:
+        canonical.update({key: snap(canonical[key], grid) for key in COORDINATES if key in canonical})
+    query: str = urlencode(sorted(canonical.items()), quote_via=quote)
+    return f"{url}?{query}" if query else url
@@ -0,0 +1,308 @@
+"""
+Fills the response cache ahead of traffic, like after a cache flush or a deploy, from a list of business IDs and search
+areas.
+"""
+
+import json
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from threading import Lock
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Set, TextIO, Union
+
+from pydantic import ValidationError
+
+from yelpfusion3.batch import Batch, BatchResult
+from yelpfusion3.business.endpoint import BusinessDetailsEndpoint, BusinessSearchEndpoint, ReviewsEndpoint
+from yelpfusion3.cache import Cache, CacheEntry, get_cache
+from yelpfusion3.endpoint import Endpoint
+from yelpfusion3.exceptions import ApiError, QuotaExceededError
+from yelpfusion3.ratelimit import RateLimiter
+
+WarmTarget = Union[str, Dict[str, Any]]
+"""
+A business ID, warmed with :py:class:`~yelpfusion3.business.endpoint.BusinessDetailsEndpoint` and
+:py:class:`~yelpfusion3.business.endpoint.ReviewsEndpoint`, or a search area: the arguments of a
+:py:class:`~yelpfusion3.business.endpoint.BusinessSearchEndpoint`, like
+``{"location": "Oakland, CA", "term": "pizza"}``.
+"""
+
+
+def read_targets(path: Union[str, Path]) -> Iterator[WarmTarget]:
+    """
+    Reads warm-up targets from a file with one target per line: a business ID, or a search area as a JSON object.
+    Blank lines and lines starting with ``#`` are skipped.
+
+    :param path: The file to read.
+    :type path: Union[str, Path]
+    :raise ValueError: If a line starting with ``{`` is not a valid JSON object.
+    :return: The targets, read lazily.
+    :rtype: Iterator[WarmTarget]
+    """
+
+    with Path(path).open(encoding="utf-8") as file:
+        for line in file:
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            yield json.loads(line) if line.startswith("{") else line
+
+
+@dataclass
+class WarmProgress:
+    """
+    Progress of a :py:class:`CacheWarmer` run, passed to its ``on_progress`` callback after each target.
+    """
+
+    warmed: int = 0
+    """
+    Targets whose responses were all fetched and cached.
+    """
+
+    skipped: int = 0
+    """
+    Targets already completed by an interrupted run, or whose responses were all cached and fresh.
+    """
+
+    failed: int = 0
+    """
+    Targets that are invalid, had a request fail or were only partly requested before the run stopped. They are retried
+    by the next run.
+    """
+
+    requests: int = 0
+    """
+    Requests sent to Yelp.
+    """
+
+    elapsed: float = 0.0
+    """
+    Seconds since the run started.
+    """
+
+    errors: List[BaseException] = field(default_factory=list, repr=False)
+    """
+    The exceptions raised by failed requests and invalid targets.
+    """
+
+    @property
+    def completed(self) -> int:
+        """
+        :return: Number of targets processed, whatever their outcome.
+        :rtype: int
+        """
+        return self.warmed + self.skipped + self.failed
+
+
+class CacheWarmer:
+    """
+    Requests the business details and reviews of business IDs, and the business search of search areas, so that their
+    responses are in the response cache before callers ask for them.
+
+    Requests whose responses are cached and fresh are not sent. The others go through the usual rate limiter and quota
+    coordinator, and are further limited to ``per_second`` and ``max_requests`` so that warming leaves quota to live
+    traffic. The run stops at the first :py:class:`~yelpfusion3.exceptions.QuotaExceededError`.
+
+    With a ``checkpoint`` file, each completed target is recorded there as soon as it is done, and targets recorded by
+    an earlier, interrupted run are skipped, so running the warmer again resumes where it stopped.
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        targets: Iterable[WarmTarget],
+        reviews: bool = True,
+        per_second: Optional[float] = None,
+        max_requests: Optional[int] = None,
+        max_workers: int = 4,
+        checkpoint: Optional[Union[str, Path]] = None,
+        on_progress: Optional[Callable[[WarmProgress], None]] = None,
+    ) -> None:
+        """
+        :param targets: Business IDs and search areas to warm. See :py:data:`WarmTarget` and :py:func:`read_targets`.
+        :type targets: Iterable[WarmTarget]
+        :param reviews: Whether to warm the reviews of business IDs besides their details.
+        :type reviews: bool
+        :param per_second: Maximum requests per second sent by the warmer, or ``None`` for no limit of its own.
+        :type per_second: Optional[float]
+        :param max_requests: Maximum number of requests sent by the run, or ``None`` for no limit.
+        :type max_requests: Optional[int]
+        :param max_workers: Maximum number of concurrent requests.
+        :type max_workers: int
+        :param checkpoint: File recording completed targets, to resume an interrupted run.
+        :type checkpoint: Optional[Union[str, Path]]
+        :param on_progress: Called with the progress of the run after each target.
+        :type on_progress: Optional[Callable[[WarmProgress], None]]
+        :raise ValueError: If ``max_requests`` is negative.
+        """
+
+        if max_requests is not None and max_requests < 0:
+            raise ValueError("'max_requests' must not be negative.")
+        self.targets: Iterable[WarmTarget] = targets
+        self.reviews: bool = reviews
+        self.max_requests: Optional[int] = max_requests
+        self.max_workers: int = max_workers
+        self.checkpoint: Optional[Path] = Path(checkpoint) if checkpoint is not None else None
+        self.on_progress: Optional[Callable[[WarmProgress], None]] = on_progress
+        self.progress: WarmProgress = WarmProgress()
+        self._rate_limiter: Optional[RateLimiter] = RateLimiter(per_second=per_second) if per_second else None
+        self._lock: Lock = Lock()
+        self._stopped: bool = False
+        self._start: float = 0.0
+        # Target of each endpoint in flight by its index in the batch, number of endpoints of each target still in
+        # flight, and targets with a failed request.
+        self._keys: Dict[int, str] = {}
+        self._remaining: Dict[str, int] = {}
+        self._failed: Set[str] = set()
+
+    def run(self) -> WarmProgress:
+        """
+        Warms every target not completed yet. Each call starts a new run, with new :py:attr:`progress`.
+
+        :raise ValueError: If no response cache is configured.
+        :return: The progress of the run once it ends.
+        :rtype: WarmProgress
+        """
+
+        cache: Optional[Cache] = get_cache()
+        if cache is None:
+            raise ValueError("Warming requires a response cache. Set the 'cache' setting or call set_cache().")
+        self.progress, self._stopped, self._start = WarmProgress(), False, time.perf_counter()
+        done: Set[str] = self._completed()
+        with self._open_checkpoint() as checkpoint:
+            for result in Batch(self._endpoints(cache, done), max_workers=self.max_workers):
+                self._complete(result, checkpoint)
+        return self.progress
+
+    @staticmethod
+    def key(target: WarmTarget) -> str:
+        """
+        Identifies a target in the checkpoint file.
+
+        :param target: A business ID or search area.
+        :type target: WarmTarget
+        :return: The business ID, or the search area as compact JSON with sorted keys.
+        :rtype: str
+        """
+        return json.dumps(target, sort_keys=True, separators=(",", ":")) if isinstance(target, dict) else target
+
+    def _endpoints(self, cache: Cache, done: Set[str]) -> Iterator[Endpoint]:
+        for target in self.targets:
+            key: str = self.key(target)
+            endpoints: List[Endpoint] = self._pending_endpoints(cache, target, key, done)
+            for sent, endpoint in enumerate(endpoints):
+                if not self._reserve():
+                    self._abandon(key, sent, len(endpoints))
+                    return
+                # The batch numbers endpoints in the order they are yielded, which is the order they are reserved in.
+                self._keys[self.progress.requests - 1] = key
+                yield endpoint
+
+    def _pending_endpoints(self, cache: Cache, target: WarmTarget, key: str, done: Set[str]) -> List[Endpoint]:
+        if key in done:
+            self._update(skipped=1)
+            return []
+        endpoints: Optional[List[Endpoint]] = self._stale_endpoints(cache, target)
+        if endpoints:
+            self._remaining[key] = len(endpoints)
+        elif endpoints is not None:
+            self._update(skipped=1)
+        return endpoints or []
+
+    def _stale_endpoints(self, cache: Cache, target: WarmTarget) -> Optional[List[Endpoint]]:
+        try:
+            endpoints: List[Endpoint] = self._target_endpoints(target)
+        except ValidationError as error:
+            # An invalid target fails on its own rather than ending the run.
+            self._fail(error)
+            return None
+        return [endpoint for endpoint in endpoints if not _fresh(cache.get(endpoint.cache_key))]
+
+    def _target_endpoints(self, target: WarmTarget) -> List[Endpoint]:
+        if isinstance(target, dict):
+            return [BusinessSearchEndpoint(**target)]
+        if self.reviews:
+            return [BusinessDetailsEndpoint(business_id=target), ReviewsEndpoint(business_id=target)]
+        return [BusinessDetailsEndpoint(business_id=target)]
+
+    def _abandon(self, key: str, sent: int, total: int) -> None:
+        # The run stopped partway through a target. One with requests sent fails once they complete, since some of its
+        # responses were not fetched, while one with none sent is left for the next run.
+        if not sent:
+            del self._remaining[key]
+            return
+        self._failed.add(key)
+        self._settle(key, total - sent, None)
+
+    def _complete(self, result: BatchResult, checkpoint: Optional[TextIO]) -> None:
+        key: str = self._keys.pop(result.index)
+        if not self._succeeded(result):
+            self._failed.add(key)
+        self._settle(key, 1, checkpoint)
+
+    def _settle(self, key: str, requests: int, checkpoint: Optional[TextIO]) -> None:
+        self._remaining[key] -= requests
+        if self._remaining[key]:
+            return
+        del self._remaining[key]
+        if key in self._failed:
+            self._failed.discard(key)
+            self._update(failed=1)
+            return
+        if checkpoint is not None:
+            checkpoint.write(f"{key}\n")
+            checkpoint.flush()
+        self._update(warmed=1)
+
+    def _completed(self) -> Set[str]:
+        if self.checkpoint is None or not self.checkpoint.exists():
+            return set()
+        with self.checkpoint.open(encoding="utf-8") as file:
+            return {line.rstrip("\n") for line in file if line.strip()}
+
+    @contextmanager
+    def _open_checkpoint(self) -> Iterator[Optional[TextIO]]:
+        if self.checkpoint is None:
+            yield None
+            return
+        self.checkpoint.parent.mkdir(parents=True, exist_ok=True)
+        with self.checkpoint.open("a", encoding="utf-8") as file:
+            yield file
+
+    def _reserve(self) -> bool:
+        with self._lock:
+            if self._stopped or (self.max_requests is not None and self.progress.requests >= self.max_requests):
+                return False
+            self.progress.requests += 1
+        if self._rate_limiter is not None:
+            self._rate_limiter.acquire()
+        return True
+
+    def _succeeded(self, result: BatchResult) -> bool:
+        if result.ok:
+            return True
+        if isinstance(result.error, ApiError) and result.error.status_code == 404:
+            # Nothing to cache for a business that is gone, and nothing to gain from retrying it.
+            return True
+        with self._lock:
+            self.progress.errors.append(result.error)
+            self._stopped = self._stopped or isinstance(result.error, QuotaExceededError)
+        return False
+
+    def _fail(self, error: BaseException) -> None:
+        with self._lock:
+            self.progress.errors.append(error)
+        self._update(failed=1)
+
+    def _update(self, warmed: int = 0, skipped: int = 0, failed: int = 0) -> None:
+        with self._lock:
+            self.progress.warmed += warmed
+            self.progress.skipped += skipped
+            self.progress.failed += failed
+            self.progress.elapsed = time.perf_counter() - self._start
+        if self.on_progress is not None:
+            self.on_progress(self.progress)
+
+
+def _fresh(entry: Optional[CacheEntry]) -> bool:
+    return entry is not None and not entry.expired
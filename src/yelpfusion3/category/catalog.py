@@ -0,0 +1,250 @@
+"""
+A local catalog of Yelp categories that answers category details by alias without a request per alias.
+
+The whole taxonomy of a locale is fetched once with :py:class:`~yelpfusion3.category.endpoint.AllCategoriesEndpoint`
+and kept in memory, indexed by alias. When the ``category_catalog_dir`` setting is set, it is also saved there in a
+compact form, so that new processes start with the last fetched catalog.
+
+A process without a saved catalog refreshes it in the background on first lookup. Meanwhile, English and all-locale
+catalogs answer from the snapshot bundled with the package, which only holds the root categories, and catalogs of other
+locales answer nothing. Aliases a catalog doesn't know are requested from Yelp, so in a cold process, lookups of
+anything but a root category wait on the network until the first refresh completes. Set ``category_catalog_dir`` so
+that later processes start warm.
+"""
+
+import gzip
+import json
+import os
+import time
+from pathlib import Path
+from threading import Lock
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+from yelpfusion3.cache import get_revalidator
+from yelpfusion3.category.endpoint import AllCategoriesEndpoint
+from yelpfusion3.category.model import Category, CategoryDetails
+from yelpfusion3.settings import Settings, get_settings
+
+BUNDLED_SNAPSHOT: Path = Path(__file__).with_name("snapshot.json")
+"""
+The snapshot bundled with the package, used by the catalogs of :py:data:`BUNDLED_LOCALES` until they are first
+fetched. It only holds the root categories, titled in English. Regenerate it with
+``CategoryCatalog(path=BUNDLED_SNAPSHOT).refresh()`` and a Yelp API key.
+"""
+
+BUNDLED_LOCALES: Tuple[Optional[str], ...] = (None, "en_US")
+"""
+Locales whose catalogs start from :py:data:`BUNDLED_SNAPSHOT`. Catalogs of other locales start empty.
+"""
+
+_FIELDS: List[str] = ["alias", "title", "parent_aliases", "country_whitelist", "country_blacklist"]
+
+_RETRY_INTERVAL: float = 60.0
+
+
+class CategoryCatalog:
+    """
+    Every category of a locale, indexed by alias.
+
+    Lookups load the catalog on first use, from its saved snapshot if any and otherwise from
+    :py:data:`BUNDLED_SNAPSHOT` for :py:data:`BUNDLED_LOCALES`, or empty for other locales. Once the catalog is older
+    than ``refresh_interval``, the next lookup refreshes it on a background thread and is answered from the current
+    catalog meanwhile.
+    """
+
+    def __init__(
+        self,
+        locale: Optional[str] = None,
+        path: Optional[Union[str, Path]] = None,
+        refresh_interval: float = 604800.0,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        """
+        :param locale: Locale of the categories, like ``fr_FR``. ``None`` holds the categories of all locales, titled in
+            English.
+        :type locale: Optional[str]
+        :param path: File the catalog is saved to after each refresh and loaded from on first use, gzip-compressed when
+            its name ends with ``.gz``. The catalog is only kept in memory when ``None``.
+        :type path: Optional[Union[str, Path]]
+        :param refresh_interval: Age, in seconds, after which a lookup refreshes the catalog in the background.
+        :type refresh_interval: float
+        :param clock: Wall-clock time, in seconds since the epoch. Override for testing.
+        :type clock: Callable[[], float]
+        :raise ValueError: If ``refresh_interval`` is not positive.
+        """
+
+        if refresh_interval <= 0:
+            raise ValueError("'refresh_interval' must be positive.")
+        self.locale: Optional[str] = locale
+        self.path: Optional[Path] = Path(path) if path is not None else None
+        self.refresh_interval: float = refresh_interval
+        self._clock: Callable[[], float] = clock
+        self._lock: Lock = Lock()
+        self._categories: Optional[Dict[str, Category]] = None
+        self._fetched_at: float = 0.0
+        self._attempted_at: float = float("-inf")
+
+    @property
+    def fetched_at(self) -> float:
+        """
+        :return: When the categories were fetched, in seconds since the epoch, or ``0`` before the first fetch.
+        :rtype: float
+        """
+        self._index()
+        return self._fetched_at
+
+    @property
+    def stale(self) -> bool:
+        """
+        :return: ``True`` once the catalog is older than its refresh interval.
+        :rtype: bool
+        """
+        return self._clock() - self.fetched_at >= self.refresh_interval
+
+    def get(self, alias: str) -> Optional[Category]:
+        """
+        Looks up a category by alias, and schedules a background refresh if the catalog is stale. A failed refresh is
+        retried by lookups a minute later at the earliest.
+
+        :param alias: The alias of the category, like ``bars``.
+        :type alias: str
+        :return: The category, or ``None`` if the catalog doesn't know the alias.
+        :rtype: Optional[Category]
+        """
+
+        categories: Dict[str, Category] = self._index()
+        now: float = self._clock()
+        if now - self._fetched_at >= self.refresh_interval and now - self._attempted_at >= _RETRY_INTERVAL:
+            self._attempted_at = now
+            get_revalidator().submit(f"category-catalog:{self.locale}", self.refresh)
+        return categories.get(alias)
+
+    def details(self, alias: str) -> Optional[CategoryDetails]:
+        """
+        Answers a category details request from the catalog.
+
+        :param alias: The alias of the category, like ``bars``.
+        :type alias: str
+        :return: The category details, or ``None`` if the catalog doesn't know the alias.
+        :rtype: Optional[CategoryDetails]
+        """
+
+        category: Optional[Category] = self.get(alias)
+        return CategoryDetails.construct(category=category) if category is not None else None
+
+    def refresh(self) -> int:
+        """
+        Fetches every category of the locale, replaces the catalog with them and saves it to :py:attr:`path`, if set.
+
+        :return: The number of categories fetched.
+        :rtype: int
+        """
+
+        endpoint: AllCategoriesEndpoint = (
+            AllCategoriesEndpoint(locale=self.locale) if self.locale is not None else AllCategoriesEndpoint()
+        )
+        categories: Dict[str, Category] = {category.alias: category for category in endpoint.stream()}
+        fetched_at: float = self._clock()
+        with self._lock:
+            self._categories, self._fetched_at = categories, fetched_at
+        if self.path is not None:
+            self._save(self.path, categories, fetched_at)
+        return len(categories)
+
+    def __contains__(self, alias: object) -> bool:
+        return alias in self._index()
+
+    def __len__(self) -> int:
+        return len(self._index())
+
+    def _index(self) -> Dict[str, Category]:
+        categories: Optional[Dict[str, Category]] = self._categories
+        if categories is None:
+            with self._lock:
+                if self._categories is None:
+                    self._load_saved_or_bundled()
+                categories = self._categories
+        return categories
+
+    def _load_saved_or_bundled(self) -> None:
+        if self._load_saved():
+            return
+        if self.locale in BUNDLED_LOCALES:
+            self._load(BUNDLED_SNAPSHOT)
+        else:
+            # The bundled titles are English, so other locales wait for their first refresh.
+            self._categories, self._fetched_at = {}, 0.0
+
+    def _load_saved(self) -> bool:
+        if self.path is None or not self.path.exists():
+            return False
+        try:
+            self._load(self.path)
+        except (OSError, ValueError, KeyError):
+            # A damaged snapshot is replaced by the next refresh.
+            return False
+        return True
+
+    def _load(self, path: Path) -> None:
+        with gzip.open(path, "rt", encoding="utf-8") if path.suffix == ".gz" else path.open(encoding="utf-8") as file:
+            snapshot: Dict[str, Any] = json.load(file)
+        self._categories = {row[0]: Category.construct(**dict(zip(_FIELDS, row))) for row in snapshot["categories"]}
+        self._fetched_at = snapshot["fetched_at"]
+
+    def _save(self, path: Path, categories: Dict[str, Category], fetched_at: float) -> None:
+        # Each category is a row of its field values, without the trailing empty lists most of them have.
+        rows: List[List[Any]] = []
+        for category in categories.values():
+            row: List[Any] = [getattr(category, field) for field in _FIELDS]
+            while not row[-1]:
+                row.pop()
+            rows.append(row)
+        snapshot: Dict[str, Any] = {"locale": self.locale, "fetched_at": fetched_at, "categories": rows}
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temporary: Path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        with (
+            gzip.open(temporary, "wt", encoding="utf-8")
+            if path.suffix == ".gz"
+            else temporary.open("w", encoding="utf-8")
+        ) as file:
+            json.dump(snapshot, file, ensure_ascii=False, separators=(",", ":"))
+        # Replacing the file at once keeps other processes from loading a partial catalog.
+        os.replace(temporary, path)
+
+
+_lock: Lock = Lock()
+_catalogs: Dict[Optional[str], CategoryCatalog] = {}
+
+
+def get_category_catalog(locale: Optional[str] = None) -> CategoryCatalog:
+    """
+    Returns the category catalog of a locale, creating it from the ``category_catalog_*`` settings on first use.
+
+    :param locale: Locale of the categories, like ``fr_FR``. ``None`` holds the categories of all locales.
+    :type locale: Optional[str]
+    :return: The catalog of ``locale``.
+    :rtype: CategoryCatalog
+    """
+
+    catalog: Optional[CategoryCatalog] = _catalogs.get(locale)
+    if catalog is None:
+        with _lock:
+            catalog = _catalogs.get(locale)
+            if catalog is None:
+                settings: Settings = get_settings()
+                directory: Optional[Path] = settings.category_catalog_dir
+                catalog = _catalogs[locale] = CategoryCatalog(
+                    locale=locale,
+                    path=directory / f"categories-{locale or 'all'}.json.gz" if directory is not None else None,
+                    refresh_interval=settings.category_catalog_refresh_interval,
+                )
+    return catalog
+
+
+def reset_category_catalogs() -> None:
+    """
+    Discards every category catalog. New catalogs are created from the current settings on next use.
+    """
+
+    with _lock:
+        _catalogs.clear()
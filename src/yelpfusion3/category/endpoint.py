@@ -2,15 +2,14 @@
 Abstractions for Yelp Fusion category endpoints.
 """
 
-from typing import Optional
+from typing import AsyncIterator, Iterator, Optional
 from urllib.parse import urlencode
 
 from pydantic import constr
-from requests import Response
 
-from yelpfusion3.category.model import Categories, CategoryDetails
+from yelpfusion3.category.model import Categories, Category, CategoryDetails
 from yelpfusion3.endpoint import Endpoint
-from yelpfusion3.settings import Settings
+from yelpfusion3.settings import Settings, get_settings
 
 
 class CategoryDetailsEndpoint(Endpoint):
@@ -20,6 +19,10 @@ class CategoryDetailsEndpoint(Endpoint):
 
     _path: str = "/categories/{alias}"
 
+    _cache_ttl: Optional[float] = 86400.0
+
+    _cache_max_stale: Optional[float] = 604800.0
+
     locale: Optional[str]
     """
     Optional. Specify the locale to return the autocomplete suggestions in. See
@@ -41,7 +44,7 @@ class CategoryDetailsEndpoint(Endpoint):
         """
         non_none_fields = {key: value for key, value in self.dict().items() if value is not None and key != "alias"}
         parameters = urlencode(query=non_none_fields)
-        settings: Settings = Settings()
+        settings: Settings = get_settings()
         path: str = self._path.format(alias=self.alias)
 
         if parameters:
@@ -50,8 +53,23 @@ class CategoryDetailsEndpoint(Endpoint):
         return f"{settings.base_url}{path}"
 
     def get(self) -> CategoryDetails:
-        response: Response = self._get()
-        return CategoryDetails(**response.json())
+        return self._from_catalog() or self._fetch(CategoryDetails)
+
+    async def aget(self) -> CategoryDetails:
+        return self._from_catalog() or await self._afetch(CategoryDetails)
+
+    def _from_catalog(self) -> Optional[CategoryDetails]:
+        """
+        Answers the request from the category catalog of the locale when the ``category_catalog`` setting is enabled.
+        Aliases the catalog doesn't know yet are requested from Yelp.
+        """
+
+        if not get_settings().category_catalog:
+            return None
+        # Imported here because the catalog fetches categories with AllCategoriesEndpoint.
+        from yelpfusion3.category.catalog import get_category_catalog  # pylint: disable=import-outside-toplevel
+
+        return get_category_catalog(self.locale).details(self.alias)
 
 
 class AllCategoriesEndpoint(Endpoint):
@@ -63,6 +81,10 @@ class AllCategoriesEndpoint(Endpoint):
 
     _path: str = "/categories"
 
+    _cache_ttl: Optional[float] = 86400.0
+
+    _cache_max_stale: Optional[float] = 604800.0
+
     locale: Optional[str]
     """
     Optional. Specify the locale to filter the categories returned to only those available in that locale, and to
@@ -72,5 +94,26 @@ class AllCategoriesEndpoint(Endpoint):
     """
 
     def get(self) -> Categories:
-        response: Response = self._get()
-        return Categories(**response.json())
+        return self._fetch(Categories)
+
+    async def aget(self) -> Categories:
+        return await self._afetch(Categories)
+
+    def stream(self) -> Iterator[Category]:
+        """
+        Performs a GET request to the endpoint and yields the ``categories`` of the response one at a time, as they are
+        read from the connection, without holding the whole response in memory.
+
+        :return: The categories found.
+        :rtype: Iterator[Category]
+        """
+        return self._stream("categories", Category)
+
+    def astream(self) -> AsyncIterator[Category]:
+        """
+        Asynchronous counterpart of :py:meth:`stream`.
+
+        :return: The categories found.
+        :rtype: AsyncIterator[Category]
+        """
+        return self._astream("categories", Category)
@@ -4,10 +4,12 @@ A Python client for the Yelp Fusion v3 API.
 
 from __future__ import annotations
 
-from typing import Optional
+from types import TracebackType
+from typing import Iterable, Optional, Type
 
 from pydantic import confloat, constr
 
+from yelpfusion3.batch import Batch
 from yelpfusion3.business.endpoint import (
     AutocompleteEndpoint,
     BusinessDetailsEndpoint,
@@ -18,7 +20,10 @@ from yelpfusion3.business.endpoint import (
     TransactionSearchEndpoint,
 )
 from yelpfusion3.category.endpoint import AllCategoriesEndpoint, CategoryDetailsEndpoint
+from yelpfusion3.endpoint import Endpoint
 from yelpfusion3.event.endpoint import EventLookupEndpoint, EventSearchEndpoint, FeaturedEventEndpoint
+from yelpfusion3.session import aclose_session
+from yelpfusion3.warmup import awarmup, warmup
 
 
 class Client:
@@ -278,3 +283,93 @@ class Client:
         """
 
         return AllCategoriesEndpoint()
+
+    @staticmethod
+    def get_many(endpoints: Iterable[Endpoint], max_workers: int = 8, ordered: bool = True) -> Batch:
+        """
+        Creates a new :py:class:`~yelpfusion3.batch.Batch` that requests ``endpoints`` concurrently on a bounded pool
+        of worker threads. Requests start when the batch is iterated.
+
+        .. code-block:: python
+
+            batch = Client.get_many(Client.business_details(business_id) for business_id in business_ids)
+            for result in batch:
+                if result.ok:
+                    print(result.result.name)
+            print(batch.stats.throughput, batch.stats.percentile(99))
+
+        :param endpoints: The endpoints to request.
+        :type endpoints: Iterable[Endpoint]
+        :param max_workers: Maximum number of concurrent requests.
+        :type max_workers: int
+        :param ordered: Yield results in input order when ``True``, or as soon as they complete when ``False``.
+        :type ordered: bool
+        :return: An iterable of per-endpoint results that also exposes batch statistics.
+        :rtype: Batch
+        """
+
+        return Batch(endpoints=endpoints, max_workers=max_workers, ordered=ordered)
+
+    @staticmethod
+    def warmup(connections: Optional[int] = None) -> int:
+        """
+        Opens pooled connections to Yelp and preloads the lookup tables used by validators ahead of the first request,
+        so that it runs at steady-state latency. Typically called once per worker process at startup. See
+        :py:func:`~yelpfusion3.warmup.warmup`.
+
+        :param connections: The number of connections to open. Defaults to the ``warmup_connections`` setting, or to
+            ``pool_maxsize``.
+        :type connections: int
+        :return: The number of connections opened.
+        :rtype: int
+        """
+
+        return warmup(connections=connections)
+
+
+class AsyncClient(Client):
+    """
+    AsyncClient offers the same factory methods as :py:class:`~yelpfusion3.client.Client` for use inside asyncio
+    applications. Await :py:meth:`~yelpfusion3.endpoint.Endpoint.aget` on the returned endpoints to perform requests
+    without blocking the event loop. All endpoints on the same event loop share one asynchronous connection pool, which
+    is closed when the client is used as an ``async with`` context manager or when :py:meth:`aclose` is awaited.
+
+    .. code-block:: python
+
+        async with AsyncClient() as client:
+            business_details = await client.business_details(business_id="WavvLdfdP6g8aZTtbBQHTw").aget()
+    """
+
+    @staticmethod
+    async def aclose() -> None:
+        """
+        Closes the asynchronous connection pool shared by endpoints on the running event loop.
+        """
+
+        await aclose_session()
+
+    @staticmethod
+    async def awarmup(connections: Optional[int] = None) -> int:
+        """
+        Opens connections of the asynchronous connection pool shared by endpoints on the running event loop, and
+        preloads the lookup tables used by validators. See :py:func:`~yelpfusion3.warmup.awarmup`.
+
+        :param connections: The number of connections to open. Defaults to the ``warmup_connections`` setting, or to
+            ``pool_maxsize``.
+        :type connections: int
+        :return: The number of connections opened.
+        :rtype: int
+        """
+
+        return await awarmup(connections=connections)
+
+    async def __aenter__(self) -> AsyncClient:
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        await self.aclose()
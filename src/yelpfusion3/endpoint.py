@@ -2,16 +2,49 @@
 Shared endpoint abstractions used by multiple Yelp Fusion v3 endpoints.
 """
 
+import asyncio
 from abc import abstractmethod
-from typing import Dict, List
+from functools import lru_cache, partial
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    FrozenSet,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Type,
+    TypeVar,
+)
 from urllib.parse import quote, urlencode
 
-import requests
 from pydantic import BaseModel, validator
 from requests import Response
 
-from yelpfusion3.model import Model
-from yelpfusion3.settings import Settings
+from yelpfusion3.breaker import get_circuit_breaker
+from yelpfusion3.cache import Cache, CacheEntry, caching_enabled, canonical_key, get_cache, get_revalidator
+from yelpfusion3.exceptions import ApiError
+from yelpfusion3.hedge import get_hedger, hedging_enabled
+from yelpfusion3.model import Model, NegativeResult
+from yelpfusion3.quota import QuotaCoordinator, get_quota_coordinator
+from yelpfusion3.ratelimit import get_rate_limiter
+from yelpfusion3.retry import get_retry_policy
+from yelpfusion3.serialization import loads
+from yelpfusion3.settings import Settings, get_settings
+from yelpfusion3.singleflight import get_single_flight
+from yelpfusion3.stream import CHUNK_SIZE, aiter_items, iter_items
+from yelpfusion3.timeout import Timeout, read_within_deadline, remaining, request_timeout, within_deadline
+from yelpfusion3.transport import get_async_transport, get_transport
+
+if TYPE_CHECKING:  # pragma: no cover
+    import httpx
+
+ModelT = TypeVar("ModelT", bound=Model)
+ResultT = TypeVar("ResultT")
 
 
 class SupportedLocales:  # pylint: disable=too-few-public-methods
@@ -242,6 +275,17 @@ class SupportedLocales:  # pylint: disable=too-few-public-methods
         """
         return [locale["code"] for locale in SupportedLocales.locales]
 
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def code_set() -> FrozenSet[str]:
+        """
+        Returns the supported locale codes as a set, built on first use and shared by every later call.
+
+        :return: The supported locale codes.
+        :rtype: FrozenSet[str]
+        """
+        return frozenset(SupportedLocales.codes())
+
 
 class Endpoint(BaseModel):
     """
@@ -255,6 +299,36 @@ class Endpoint(BaseModel):
 
     _path: str
 
+    _timeout: Timeout = Timeout()
+    """
+    Default connect and read timeouts of the endpoint. Override per call with :py:func:`~yelpfusion3.timeout.timeout`.
+    """
+
+    _cache_ttl: Optional[float] = 300.0
+    """
+    Seconds that responses of the endpoint are kept in the response cache, or ``None`` to never cache them. See
+    :py:mod:`yelpfusion3.cache`.
+    """
+
+    _cache_max_stale: Optional[float] = None
+    """
+    Seconds past its TTL that a cached response may still be served, while it is refreshed in the background, when the
+    ``cache_stale_while_revalidate`` setting is enabled. ``None`` never serves stale responses of the endpoint.
+    """
+
+    _negative_ttl: Optional[float] = None
+    """
+    Seconds that responses which found nothing are cached when the ``cache_negative`` setting is enabled: a
+    ``404 Not Found`` is raised again from the response cache, and an empty result is returned from it. ``None`` never
+    caches negatives of the endpoint.
+    """
+
+    _canonical_cache_key: bool = False
+    """
+    Whether :py:attr:`cache_key` is built with :py:func:`~yelpfusion3.cache.canonical_key` rather than from
+    :py:attr:`url`. Set by search endpoints, whose free-form locations and coordinates vary between equivalent requests.
+    """
+
     @property
     def url(self) -> str:
         """
@@ -265,11 +339,35 @@ class Endpoint(BaseModel):
         """
         non_none_fields = {key: value for key, value in self.dict().items() if value is not None}
         parameters = urlencode(query=non_none_fields, quote_via=quote)
-        settings = Settings()
+        settings = get_settings()
         if parameters:
             return f"{settings.base_url}{self._path}?{parameters}"
         return f"{settings.base_url}{self._path}"
 
+    @property
+    def cache_key(self) -> str:
+        """
+        Identifies the request in the response cache and among concurrent identical requests. Endpoints that set
+        ``_canonical_cache_key`` use :py:func:`~yelpfusion3.cache.canonical_key`, so that requests that only differ in
+        parameter order, location spelling or, with the ``cache_key_grid`` setting, nearby coordinates share a key.
+
+        :return: The key of the request.
+        :rtype: str
+        """
+        if not self._canonical_cache_key:
+            return self.url
+        settings: Settings = get_settings()
+        return canonical_key(f"{settings.base_url}{self._path}", self.dict(), settings.cache_key_grid)
+
+    def invalidate(self) -> None:
+        """
+        Removes the cached response of the request, if any, so that the next call to :py:meth:`get` or :py:meth:`aget`
+        fetches it again.
+        """
+        cache: Optional[Cache] = get_cache()
+        if cache is not None:
+            cache.delete(self.cache_key)
+
     @abstractmethod
     def get(self) -> Model:
         """
@@ -277,8 +375,219 @@ class Endpoint(BaseModel):
         :return:
         """
 
-    def _get(self) -> Response:
-        return requests.get(url=self.url, headers=Settings().headers, timeout=20)
+    @abstractmethod
+    async def aget(self) -> Model:
+        """
+        Performs a GET request to the endpoint with the configured query parameters without blocking the event loop.
+        :return:
+        """
+
+    def _get(self, headers: Optional[Dict[str, str]] = None) -> Response:
+        send: Callable[[], Response] = partial(self._send, headers=headers) if headers else self._send
+        if hedging_enabled():
+            return get_retry_policy().call(partial(get_hedger(self._path).call, send))
+        return get_retry_policy().call(send)
+
+    async def _aget(self, headers: Optional[Dict[str, str]] = None) -> "httpx.Response":
+        send: Callable[[], Awaitable["httpx.Response"]] = (
+            partial(self._asend, headers=headers) if headers else self._asend
+        )
+        if hedging_enabled():
+            return await get_retry_policy().acall(partial(get_hedger(self._path).acall, send))
+        return await get_retry_policy().acall(send)
+
+    def _send(self, stream: bool = False, headers: Optional[Dict[str, str]] = None) -> Response:
+        get_rate_limiter().acquire()
+        quota_coordinator: Optional[QuotaCoordinator] = get_quota_coordinator()
+        if quota_coordinator:
+            quota_coordinator.acquire()
+        settings: Settings = get_settings()
+        timeout: Timeout = request_timeout(self._timeout)
+        request_headers: Dict[str, str] = {**settings.headers, **headers} if headers else settings.headers
+
+        request: Callable[[], Response] = partial(self._request, request_headers, timeout, stream)
+        if settings.circuit_breaker:
+            return get_circuit_breaker(self._path).call(request)
+        return request()
+
+    def _request(self, headers: Dict[str, str], timeout: Timeout, stream: bool) -> Response:
+        if stream or remaining() is None:
+            return get_transport().get(url=self.url, headers=headers, timeout=timeout, stream=stream)
+        # Read the body in chunks to stop at the deadline, which socket timeouts alone do not enforce.
+        return read_within_deadline(get_transport().get(url=self.url, headers=headers, timeout=timeout, stream=True))
+
+    async def _asend(self, stream: bool = False, headers: Optional[Dict[str, str]] = None) -> "httpx.Response":
+        await get_rate_limiter().aacquire()
+        quota_coordinator: Optional[QuotaCoordinator] = get_quota_coordinator()
+        if quota_coordinator:
+            await quota_coordinator.aacquire()
+        settings: Settings = get_settings()
+        timeout: Timeout = request_timeout(self._timeout)
+        request_headers: Dict[str, str] = {**settings.headers, **headers} if headers else settings.headers
+
+        async def request() -> "httpx.Response":
+            return await within_deadline(
+                get_async_transport().aget(url=self.url, headers=request_headers, timeout=timeout, stream=stream)
+            )
+
+        if settings.circuit_breaker:
+            return await get_circuit_breaker(self._path).acall(request)
+        return await request()
+
+    def _fetch(self, model: Type[ModelT]) -> ModelT:
+        entry: Optional[CacheEntry] = self._cached()
+        if entry is not None and not entry.expired:
+            return self._answer(model, entry)
+        if entry is not None and self._serves_stale(entry):
+            get_revalidator().submit(self.cache_key, lambda: self._load(model, entry))
+            return self._answer(model, entry)
+        if get_settings().coalesce_requests:
+            return get_single_flight().do(self.cache_key, lambda: self._load(model, entry))
+        return self._load(model, entry)
+
+    async def _afetch(self, model: Type[ModelT]) -> ModelT:
+        entry: Optional[CacheEntry] = await self._off_loop(self._cached)
+        if entry is not None and not entry.expired:
+            return self._answer(model, entry)
+        if entry is not None and self._serves_stale(entry):
+            get_revalidator().asubmit(self.cache_key, lambda: self._aload(model, entry))
+            return self._answer(model, entry)
+        if get_settings().coalesce_requests:
+            return await get_single_flight().ado(self.cache_key, lambda: self._aload(model, entry))
+        return await self._aload(model, entry)
+
+    def _load(self, model: Type[ModelT], entry: Optional[CacheEntry] = None) -> ModelT:
+        """
+        Requests the response and caches it. With an expired ``entry`` that has validators, the request is conditional
+        and a ``304 Not Modified`` renews the entry instead.
+        """
+        try:
+            response: Response = self._get(entry.validators if entry is not None else None)
+        except ApiError as error:
+            self._not_found(error)
+            raise
+        if response.status_code == 304 and entry is not None:
+            return self._renew(model, entry, response.headers)
+        return self._parse(model, response.content, response.headers)
+
+    async def _aload(self, model: Type[ModelT], entry: Optional[CacheEntry] = None) -> ModelT:
+        try:
+            response: "httpx.Response" = await self._aget(entry.validators if entry is not None else None)
+        except ApiError as error:
+            await self._off_loop(self._not_found, error)
+            raise
+        if response.status_code == 304 and entry is not None:
+            return await self._off_loop(self._renew, model, entry, response.headers)
+        return await self._off_loop(self._parse, model, response.content, response.headers)
+
+    def _cache(self) -> Optional[Cache]:
+        if self._cache_ttl is None or not caching_enabled():
+            return None
+        return get_cache()
+
+    def _cached(self) -> Optional[CacheEntry]:
+        cache: Optional[Cache] = self._cache()
+        return cache.get(self.cache_key) if cache is not None else None
+
+    async def _off_loop(self, call: Callable[..., ResultT], *args: Any) -> ResultT:
+        """
+        Runs ``call``, which reads or writes the response cache, in a worker thread when the cache blocks on I/O.
+        """
+        cache: Optional[Cache] = self._cache()
+        if cache is not None and cache.blocking:
+            return await asyncio.to_thread(call, *args)
+        return call(*args)
+
+    def _max_stale(self) -> Optional[float]:
+        return self._cache_max_stale if get_settings().cache_stale_while_revalidate else None
+
+    def _serves_stale(self, entry: CacheEntry) -> bool:
+        return self._max_stale() is not None and entry.usable
+
+    def _negative_cache(self) -> Optional[Cache]:
+        if self._negative_ttl is None or not get_settings().cache_negative:
+            return None
+        return self._cache()
+
+    def _is_negative(self, result: Model) -> bool:  # pylint: disable=unused-argument
+        """
+        Tells whether a successful response found nothing, and may be cached as a negative. Overridden by endpoints
+        that set ``_negative_ttl``.
+        """
+        return False
+
+    def _received(self, result: Model) -> None:
+        """
+        Processes the response of a request, before it is cached. Overridden by endpoints that post-process their
+        responses.
+        """
+
+    def _not_found(self, error: ApiError) -> None:
+        """
+        Caches a ``404 Not Found`` as a :py:class:`~yelpfusion3.model.NegativeResult`, so that :py:meth:`_answer`
+        raises it again without a request.
+        """
+        cache: Optional[Cache] = self._negative_cache() if error.status_code == 404 else None
+        if cache is not None:
+            result = NegativeResult(status_code=error.status_code, code=error.code, description=error.description)
+            cache.set(
+                self.cache_key,
+                CacheEntry.create(result.json().encode(), self._negative_ttl, model=result, negative=True),
+            )
+
+    def _answer(self, model: Type[ModelT], entry: CacheEntry) -> ModelT:
+        """
+        Returns the model of a cached response, or raises the :py:class:`~yelpfusion3.exceptions.ApiError` of a cached
+        negative.
+        """
+        if entry.negative:
+            result: NegativeResult = entry.parse(NegativeResult)
+            raise ApiError(result.status_code, result.code, result.description)
+        return entry.parse(model)
+
+    def _renew(self, model: Type[ModelT], entry: CacheEntry, headers: Mapping[str, str]) -> ModelT:
+        renewed: CacheEntry = entry.renew(
+            self._cache_ttl,
+            max_stale=self._max_stale() or 0.0,
+            etag=headers.get("ETag"),
+            last_modified=headers.get("Last-Modified"),
+        )
+        cache: Optional[Cache] = self._cache()
+        if cache is not None:
+            cache.set(self.cache_key, renewed)
+        return self._answer(model, renewed)
+
+    def _parse(self, model: Type[ModelT], body: bytes, headers: Optional[Mapping[str, str]] = None) -> ModelT:
+        result: ModelT = model(**loads(body))
+        self._received(result)
+        cache: Optional[Cache] = self._cache()
+        if cache is not None:
+            # Results that found nothing are kept for the shorter negative TTL, and are never served stale.
+            negative: bool = self._negative_cache() is not None and self._is_negative(result)
+            entry: CacheEntry = CacheEntry.create(
+                body,
+                self._negative_ttl if negative else self._cache_ttl,
+                model=result,
+                max_stale=0.0 if negative else self._max_stale() or 0.0,
+                etag=headers.get("ETag") if headers is not None else None,
+                last_modified=headers.get("Last-Modified") if headers is not None else None,
+            )
+            cache.set(self.cache_key, entry)
+        return result
+
+    def _stream(self, key: str, model: Type[ModelT]) -> Iterator[ModelT]:
+        response: Response = get_retry_policy().call(partial(self._send, stream=True))
+        with response:
+            for item in iter_items(response.iter_content(chunk_size=CHUNK_SIZE), key):
+                yield model(**item)
+
+    async def _astream(self, key: str, model: Type[ModelT]) -> AsyncIterator[ModelT]:
+        response: "httpx.Response" = await get_retry_policy().acall(partial(self._asend, stream=True))
+        try:
+            async for item in aiter_items(response.aiter_bytes(CHUNK_SIZE), key):
+                yield model(**item)
+        finally:
+            await response.aclose()
 
     @validator("locale", check_fields=False)
     def _check_locale(cls, value: str) -> str:  # pylint: disable=E0213
@@ -292,6 +601,6 @@ class Endpoint(BaseModel):
         :return: "value" if it's a supported locale.
         :rtype: str
         """
-        if value not in SupportedLocales.codes():
+        if value not in SupportedLocales.code_set():
             raise ValueError("Unsupported 'locale' value.")
         return value
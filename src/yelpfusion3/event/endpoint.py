@@ -3,15 +3,14 @@ Abstractions for Yelp Fusion event endpoints.
 """
 
 from datetime import datetime
-from typing import List, Literal, Optional
+from typing import AsyncIterator, Iterator, List, Literal, Optional
 from urllib.parse import urlencode
 
 from pydantic import confloat, conint, constr, validator
-from requests import Response
 
 from yelpfusion3.endpoint import Endpoint
 from yelpfusion3.event.model import Event, EventSearch, SupportedCategories
-from yelpfusion3.settings import Settings
+from yelpfusion3.settings import Settings, get_settings
 
 
 class EventSearchEndpoint(Endpoint):
@@ -21,6 +20,8 @@ class EventSearchEndpoint(Endpoint):
 
     _path: str = "/events"
 
+    _canonical_cache_key: bool = True
+
     locale: Optional[str] = None
     """
     Optional. Specify the locale to return the event information in. See
@@ -108,8 +109,29 @@ class EventSearchEndpoint(Endpoint):
     """
 
     def get(self) -> EventSearch:
-        response: Response = self._get()
-        return EventSearch(**response.json())
+        return self._fetch(EventSearch)
+
+    async def aget(self) -> EventSearch:
+        return await self._afetch(EventSearch)
+
+    def stream(self) -> Iterator[Event]:
+        """
+        Performs a GET request to the endpoint and yields the ``events`` of the response one at a time, as they are read
+        from the connection, without holding the whole response in memory.
+
+        :return: The events found.
+        :rtype: Iterator[Event]
+        """
+        return self._stream("events", Event)
+
+    def astream(self) -> AsyncIterator[Event]:
+        """
+        Asynchronous counterpart of :py:meth:`stream`.
+
+        :return: The events found.
+        :rtype: AsyncIterator[Event]
+        """
+        return self._astream("events", Event)
 
     @validator("categories")
     def _check_categories(cls, value: str) -> str:  # pylint: disable=E0213
@@ -140,6 +162,8 @@ class EventLookupEndpoint(Endpoint):
 
     _path: str = "/events/{id}"
 
+    _cache_ttl: Optional[float] = 3600.0
+
     id: str
     """
     ID of the Yelp event to query for.
@@ -161,7 +185,7 @@ class EventLookupEndpoint(Endpoint):
         """
         non_none_fields = {key: value for key, value in self.dict().items() if value is not None and key != "id"}
         parameters = urlencode(query=non_none_fields)
-        settings: Settings = Settings()
+        settings: Settings = get_settings()
         path: str = self._path.format(id=self.id)
 
         if parameters:
@@ -170,8 +194,10 @@ class EventLookupEndpoint(Endpoint):
         return f"{settings.base_url}{path}"
 
     def get(self) -> Event:
-        response: Response = self._get()
-        return Event(**response.json())
+        return self._fetch(Event)
+
+    async def aget(self) -> Event:
+        return await self._afetch(Event)
 
 
 class FeaturedEventEndpoint(Endpoint):
@@ -182,6 +208,8 @@ class FeaturedEventEndpoint(Endpoint):
 
     _path: str = "/events/featured"
 
+    _canonical_cache_key: bool = True
+
     locale: Optional[str] = None
     """
     Optional. Specify the locale to return the event information in. See
@@ -205,5 +233,7 @@ class FeaturedEventEndpoint(Endpoint):
     """
 
     def get(self) -> Event:
-        response: Response = self._get()
-        return Event(**response.json())
+        return self._fetch(Event)
+
+    async def aget(self) -> Event:
+        return await self._afetch(Event)
@@ -0,0 +1,62 @@
+"""
+Exceptions raised by the Yelp Fusion client.
+"""
+
+from typing import Optional
+
+
+class YelpFusionError(Exception):
+    """
+    Base class for all errors raised by the Yelp Fusion client.
+    """
+
+
+class QuotaExceededError(YelpFusionError):
+    """
+    Raised when a request would exceed the configured daily request budget.
+    """
+
+
+class ApiError(YelpFusionError):
+    """
+    Raised when Yelp Fusion answers a request with an error status code.
+    """
+
+    def __init__(self, status_code: int, code: Optional[str] = None, description: Optional[str] = None) -> None:
+        """
+        :param status_code: HTTP status code of the response.
+        :type status_code: int
+        :param code: Yelp error code, like ``BUSINESS_NOT_FOUND``, if the response included one.
+        :type code: str
+        :param description: Human-readable description of the error, if the response included one.
+        :type description: str
+        """
+
+        super().__init__(f"{status_code} {code or 'HTTP_ERROR'}: {description or 'Request failed.'}")
+        self.status_code: int = status_code
+        self.code: Optional[str] = code
+        self.description: Optional[str] = description
+
+
+class CircuitOpenError(YelpFusionError):
+    """
+    Raised without contacting Yelp when the circuit breaker for an endpoint path is open.
+    """
+
+    def __init__(self, path: str, retry_after: float) -> None:
+        """
+        :param path: Endpoint path guarded by the open circuit, like ``/businesses/search``.
+        :type path: str
+        :param retry_after: Seconds until the circuit lets a probe request through.
+        :type retry_after: float
+        """
+
+        super().__init__(f"Circuit for '{path}' is open; retry in {retry_after:.1f}s.")
+        self.path: str = path
+        self.retry_after: float = retry_after
+
+
+class DeadlineExceededError(YelpFusionError, TimeoutError):
+    """
+    Raised when a request cannot complete within the deadline set with :py:func:`~yelpfusion3.timeout.deadline`.
+    """
@@ -0,0 +1,329 @@
+"""
+Hedged requests that cut tail latency by racing a second, identical request against a slow one.
+"""
+
+import asyncio
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from contextlib import contextmanager
+from contextvars import ContextVar, copy_context
+from dataclasses import dataclass
+from functools import partial
+from threading import Lock
+from typing import Any, Awaitable, Callable, Deque, Dict, Iterator, List, Optional, Set, TypeVar, Union
+
+from yelpfusion3.settings import Settings, get_settings
+
+ResponseT = TypeVar("ResponseT")
+FutureT = TypeVar("FutureT", bound=Union[Future[Any], asyncio.Future[Any]])
+
+_hedging: ContextVar[Optional[bool]] = ContextVar("yelpfusion3_hedging", default=None)
+
+
+@dataclass(frozen=True)
+class HedgeStats:
+    """
+    A snapshot of the requests a :py:class:`Hedger` has handled.
+    """
+
+    requests: int = 0
+    """
+    Number of requests sent through the hedger.
+    """
+
+    hedged: int = 0
+    """
+    Number of requests for which a hedged request was sent.
+    """
+
+    wins: int = 0
+    """
+    Number of hedged requests that answered before the request they were racing.
+    """
+
+    @property
+    def hedge_rate(self) -> float:
+        """
+        :return: Share of requests that were hedged.
+        :rtype: float
+        """
+        return self.hedged / self.requests if self.requests else 0.0
+
+    @property
+    def win_rate(self) -> float:
+        """
+        :return: Share of hedged requests that answered first.
+        :rtype: float
+        """
+        return self.wins / self.hedged if self.hedged else 0.0
+
+
+class Hedger:
+    """
+    Hedges slow requests to one endpoint path. A request that has not answered after the ``percentile`` latency of the
+    most recent ``window_size`` requests (but at least ``min_delay`` seconds) is sent a second time, and whichever
+    attempt answers first is used. No request is hedged until ``minimum_samples`` latencies are recorded.
+
+    Hedged requests cost API quota, so each request earns ``max_ratio`` of a hedge and a hedge is only sent when a whole
+    one has been earned. This keeps the share of hedged requests, and the extra quota spent, below ``max_ratio``.
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        path: str,
+        percentile: float = 95.0,
+        min_delay: float = 0.05,
+        max_ratio: float = 0.05,
+        window_size: int = 100,
+        minimum_samples: int = 20,
+    ) -> None:
+        if not 0 < percentile < 100:
+            raise ValueError("'percentile' must be greater than 0 and less than 100.")
+        if not 0 < max_ratio <= 1:
+            raise ValueError("'max_ratio' must be greater than 0 and at most 1.")
+        if not 1 <= minimum_samples <= window_size:
+            raise ValueError("'minimum_samples' must be between 1 and 'window_size'.")
+
+        self.path: str = path
+        self.percentile: float = percentile
+        self.min_delay: float = min_delay
+        self.max_ratio: float = max_ratio
+        self.minimum_samples: int = minimum_samples
+        self._lock: Lock = Lock()
+        self._latencies: Deque[float] = deque(maxlen=window_size)
+        self._budget: float = 0.0
+        self._requests: int = 0
+        self._hedged: int = 0
+        self._wins: int = 0
+
+    @property
+    def stats(self) -> HedgeStats:
+        """
+        :return: Request, hedge and win counts so far.
+        :rtype: HedgeStats
+        """
+        with self._lock:
+            return HedgeStats(requests=self._requests, hedged=self._hedged, wins=self._wins)
+
+    @property
+    def delay(self) -> Optional[float]:
+        """
+        :return: Seconds to wait before hedging a request, or ``None`` while too few latencies are recorded.
+        :rtype: Optional[float]
+        """
+        with self._lock:
+            return self._delay()
+
+    def record(self, latency: float) -> None:
+        """
+        Records the latency of a request that received a response.
+
+        :param latency: How long the request took, in seconds.
+        :type latency: float
+        """
+
+        with self._lock:
+            self._latencies.append(latency)
+
+    def call(self, send: Callable[[], ResponseT]) -> ResponseT:
+        """
+        Sends a request, hedging it if it is slow to answer.
+
+        A request is sent on the calling thread unless a hedge has been earned for it, in which case it is sent from a
+        worker thread so that the calling thread can return whichever attempt answers first.
+
+        :param send: Performs a single HTTP request.
+        :return: The first response received.
+        """
+
+        delay: Optional[float] = self._admit()
+        if delay is None or not self._reserve_hedge():
+            return self._timed(send)
+
+        primary: Future[ResponseT] = _primaries.submit(partial(copy_context().run, self._timed, send))
+        if wait([primary], timeout=delay).done:
+            self._release_hedge()
+            return primary.result()
+        return self._race(primary, _hedges.submit(partial(copy_context().run, self._timed, send)))
+
+    async def acall(self, send: Callable[[], Awaitable[ResponseT]]) -> ResponseT:
+        """
+        Awaits a request, hedging it if it is slow to answer. The slower attempt is cancelled.
+
+        :param send: Performs a single HTTP request.
+        :return: The first response received.
+        """
+
+        delay: Optional[float] = self._admit()
+        if delay is None:
+            return await self._atimed(send)
+
+        primary: asyncio.Future[ResponseT] = asyncio.ensure_future(self._atimed(send))
+        try:
+            done, _ = await asyncio.wait([primary], timeout=delay)
+            if done or not self._reserve_hedge():
+                return await primary
+            return await self._arace(primary, asyncio.ensure_future(self._atimed(send)))
+        finally:
+            primary.cancel()
+
+    def _admit(self) -> Optional[float]:
+        with self._lock:
+            self._requests += 1
+            self._budget = min(self._budget + self.max_ratio, 1.0)
+            return self._delay()
+
+    def _delay(self) -> Optional[float]:
+        if len(self._latencies) < self.minimum_samples:
+            return None
+        ordered: List[float] = sorted(self._latencies)
+        rank: int = max(0, min(len(ordered) - 1, round(self.percentile / 100 * len(ordered)) - 1))
+        return max(self.min_delay, ordered[rank])
+
+    def _reserve_hedge(self) -> bool:
+        with self._lock:
+            if self._budget < 1.0:
+                return False
+            self._budget -= 1.0
+            return True
+
+    def _release_hedge(self) -> None:
+        with self._lock:
+            self._budget = min(self._budget + 1.0, 1.0)
+
+    def _race(self, primary: Future[ResponseT], hedge: Future[ResponseT]) -> ResponseT:
+        self._hedge_sent()
+        pending: Set[Future[ResponseT]] = {primary, hedge}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            answered: Optional[Future[ResponseT]] = _answered(done)
+            if answered is not None:
+                self._finish(won=answered is hedge)
+                return answered.result()
+        return primary.result()
+
+    async def _arace(self, primary: asyncio.Future[ResponseT], hedge: asyncio.Future[ResponseT]) -> ResponseT:
+        self._hedge_sent()
+        pending: Set[asyncio.Future[ResponseT]] = {primary, hedge}
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                answered: Optional[asyncio.Future[ResponseT]] = _answered(done)
+                if answered is not None:
+                    self._finish(won=answered is hedge)
+                    return answered.result()
+            return await primary
+        finally:
+            hedge.cancel()
+
+    def _hedge_sent(self) -> None:
+        with self._lock:
+            self._hedged += 1
+
+    def _finish(self, won: bool) -> None:
+        if won:
+            with self._lock:
+                self._wins += 1
+
+    def _timed(self, send: Callable[[], ResponseT]) -> ResponseT:
+        start: float = time.monotonic()
+        response: ResponseT = send()
+        self.record(time.monotonic() - start)
+        return response
+
+    async def _atimed(self, send: Callable[[], Awaitable[ResponseT]]) -> ResponseT:
+        start: float = time.monotonic()
+        response: ResponseT = await send()
+        self.record(time.monotonic() - start)
+        return response
+
+
+def _answered(done: Set[FutureT]) -> Optional[FutureT]:
+    # The first attempt that received a response, rather than failing or being cancelled.
+    return next((future for future in done if not future.cancelled() and future.exception() is None), None)
+
+
+# Only requests holding a reserved hedge are sent from a worker, and hedges have workers of their own so that slow
+# requests cannot keep them waiting.
+_primaries: ThreadPoolExecutor = ThreadPoolExecutor(max_workers=32, thread_name_prefix="yelpfusion3-hedge-primary")
+_hedges: ThreadPoolExecutor = ThreadPoolExecutor(max_workers=32, thread_name_prefix="yelpfusion3-hedge")
+_lock: Lock = Lock()
+_hedgers: Dict[str, Hedger] = {}
+
+
+@contextmanager
+def hedging(enabled: bool = True) -> Iterator[None]:
+    """
+    Turns hedging on or off for requests made within the ``with`` block, regardless of the ``hedge_requests`` setting.
+
+    .. code-block:: python
+
+        with hedging():
+            business = Client.business_details(business_id="WavvLdfdP6g8aZTtbBQHTw").get()
+
+    :param enabled: Whether to hedge requests.
+    :type enabled: bool
+    """
+
+    token = _hedging.set(enabled)
+    try:
+        yield
+    finally:
+        _hedging.reset(token)
+
+
+def hedging_enabled() -> bool:
+    """
+    :return: ``True`` if requests made in the current context should be hedged.
+    :rtype: bool
+    """
+
+    enabled: Optional[bool] = _hedging.get()
+    return get_settings().hedge_requests if enabled is None else enabled
+
+
+def get_hedger(path: str) -> Hedger:
+    """
+    Returns the hedger for an endpoint path, creating it from the ``hedge_*`` settings on first use.
+
+    :param path: Endpoint path, like ``/businesses/search`` or ``/businesses/{business_id}/reviews``.
+    :type path: str
+    :return: The hedger for ``path``.
+    :rtype: Hedger
+    """
+
+    hedger: Optional[Hedger] = _hedgers.get(path)
+    if hedger is None:
+        with _lock:
+            hedger = _hedgers.get(path)
+            if hedger is None:
+                settings: Settings = get_settings()
+                hedger = _hedgers[path] = Hedger(
+                    path=path,
+                    percentile=settings.hedge_percentile,
+                    min_delay=settings.hedge_min_delay,
+                    max_ratio=settings.hedge_max_ratio,
+                )
+    return hedger
+
+
+def hedgers() -> Dict[str, Hedger]:
+    """
+    Returns every hedger created so far, keyed by endpoint path, so their :py:attr:`~Hedger.stats` can be inspected.
+
+    :return: A snapshot of the hedger registry.
+    :rtype: Dict[str, Hedger]
+    """
+
+    with _lock:
+        return dict(_hedgers)
+
+
+def reset_hedgers() -> None:
+    """
+    Discards every hedger along with its latencies and statistics.
+    """
+
+    with _lock:
+        _hedgers.clear()
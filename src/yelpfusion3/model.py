@@ -7,6 +7,8 @@ from typing import List, Optional
 import pycountry
 from pydantic import BaseModel, constr, validator
 
+from yelpfusion3.serialization import dumps, loads
+
 
 class Model(BaseModel):  # pylint: disable=too-few-public-methods
     """
@@ -17,6 +19,8 @@ class Model(BaseModel):  # pylint: disable=too-few-public-methods
         anystr_strip_whitespace = True
         min_anystr_length = 0
         validate_assignment = True
+        json_loads = loads
+        json_dumps = dumps
 
 
 class Location(Model):
@@ -85,3 +89,26 @@ class Location(Model):
         if pycountry.countries.get(alpha_2=value):
             return value
         raise ValueError("Not a valid ISO 3166-1 alpha-2 country code.")
+
+
+class NegativeResult(Model):
+    """
+    Records, in the response cache, an endpoint request that Yelp answered as not found, like a business that does not
+    exist, when the ``cache_negative`` setting is enabled. Endpoints raise it again as
+    :py:class:`~yelpfusion3.exceptions.ApiError` rather than returning it.
+    """
+
+    status_code: int
+    """
+    HTTP status code of the response, ``404``.
+    """
+
+    code: Optional[str] = None
+    """
+    Yelp error code, like ``BUSINESS_NOT_FOUND``, if the response included one.
+    """
+
+    description: Optional[str] = None
+    """
+    Human-readable description of the error, if the response included one.
+    """
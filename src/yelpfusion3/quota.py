@@ -0,0 +1,211 @@
+"""
+Quota coordination between processes that share one Yelp API key on the same host.
+"""
+
+import asyncio
+import hashlib
+import sqlite3
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from threading import Lock, local
+from typing import Callable, Optional, Union
+
+from yelpfusion3.exceptions import QuotaExceededError
+from yelpfusion3.settings import Settings, get_settings
+from yelpfusion3.timeout import check_delay
+
+
+class QuotaCoordinator:
+    """
+    Tracks request usage for an API key in a SQLite database that every worker process on the host opens. Each
+    reservation runs in an exclusive SQLite transaction, so concurrent processes never over-commit the shared budget.
+
+    Two budgets are enforced: a number of requests per UTC day, and a number of requests per wall-clock second. When
+    the current second is full, the caller is handed the next second with spare capacity and told how long to wait for
+    it, so processes share the per-second budget fairly without busy waiting.
+    """
+
+    _PRUNE_AFTER: int = 60
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        per_day: Optional[int] = None,
+        per_second: Optional[int] = None,
+        api_key: Optional[str] = None,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        """
+        :param path: Location of the SQLite database. It is created if it doesn't exist.
+        :type path: Union[str, Path]
+        :param per_day: Requests per UTC day shared by all processes, or ``None`` for no limit.
+        :type per_day: int
+        :param per_second: Requests per second shared by all processes, or ``None`` for no limit.
+        :type per_second: int
+        :param api_key: API key whose usage is tracked. Only a hash of the key is stored. Defaults to
+            :py:attr:`~yelpfusion3.settings.Settings.api_key`.
+        :type api_key: str
+        :param clock: Wall-clock time, in seconds since the epoch. Override for testing.
+        :type clock: Callable[[], float]
+        """
+
+        if per_day is not None and per_day < 1:
+            raise ValueError("'per_day' must be at least 1.")
+        if per_second is not None and per_second < 1:
+            raise ValueError("'per_second' must be at least 1.")
+
+        self.path: Path = Path(path)
+        self.per_day: Optional[int] = per_day
+        self.per_second: Optional[int] = per_second
+        self._key: str = hashlib.sha256((api_key or get_settings().api_key or "").encode()).hexdigest()[:16]
+        self._clock: Callable[[], float] = clock
+        self._local: local = local()
+
+        connection: sqlite3.Connection = self._connection()
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute(
+            "CREATE TABLE IF NOT EXISTS usage ("
+            "key TEXT NOT NULL, window TEXT NOT NULL, count INTEGER NOT NULL, PRIMARY KEY (key, window))"
+        )
+
+    def used_today(self) -> int:
+        """
+        :return: Number of requests reserved today by all processes sharing the database.
+        :rtype: int
+        """
+
+        return self._count(self._connection(), self._day_window())
+
+    def reserve(self) -> float:
+        """
+        Reserves capacity for one request in the shared budgets without waiting for it.
+
+        :raise QuotaExceededError: If the daily budget has been used up by any of the processes.
+        :raise DeadlineExceededError: If capacity would only become available after the current deadline, in which case
+            nothing is reserved.
+        :return: Seconds the caller must wait before sending the request.
+        :rtype: float
+        """
+
+        connection: sqlite3.Connection = self._connection()
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            self._reserve_day(connection)
+            delay: float = self._reserve_second(connection)
+            check_delay(delay)
+            connection.execute("COMMIT")
+            return delay
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+
+    def acquire(self) -> None:
+        """
+        Blocks the calling thread until a request may be sent.
+
+        :raise QuotaExceededError: If the daily budget has been used up by any of the processes.
+        :raise DeadlineExceededError: If capacity would only become available after the current deadline.
+        """
+
+        time.sleep(self.reserve())
+
+    async def aacquire(self) -> None:
+        """
+        Suspends the calling task until a request may be sent.
+
+        :raise QuotaExceededError: If the daily budget has been used up by any of the processes.
+        :raise DeadlineExceededError: If capacity would only become available after the current deadline.
+        """
+
+        # The reservation waits on the database lock that other processes hold, so it runs off the event loop.
+        await asyncio.sleep(await asyncio.to_thread(self.reserve))
+
+    def _reserve_day(self, connection: sqlite3.Connection) -> None:
+        window: str = self._day_window()
+        if self.per_day is not None and self._count(connection, window) >= self.per_day:
+            raise QuotaExceededError(f"Shared daily budget of {self.per_day} requests has been used up.")
+        self._increment(connection, window)
+
+    def _reserve_second(self, connection: sqlite3.Connection) -> float:
+        if self.per_second is None:
+            return 0.0
+
+        now: float = self._clock()
+        second: int = int(now)
+        connection.execute(
+            "DELETE FROM usage WHERE key = ? AND window LIKE 's:%' AND CAST(SUBSTR(window, 3) AS INTEGER) < ?",
+            (self._key, second - self._PRUNE_AFTER),
+        )
+        while self._count(connection, f"s:{second}") >= self.per_second:
+            second += 1
+        self._increment(connection, f"s:{second}")
+        return max(0.0, second - now)
+
+    def _count(self, connection: sqlite3.Connection, window: str) -> int:
+        row = connection.execute("SELECT count FROM usage WHERE key = ? AND window = ?", (self._key, window)).fetchone()
+        return row[0] if row else 0
+
+    def _increment(self, connection: sqlite3.Connection, window: str) -> None:
+        connection.execute(
+            "INSERT INTO usage (key, window, count) VALUES (?, ?, 1) "
+            "ON CONFLICT (key, window) DO UPDATE SET count = count + 1",
+            (self._key, window),
+        )
+
+    def _day_window(self) -> str:
+        return f"d:{datetime.fromtimestamp(self._clock(), tz=timezone.utc).date().isoformat()}"
+
+    def _connection(self) -> sqlite3.Connection:
+        connection: Optional[sqlite3.Connection] = getattr(self._local, "connection", None)
+        if connection is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            connection = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            self._local.connection = connection
+        return connection
+
+
+_lock: Lock = Lock()
+_quota_coordinator: Optional[QuotaCoordinator] = None
+_configured: bool = False
+
+
+def get_quota_coordinator() -> Optional[QuotaCoordinator]:
+    """
+    Returns the quota coordinator checked before every endpoint request. Unless replaced with
+    :py:func:`set_quota_coordinator`, it is created on first use from the ``quota_*`` settings, and is ``None`` when
+    ``quota_path`` is not set.
+
+    :return: The shared quota coordinator, if any.
+    :rtype: Optional[QuotaCoordinator]
+    """
+
+    global _quota_coordinator, _configured  # pylint: disable=global-statement
+    if not _configured:
+        with _lock:
+            if not _configured:
+                settings: Settings = get_settings()
+                if settings.quota_path:
+                    _quota_coordinator = QuotaCoordinator(
+                        path=settings.quota_path,
+                        per_day=settings.quota_per_day,
+                        per_second=settings.quota_per_second,
+                        api_key=settings.api_key,
+                    )
+                _configured = True
+    return _quota_coordinator
+
+
+def set_quota_coordinator(quota_coordinator: Optional[QuotaCoordinator]) -> None:
+    """
+    Replaces the quota coordinator checked before every endpoint request. Pass ``None`` to recreate it from settings on
+    next use.
+
+    :param quota_coordinator: The coordinator every endpoint request should check.
+    :type quota_coordinator: Optional[QuotaCoordinator]
+    """
+
+    global _quota_coordinator, _configured  # pylint: disable=global-statement
+    with _lock:
+        _quota_coordinator = quota_coordinator
+        _configured = quota_coordinator is not None
@@ -0,0 +1,166 @@
+"""
+Client-side rate limiting shared by all Yelp Fusion endpoints.
+"""
+
+import asyncio
+import time
+from datetime import datetime, timezone
+from threading import Lock
+from typing import Callable, Optional, Tuple
+
+from yelpfusion3.exceptions import QuotaExceededError
+from yelpfusion3.settings import Settings, get_settings
+from yelpfusion3.timeout import check_delay
+
+
+class RateLimiter:
+    """
+    A token bucket limiting requests per second, combined with a budget of requests per UTC day.
+
+    Callers reserve a slot in the bucket before they wait, so blocked callers are released in the order they arrived
+    and sleep exactly once instead of polling. The limiter is safe to share across threads and asyncio tasks; use
+    :py:meth:`acquire` from threads and :py:meth:`aacquire` from coroutines.
+    """
+
+    def __init__(
+        self,
+        per_second: Optional[float] = None,
+        burst: int = 1,
+        per_day: Optional[int] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        :param per_second: Sustained requests per second, or ``None`` for no limit.
+        :type per_second: float
+        :param burst: Number of requests that may be sent back-to-back after the limiter has been idle.
+        :type burst: int
+        :param per_day: Requests allowed per UTC day, or ``None`` for no limit.
+        :type per_day: int
+        :param clock: Monotonic clock, in seconds. Override for testing.
+        :type clock: Callable[[], float]
+        """
+
+        if per_second is not None and per_second <= 0:
+            raise ValueError("'per_second' must be positive.")
+        if burst < 1:
+            raise ValueError("'burst' must be at least 1.")
+        if per_day is not None and per_day < 1:
+            raise ValueError("'per_day' must be at least 1.")
+
+        self.per_second: Optional[float] = per_second
+        self.burst: int = burst
+        self.per_day: Optional[int] = per_day
+        self._clock: Callable[[], float] = clock
+        self._lock: Lock = Lock()
+        self._next_slot: float = float("-inf")
+        self._day: str = ""
+        self._used_today: int = 0
+
+    @property
+    def used_today(self) -> int:
+        """
+        :return: Number of requests admitted so far during the current UTC day.
+        :rtype: int
+        """
+        with self._lock:
+            return self._used_today if self._day == self._today() else 0
+
+    def reserve(self) -> float:
+        """
+        Reserves the next available request slot without waiting for it.
+
+        :raise QuotaExceededError: If the daily budget has been used up.
+        :raise DeadlineExceededError: If the slot would only become available after the current deadline, in which case
+            nothing is reserved.
+        :return: Seconds the caller must wait before sending the request.
+        :rtype: float
+        """
+
+        with self._lock:
+            self._check_budget()
+            next_slot, delay = self._next_free_slot()
+            check_delay(delay)
+            self._next_slot = next_slot
+            self._used_today += 1
+            return delay
+
+    def acquire(self) -> None:
+        """
+        Blocks the calling thread until a request may be sent.
+
+        :raise QuotaExceededError: If the daily budget has been used up.
+        :raise DeadlineExceededError: If the slot would only become available after the current deadline.
+        """
+
+        time.sleep(self.reserve())
+
+    async def aacquire(self) -> None:
+        """
+        Suspends the calling task until a request may be sent, without blocking the event loop.
+
+        :raise QuotaExceededError: If the daily budget has been used up.
+        :raise DeadlineExceededError: If the slot would only become available after the current deadline.
+        """
+
+        await asyncio.sleep(self.reserve())
+
+    def _check_budget(self) -> None:
+        today: str = self._today()
+        if today != self._day:
+            self._day = today
+            self._used_today = 0
+        if self.per_day is not None and self._used_today >= self.per_day:
+            raise QuotaExceededError(f"Daily budget of {self.per_day} requests has been used up.")
+
+    def _next_free_slot(self) -> Tuple[float, float]:
+        # Returns the slot that follows the next free one, and the seconds until the next free one.
+        if self.per_second is None:
+            return self._next_slot, 0.0
+
+        interval: float = 1.0 / self.per_second
+        now: float = self._clock()
+        slot: float = max(self._next_slot, now - (self.burst - 1) * interval)
+        return slot + interval, max(0.0, slot - now)
+
+    @staticmethod
+    def _today() -> str:
+        return datetime.now(tz=timezone.utc).date().isoformat()
+
+
+_lock: Lock = Lock()
+_rate_limiter: Optional[RateLimiter] = None
+
+
+def get_rate_limiter() -> RateLimiter:
+    """
+    Returns the process-wide rate limiter that every endpoint request passes through. Unless replaced with
+    :py:func:`set_rate_limiter`, it is created on first use from the ``rate_limit_*`` settings.
+
+    :return: The shared rate limiter.
+    :rtype: RateLimiter
+    """
+
+    global _rate_limiter  # pylint: disable=global-statement
+    if _rate_limiter is None:
+        with _lock:
+            if _rate_limiter is None:
+                settings: Settings = get_settings()
+                _rate_limiter = RateLimiter(
+                    per_second=settings.rate_limit_per_second,
+                    burst=settings.rate_limit_burst,
+                    per_day=settings.rate_limit_per_day,
+                )
+    return _rate_limiter
+
+
+def set_rate_limiter(rate_limiter: Optional[RateLimiter]) -> None:
+    """
+    Replaces the process-wide rate limiter. Pass ``None`` to recreate it from settings on next use.
+
+    :param rate_limiter: The rate limiter every endpoint request should pass through.
+    :type rate_limiter: RateLimiter
+    """
+
+    global _rate_limiter  # pylint: disable=global-statement
+    with _lock:
+        _rate_limiter = rate_limiter
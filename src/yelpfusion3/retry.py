@@ -0,0 +1,242 @@
+"""
+Retries with capped exponential backoff for transient Yelp Fusion failures.
+"""
+
+import asyncio
+import random
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from threading import Lock
+from typing import Any, Awaitable, Callable, FrozenSet, Optional, Tuple, Type, TypeVar
+
+import requests
+from pydantic import BaseModel, NonNegativeFloat, PositiveFloat, PositiveInt
+
+from yelpfusion3.exceptions import ApiError
+from yelpfusion3.settings import Settings, get_settings
+from yelpfusion3.timeout import remaining
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover
+    httpx = None
+
+ResponseT = TypeVar("ResponseT")
+
+TRANSIENT_ERRORS: Tuple[Type[BaseException], ...] = (requests.ConnectionError, requests.Timeout) + (
+    (httpx.TransportError,) if httpx else ()
+)
+"""
+Transport-level exceptions that are retried like a retryable status code.
+"""
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Parses the value of a ``Retry-After`` response header.
+
+    :param value: Either a number of seconds or an HTTP date.
+    :type value: str
+    :return: Seconds to wait, or ``None`` if ``value`` is missing or malformed.
+    :rtype: Optional[float]
+    """
+
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        return _seconds_until(value)
+
+
+def _seconds_until(date: str) -> Optional[float]:
+    try:
+        return max(0.0, (parsedate_to_datetime(date) - datetime.now(tz=timezone.utc)).total_seconds())
+    except (TypeError, ValueError):
+        return None
+
+
+def check_response(response: ResponseT) -> ResponseT:
+    """
+    Raises an :py:class:`~yelpfusion3.exceptions.ApiError` if ``response`` has an error status code.
+
+    :param response: The HTTP response.
+    :raise ApiError: If the status code is 400 or higher.
+    :return: ``response`` if it was successful.
+    """
+
+    status_code: int = response.status_code  # type: ignore[attr-defined]
+    if status_code < 400:
+        return response
+    try:
+        error: dict = response.json().get("error") or {}  # type: ignore[attr-defined]
+    except ValueError:
+        error = {}
+    raise ApiError(status_code=status_code, code=error.get("code"), description=error.get("description"))
+
+
+class RetryPolicy(BaseModel):
+    """
+    Describes how failed requests are retried.
+
+    Responses with a status code in ``retry_statuses``, and transport errors such as connection resets and timeouts,
+    are retried up to ``max_attempts`` times in total. Each wait is drawn uniformly between zero and
+    ``backoff_base * 2 ** (retry - 1)`` capped at ``backoff_max`` ("full jitter"), unless the response carries a
+    ``Retry-After`` header, which is honored instead. A call gives up early once its waits would exceed
+    ``retry_budget`` seconds, or once the next attempt could not start before the current
+    :py:func:`~yelpfusion3.timeout.deadline`. Every other error status code fails immediately.
+    """
+
+    class Config:  # pylint: disable=C0115,too-few-public-methods
+        allow_mutation = False
+
+    max_attempts: PositiveInt = 3
+    backoff_base: PositiveFloat = 0.5
+    backoff_max: PositiveFloat = 10.0
+    retry_budget: NonNegativeFloat = 30.0
+    retry_statuses: FrozenSet[int] = frozenset({429, 500, 502, 503, 504})
+
+    def backoff(self, retry: int, retry_after: Optional[float] = None) -> float:
+        """
+        Computes how long to wait before the given retry.
+
+        :param retry: One-based number of the retry, so ``1`` for the second attempt.
+        :type retry: int
+        :param retry_after: Delay requested by the server through ``Retry-After``, if any.
+        :type retry_after: float
+        :return: Seconds to wait.
+        :rtype: float
+        """
+
+        if retry_after is not None:
+            return retry_after
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * 2 ** (retry - 1)))  # nosec B311
+
+    def call(self, send: Callable[[], ResponseT]) -> ResponseT:
+        """
+        Calls ``send`` until it returns a successful response or the policy gives up.
+
+        :param send: Performs a single HTTP request.
+        :raise ApiError: If the last response had an error status code.
+        :return: The successful response.
+        """
+
+        attempt: _Attempt = _Attempt(self)
+        while True:
+            response, error = _try(send)
+            delay: Optional[float] = attempt.next_delay(response, error)
+            if delay is None:
+                return _result(response, error)
+            time.sleep(delay)
+
+    async def acall(self, send: Callable[[], Awaitable[ResponseT]]) -> ResponseT:
+        """
+        Awaits ``send`` until it returns a successful response or the policy gives up.
+
+        :param send: Performs a single HTTP request.
+        :raise ApiError: If the last response had an error status code.
+        :return: The successful response.
+        """
+
+        attempt: _Attempt = _Attempt(self)
+        while True:
+            response, error = await _atry(send)
+            delay: Optional[float] = attempt.next_delay(response, error)
+            if delay is None:
+                return _result(response, error)
+            await asyncio.sleep(delay)
+
+
+class _Attempt:  # pylint: disable=too-few-public-methods
+    """
+    Per-call retry bookkeeping.
+    """
+
+    def __init__(self, policy: RetryPolicy) -> None:
+        self.policy: RetryPolicy = policy
+        self.attempts: int = 0
+        self.waited: float = 0.0
+
+    def next_delay(self, response: Any, error: Optional[BaseException]) -> Optional[float]:
+        self.attempts += 1
+        if self.attempts >= self.policy.max_attempts or not self._retryable(response, error):
+            return None
+        retry_after: Optional[float] = (
+            parse_retry_after(response.headers.get("Retry-After")) if response is not None else None
+        )
+        delay: float = self.policy.backoff(self.attempts, retry_after)
+        if self.waited + delay > self.policy.retry_budget or not _fits_deadline(delay):
+            return None
+        self.waited += delay
+        return delay
+
+    def _retryable(self, response: Any, error: Optional[BaseException]) -> bool:
+        if error is not None:
+            return True
+        return response.status_code in self.policy.retry_statuses
+
+
+def _fits_deadline(delay: float) -> bool:
+    seconds: Optional[float] = remaining()
+    return seconds is None or delay < seconds
+
+
+def _try(send: Callable[[], ResponseT]) -> Tuple[Optional[ResponseT], Optional[BaseException]]:
+    try:
+        return send(), None
+    except TRANSIENT_ERRORS as error:
+        return None, error
+
+
+async def _atry(send: Callable[[], Awaitable[ResponseT]]) -> Tuple[Optional[ResponseT], Optional[BaseException]]:
+    try:
+        return await send(), None
+    except TRANSIENT_ERRORS as error:
+        return None, error
+
+
+def _result(response: Optional[ResponseT], error: Optional[BaseException]) -> ResponseT:
+    if error is not None:
+        raise error
+    return check_response(response)
+
+
+_lock: Lock = Lock()
+_retry_policy: Optional[RetryPolicy] = None
+
+
+def get_retry_policy() -> RetryPolicy:
+    """
+    Returns the retry policy applied to every endpoint request. Unless replaced with :py:func:`set_retry_policy`, it is
+    created on first use from the ``retry_*`` settings.
+
+    :return: The shared retry policy.
+    :rtype: RetryPolicy
+    """
+
+    global _retry_policy  # pylint: disable=global-statement
+    if _retry_policy is None:
+        with _lock:
+            if _retry_policy is None:
+                settings: Settings = get_settings()
+                _retry_policy = RetryPolicy(
+                    max_attempts=settings.retry_max_attempts,
+                    backoff_base=settings.retry_backoff_base,
+                    backoff_max=settings.retry_backoff_max,
+                    retry_budget=settings.retry_budget,
+                )
+    return _retry_policy
+
+
+def set_retry_policy(retry_policy: Optional[RetryPolicy]) -> None:
+    """
+    Replaces the retry policy applied to every endpoint request. Pass ``None`` to recreate it from settings on next use.
+
+    :param retry_policy: The retry policy to use. ``RetryPolicy(max_attempts=1)`` disables retries.
+    :type retry_policy: RetryPolicy
+    """
+
+    global _retry_policy  # pylint: disable=global-statement
+    with _lock:
+        _retry_policy = retry_policy
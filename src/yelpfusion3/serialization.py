@@ -0,0 +1,142 @@
+"""
+Pluggable JSON backends for decoding responses and serializing models.
+"""
+
+import json
+from threading import Lock
+from typing import Any, Callable, Dict, Optional, Union
+
+from yelpfusion3.settings import get_settings
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+
+class JsonBackend:
+    """
+    Decodes and encodes JSON with the standard library. Subclasses plug in faster implementations.
+    """
+
+    name: str = "stdlib"
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        """
+        Decodes a JSON document.
+
+        :param data: The document, as UTF-8 bytes or text.
+        :type data: Union[bytes, str]
+        :raise ValueError: If ``data`` is not valid JSON.
+        :return: The decoded value.
+        """
+        return json.loads(data)
+
+    def dumps(self, value: Any, *, default: Optional[Callable[[Any], Any]] = None, **kwargs: Any) -> str:
+        """
+        Encodes a value as a JSON document. The signature matches the ``json_dumps`` hook of pydantic models.
+
+        :param value: The value to encode.
+        :param default: Called with objects that cannot otherwise be encoded, and returns an encodable replacement.
+        :param kwargs: Further options understood by :py:func:`json.dumps`, like ``indent`` or ``sort_keys``.
+        :return: The JSON document.
+        :rtype: str
+        """
+        return json.dumps(value, default=default, **kwargs)
+
+
+class OrjsonBackend(JsonBackend):
+    """
+    Decodes and encodes JSON with `orjson <https://github.com/ijl/orjson>`_. Encoding options that orjson does not
+    support, like ``indent=4``, fall back to the standard library.
+    """
+
+    name: str = "orjson"
+
+    def __init__(self) -> None:
+        if orjson is None:
+            raise ImportError("orjson is not installed. Install it with 'pip install yelpfusion3[fast]'.")
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        return orjson.loads(data)
+
+    def dumps(self, value: Any, *, default: Optional[Callable[[Any], Any]] = None, **kwargs: Any) -> str:
+        sort_keys: bool = kwargs.pop("sort_keys", False)
+        indent: Optional[int] = kwargs.pop("indent", None)
+        if kwargs or indent not in (None, 2):
+            return super().dumps(value, default=default, sort_keys=sort_keys, indent=indent, **kwargs)
+        option: int = (orjson.OPT_SORT_KEYS if sort_keys else 0) | (orjson.OPT_INDENT_2 if indent == 2 else 0)
+        try:
+            return orjson.dumps(value, default=default, option=option).decode()
+        except TypeError:
+            # Raised for non-string keys, among others, which the standard library can encode.
+            return super().dumps(value, default=default, sort_keys=sort_keys, indent=indent)
+
+
+BACKENDS: Dict[str, Callable[[], JsonBackend]] = {"stdlib": JsonBackend, "orjson": OrjsonBackend}
+"""
+JSON backends by name, as accepted by the ``json_backend`` setting.
+"""
+
+_lock: Lock = Lock()
+_json_backend: Optional[JsonBackend] = None
+
+
+def get_json_backend() -> JsonBackend:
+    """
+    Returns the JSON backend used to decode responses and serialize models. Unless replaced with
+    :py:func:`set_json_backend`, it is created on first use from the ``json_backend`` setting, which defaults to orjson
+    when it is installed and to the standard library otherwise.
+
+    :return: The shared JSON backend.
+    :rtype: JsonBackend
+    """
+
+    global _json_backend  # pylint: disable=global-statement
+    if _json_backend is None:
+        with _lock:
+            if _json_backend is None:
+                name: Optional[str] = get_settings().json_backend
+                _json_backend = BACKENDS[name or ("orjson" if orjson else "stdlib")]()
+    return _json_backend
+
+
+def set_json_backend(json_backend: Optional[JsonBackend]) -> None:
+    """
+    Replaces the JSON backend used to decode responses and serialize models. Pass ``None`` to recreate it from settings
+    on next use.
+
+    :param json_backend: The JSON backend to use.
+    :type json_backend: JsonBackend
+    """
+
+    global _json_backend  # pylint: disable=global-statement
+    with _lock:
+        _json_backend = json_backend
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    """
+    Decodes a JSON document with the current backend.
+
+    :param data: The document, as UTF-8 bytes or text.
+    :type data: Union[bytes, str]
+    :raise ValueError: If ``data`` is not valid JSON.
+    :return: The decoded value.
+    """
+
+    return get_json_backend().loads(data)
+
+
+def dumps(value: Any, *, default: Optional[Callable[[Any], Any]] = None, **kwargs: Any) -> str:
+    """
+    Encodes a value as a JSON document with the current backend.
+
+    :param value: The value to encode.
+    :param default: Called with objects that cannot otherwise be encoded, and returns an encodable replacement.
+    :param kwargs: Further options understood by :py:func:`json.dumps`, like ``indent`` or ``sort_keys``.
+    :return: The JSON document.
+    :rtype: str
+    """
+
+    return get_json_backend().dumps(value, default=default, **kwargs)
@@ -0,0 +1,160 @@
+"""
+Shared, thread-safe HTTP connection pool used by all Yelp Fusion endpoints.
+"""
+
+import asyncio
+from threading import Lock
+from typing import TYPE_CHECKING, Optional
+from weakref import WeakKeyDictionary
+
+from requests import Session
+from requests.adapters import HTTPAdapter
+
+from yelpfusion3.settings import Settings, get_settings
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover
+    httpx = None
+
+if TYPE_CHECKING:  # pragma: no cover
+    from httpx import AsyncClient
+
+_lock: Lock = Lock()
+_session: Optional[Session] = None
+_async_sessions: "WeakKeyDictionary[asyncio.AbstractEventLoop, AsyncClient]" = WeakKeyDictionary()
+
+
+def create_session(settings: Optional[Settings] = None) -> Session:
+    """
+    Creates a new :py:class:`~requests.Session` whose connection pool is sized according to ``settings``.
+
+    ``pool_connections`` controls how many per-host pools are kept, ``pool_maxsize`` caps the number of keep-alive
+    connections held open to a single host, and ``pool_block`` turns that cap into a hard per-host limit by making
+    callers wait for a free connection instead of opening a throwaway one.
+
+    :param settings: Settings to read the pool configuration from. Defaults to the shared settings from
+        :py:func:`~yelpfusion3.settings.get_settings`.
+    :type settings: Settings
+    :return: A new, configured session.
+    :rtype: Session
+    """
+
+    settings = settings or get_settings()
+    adapter: HTTPAdapter = HTTPAdapter(
+        pool_connections=settings.pool_connections,
+        pool_maxsize=settings.pool_maxsize,
+        pool_block=settings.pool_block,
+    )
+    session: Session = Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    if not settings.keep_alive:
+        session.headers["Connection"] = "close"
+    return session
+
+
+def get_session() -> Session:
+    """
+    Returns the process-wide session shared by every endpoint, creating it on first use.
+
+    :return: The shared session.
+    :rtype: Session
+    """
+
+    global _session  # pylint: disable=global-statement
+    if _session is None:
+        with _lock:
+            if _session is None:
+                _session = create_session()
+    return _session
+
+
+def close_session() -> None:
+    """
+    Closes the shared session and its pooled connections. The next call to :py:func:`get_session` creates a new one,
+    which picks up any changed pool settings.
+    """
+
+    global _session  # pylint: disable=global-statement
+    with _lock:
+        if _session is not None:
+            _session.close()
+            _session = None
+
+
+def create_async_session(settings: Optional[Settings] = None) -> "AsyncClient":
+    """
+    Creates a new :py:class:`httpx.AsyncClient` whose connection pool is sized according to ``settings``.
+
+    ``async_max_connections`` caps the number of connections, and therefore in-flight requests, to Yelp. Idle
+    connections are kept alive for reuse unless ``keep_alive`` is disabled. Requests are multiplexed over HTTP/2 when
+    ``http2`` is enabled.
+
+    :param settings: Settings to read the pool configuration from. Defaults to the shared settings from
+        :py:func:`~yelpfusion3.settings.get_settings`.
+    :type settings: Settings
+    :raise ImportError: If the optional ``httpx`` dependency is not installed.
+    :return: A new, configured asynchronous client.
+    :rtype: httpx.AsyncClient
+    """
+
+    if httpx is None:
+        raise ImportError("The asyncio client requires httpx. Install it with 'pip install yelpfusion3[async]'.")
+
+    settings = settings or get_settings()
+    return httpx.AsyncClient(limits=_limits(settings), http2=settings.http2)
+
+
+def create_http2_session(settings: Optional[Settings] = None) -> "AsyncClient":
+    """
+    Creates a new :py:class:`httpx.AsyncClient` that multiplexes requests over HTTP/2 connections, negotiated through
+    TLS ALPN. Concurrent requests to Yelp share one connection, and ``async_max_connections`` caps how many are opened.
+
+    :param settings: Settings to read the pool configuration from. Defaults to the shared settings from
+        :py:func:`~yelpfusion3.settings.get_settings`.
+    :type settings: Settings
+    :raise ImportError: If the optional ``httpx`` and ``h2`` dependencies are not installed.
+    :return: A new, configured HTTP/2 client.
+    :rtype: httpx.AsyncClient
+    """
+
+    if httpx is None:
+        raise ImportError("The HTTP/2 client requires httpx. Install it with 'pip install yelpfusion3[http2]'.")
+
+    return httpx.AsyncClient(limits=_limits(settings or get_settings()), http2=True)
+
+
+def _limits(settings: Settings) -> "httpx.Limits":
+    return httpx.Limits(
+        max_connections=settings.async_max_connections,
+        max_keepalive_connections=settings.async_max_connections if settings.keep_alive else 0,
+    )
+
+
+def get_async_session() -> "AsyncClient":
+    """
+    Returns the asynchronous client shared by every endpoint on the running event loop, creating it on first use.
+
+    Connections cannot be shared across event loops, so each loop gets its own pool.
+
+    :return: The shared asynchronous client for the running event loop.
+    :rtype: httpx.AsyncClient
+    """
+
+    loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+    session: Optional["AsyncClient"] = _async_sessions.get(loop)
+    if session is None or session.is_closed:
+        session = create_async_session()
+        _async_sessions[loop] = session
+    return session
+
+
+async def aclose_session() -> None:
+    """
+    Closes the asynchronous client shared on the running event loop and its pooled connections.
+    """
+
+    session: Optional["AsyncClient"] = _async_sessions.pop(asyncio.get_running_loop(), None)
+    if session is not None:
+        await session.aclose()
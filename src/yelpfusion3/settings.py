@@ -2,9 +2,10 @@
 Application-wide repository for shared configuration settings.
 """
 
-from typing import Optional
+from pathlib import Path
+from typing import Literal, Optional
 
-from pydantic import BaseSettings, Field, HttpUrl, parse_obj_as
+from pydantic import BaseSettings, Field, HttpUrl, NonNegativeFloat, PositiveFloat, PositiveInt, confloat, parse_obj_as
 
 
 class Settings(BaseSettings):
@@ -15,6 +16,240 @@ class Settings(BaseSettings):
     api_key: Optional[str] = Field(default=None, env="YELP_API_KEY")
     base_url: HttpUrl = parse_obj_as(HttpUrl, "https://api.yelp.com/v3")
 
+    pool_connections: PositiveInt = Field(default=10, env="YELP_POOL_CONNECTIONS")
+    """
+    Number of per-host connection pools kept by the shared session.
+    """
+
+    pool_maxsize: PositiveInt = Field(default=10, env="YELP_POOL_MAXSIZE")
+    """
+    Maximum number of keep-alive connections held open to a single host.
+    """
+
+    pool_block: bool = Field(default=False, env="YELP_POOL_BLOCK")
+    """
+    When ``True``, ``pool_maxsize`` is a hard per-host limit and callers wait for a free connection.
+    """
+
+    async_max_connections: PositiveInt = Field(default=100, env="YELP_ASYNC_MAX_CONNECTIONS")
+    """
+    Maximum number of concurrent connections opened by the shared asynchronous client on each event loop.
+    """
+
+    keep_alive: bool = Field(default=True, env="YELP_KEEP_ALIVE")
+    """
+    When ``False``, connections are closed after every request instead of being returned to the pool.
+    """
+
+    warmup_connections: Optional[PositiveInt] = Field(default=None, env="YELP_WARMUP_CONNECTIONS")
+    """
+    Number of connections opened ahead of time by :py:func:`~yelpfusion3.warmup.warmup`. Defaults to ``pool_maxsize``.
+    """
+
+    http2: bool = Field(default=False, env="YELP_HTTP2")
+    """
+    When ``True``, requests are multiplexed over HTTP/2 connections, so concurrent requests share a single connection to
+    Yelp. Requires the ``http2`` extra.
+    """
+
+    rate_limit_per_second: Optional[PositiveFloat] = Field(default=None, env="YELP_RATE_LIMIT_PER_SECOND")
+    """
+    Sustained requests per second allowed by the shared rate limiter. Unlimited when not set.
+    """
+
+    rate_limit_burst: PositiveInt = Field(default=1, env="YELP_RATE_LIMIT_BURST")
+    """
+    Number of requests the shared rate limiter lets through back-to-back after being idle.
+    """
+
+    rate_limit_per_day: Optional[PositiveInt] = Field(default=None, env="YELP_RATE_LIMIT_PER_DAY")
+    """
+    Requests per UTC day allowed by the shared rate limiter. Unlimited when not set.
+    """
+
+    quota_path: Optional[Path] = Field(default=None, env="YELP_QUOTA_PATH")
+    """
+    SQLite database used to share the API key's quota between processes on this host. Disabled when not set.
+    """
+
+    quota_per_day: Optional[PositiveInt] = Field(default=None, env="YELP_QUOTA_PER_DAY")
+    """
+    Requests per UTC day shared by every process using ``quota_path``. Unlimited when not set.
+    """
+
+    quota_per_second: Optional[PositiveInt] = Field(default=None, env="YELP_QUOTA_PER_SECOND")
+    """
+    Requests per second shared by every process using ``quota_path``. Unlimited when not set.
+    """
+
+    retry_max_attempts: PositiveInt = Field(default=3, env="YELP_RETRY_MAX_ATTEMPTS")
+    """
+    Maximum number of attempts per request, including the first one. ``1`` disables retries.
+    """
+
+    retry_backoff_base: PositiveFloat = Field(default=0.5, env="YELP_RETRY_BACKOFF_BASE")
+    """
+    Upper bound of the first retry's jittered backoff, in seconds. It doubles with every further retry.
+    """
+
+    retry_backoff_max: PositiveFloat = Field(default=10.0, env="YELP_RETRY_BACKOFF_MAX")
+    """
+    Cap on the backoff between two attempts, in seconds.
+    """
+
+    retry_budget: NonNegativeFloat = Field(default=30.0, env="YELP_RETRY_BUDGET")
+    """
+    Maximum total time a single request may spend waiting between retries, in seconds.
+    """
+
+    coalesce_requests: bool = Field(default=True, env="YELP_COALESCE_REQUESTS")
+    """
+    When ``True``, concurrent requests for the same endpoint URL share a single HTTP request and parsed model.
+    """
+
+    circuit_breaker: bool = Field(default=False, env="YELP_CIRCUIT_BREAKER")
+    """
+    When ``True``, requests go through a circuit breaker per endpoint path that fails fast while Yelp is degraded.
+    Disabled by default.
+    """
+
+    breaker_failure_rate: confloat(gt=0, le=1) = Field(default=0.5, env="YELP_BREAKER_FAILURE_RATE")
+    """
+    Share of failed requests (5xx or transport errors) within the window that opens a circuit.
+    """
+
+    breaker_slow_call_duration: PositiveFloat = Field(default=10.0, env="YELP_BREAKER_SLOW_CALL_DURATION")
+    """
+    Duration, in seconds, above which a request counts as slow.
+    """
+
+    breaker_slow_call_rate: confloat(gt=0, le=1) = Field(default=0.8, env="YELP_BREAKER_SLOW_CALL_RATE")
+    """
+    Share of slow requests within the window that opens a circuit.
+    """
+
+    breaker_window_size: PositiveInt = Field(default=20, env="YELP_BREAKER_WINDOW_SIZE")
+    """
+    Number of most recent requests a circuit breaker bases its decisions on.
+    """
+
+    breaker_minimum_calls: PositiveInt = Field(default=10, env="YELP_BREAKER_MINIMUM_CALLS")
+    """
+    Number of requests a circuit breaker must record before it may open.
+    """
+
+    breaker_open_duration: PositiveFloat = Field(default=30.0, env="YELP_BREAKER_OPEN_DURATION")
+    """
+    Seconds an open circuit rejects requests before letting a probe request through.
+    """
+
+    hedge_requests: bool = Field(default=False, env="YELP_HEDGE_REQUESTS")
+    """
+    When ``True``, a request that has not answered after the ``hedge_percentile`` latency of its endpoint path is sent a
+    second time, and whichever response arrives first is used.
+    """
+
+    hedge_percentile: confloat(gt=0, lt=100) = Field(default=95.0, env="YELP_HEDGE_PERCENTILE")
+    """
+    Percentile of recent request latencies after which a hedged request is sent.
+    """
+
+    hedge_min_delay: NonNegativeFloat = Field(default=0.05, env="YELP_HEDGE_MIN_DELAY")
+    """
+    Minimum time, in seconds, to wait before sending a hedged request.
+    """
+
+    hedge_max_ratio: confloat(gt=0, le=1) = Field(default=0.05, env="YELP_HEDGE_MAX_RATIO")
+    """
+    Maximum share of requests that may be hedged, capping the extra API quota spent on hedging.
+    """
+
+    json_backend: Optional[Literal["orjson", "stdlib"]] = Field(default=None, env="YELP_JSON_BACKEND")
+    """
+    JSON library used to decode responses and serialize models. Defaults to ``orjson`` when it is installed, and to
+    the standard library ``json`` module otherwise.
+    """
+
+    cache: Optional[Literal["memory", "compressed", "sqlite"]] = Field(default=None, env="YELP_CACHE")
+    """
+    Backend of the response cache consulted by endpoint ``get`` and ``aget`` calls: ``memory`` keeps parsed models,
+    ``compressed`` keeps compressed bodies in a memory budget and parses them on each hit, and ``sqlite`` keeps them on
+    disk. Responses are not cached when not set.
+    """
+
+    cache_max_entries: PositiveInt = Field(default=1024, env="YELP_CACHE_MAX_ENTRIES")
+    """
+    Maximum number of responses kept by the ``memory`` response cache before the least recently used is evicted.
+    """
+
+    cache_max_memory: PositiveInt = Field(default=64 * 1024 * 1024, env="YELP_CACHE_MAX_MEMORY")
+    """
+    Size of the compressed response bodies above which the ``compressed`` response cache evicts the least recently
+    used entries.
+    """
+
+    cache_stale_while_revalidate: bool = Field(default=False, env="YELP_CACHE_STALE_WHILE_REVALIDATE")
+    """
+    When ``True``, expired responses of endpoints that allow it are served from the response cache immediately and
+    refreshed in the background, for up to the endpoint's maximum staleness.
+    """
+
+    cache_negative: bool = Field(default=False, env="YELP_CACHE_NEGATIVE")
+    """
+    When ``True``, requests of endpoints that allow it which find nothing, like an unknown business ID or a business
+    match without results, are cached for the endpoint's shorter negative TTL. The cached ``404 Not Found`` is raised
+    again as :py:class:`~yelpfusion3.exceptions.ApiError`, and the cached empty result is returned, without a request.
+    """
+
+    cache_key_grid: Optional[PositiveFloat] = Field(default=None, env="YELP_CACHE_KEY_GRID")
+    """
+    Size of the grid, in decimal degrees, that the latitude and longitude of search requests are snapped to in their
+    cache keys, so that nearby searches share a cached response. ``0.001`` is about 110 meters of latitude. Coordinates
+    are used as they are when not set. The requests themselves are always sent with the exact coordinates.
+    """
+
+    cache_path: Optional[Path] = Field(default=None, env="YELP_CACHE_PATH")
+    """
+    SQLite database of the ``sqlite`` response cache, shared by every process on the host that uses it.
+    """
+
+    cache_max_bytes: PositiveInt = Field(default=256 * 1024 * 1024, env="YELP_CACHE_MAX_BYTES")
+    """
+    Size of the compressed response bodies above which the ``sqlite`` response cache evicts entries.
+    """
+
+    category_catalog: bool = Field(default=False, env="YELP_CATEGORY_CATALOG")
+    """
+    When ``True``, category details are answered from a local catalog of every category of the locale, fetched once
+    with the all categories endpoint, instead of a request per alias. Until the first fetch completes, aliases other
+    than root categories are still requested. See :py:mod:`yelpfusion3.category.catalog`.
+    """
+
+    category_catalog_dir: Optional[Path] = Field(default=None, env="YELP_CATEGORY_CATALOG_DIR")
+    """
+    Directory where category catalogs are saved after each refresh and loaded from by new processes. Catalogs are only
+    kept in memory when not set.
+    """
+
+    category_catalog_refresh_interval: PositiveFloat = Field(
+        default=604800.0, env="YELP_CATEGORY_CATALOG_REFRESH_INTERVAL"
+    )
+    """
+    Age, in seconds, after which a category catalog is refreshed in the background on its next lookup.
+    """
+
+    business_identity_map: bool = Field(default=False, env="YELP_BUSINESS_IDENTITY_MAP")
+    """
+    When ``True``, the businesses of business search, phone search, transaction search and business matches responses
+    are replaced with one shared record per business ID, and their distances are kept in the ``distances`` of each
+    response. See :py:mod:`yelpfusion3.business.identity`.
+    """
+
+    business_identity_map_size: PositiveInt = Field(default=100_000, env="YELP_BUSINESS_IDENTITY_MAP_SIZE")
+    """
+    Number of businesses above which the business identity map evicts the least recently seen ones.
+    """
+
     @property
     def headers(self) -> dict:
         """
@@ -22,3 +257,33 @@ class Settings(BaseSettings):
         :return:
         """
         return {"Authorization": f"Bearer {self.api_key}"}
+
+
+_settings: Optional[Settings] = None
+
+
+def get_settings() -> Settings:
+    """
+    Returns the settings, read from the environment on first use and shared afterwards, so that requests don't parse
+    and validate the environment again. Call :py:func:`reset_settings` after changing the environment at runtime.
+
+    :return: The shared settings.
+    :rtype: Settings
+    """
+
+    global _settings  # pylint: disable=global-statement
+    settings: Optional[Settings] = _settings
+    if settings is None:
+        settings = _settings = Settings()
+    return settings
+
+
+def reset_settings() -> None:
+    """
+    Discards the shared settings, so that the next :py:func:`get_settings` reads the environment again. Shared objects
+    already created from settings, like the response cache, are kept: replace them with their ``set_*`` function, like
+    :py:func:`~yelpfusion3.cache.set_cache`, to recreate them from the new settings.
+    """
+
+    global _settings  # pylint: disable=global-statement
+    _settings = None
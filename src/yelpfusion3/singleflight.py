@@ -0,0 +1,105 @@
+"""
+Coalescing of identical in-flight requests.
+"""
+
+import asyncio
+from concurrent.futures import Future, TimeoutError
+from threading import Lock
+from typing import Any, Awaitable, Callable, Dict, Tuple, TypeVar
+
+from yelpfusion3.exceptions import DeadlineExceededError
+from yelpfusion3.timeout import check_deadline, within_deadline
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    """
+    Runs at most one call per key at a time. Callers that arrive while a call for the same key is in flight wait for
+    it and receive its result, or its exception, instead of starting their own.
+
+    Synchronous callers (:py:meth:`do`) are coalesced across threads, and asynchronous callers (:py:meth:`ado`) are
+    coalesced across tasks of the same event loop. Waiting callers give up when their own
+    :py:func:`~yelpfusion3.timeout.deadline` passes.
+    """
+
+    def __init__(self) -> None:
+        self._lock: Lock = Lock()
+        self._calls: Dict[str, Future[Any]] = {}
+        self._tasks: Dict[Tuple[int, str], asyncio.Future[Any]] = {}
+
+    def do(self, key: str, function: Callable[[], T]) -> T:
+        """
+        Calls ``function``, unless a call for ``key`` is already in flight, and returns its result.
+
+        :param key: Identifies equivalent calls.
+        :type key: str
+        :param function: The call to make.
+        :return: The result of the call made for ``key``.
+        """
+
+        with self._lock:
+            future: Future[T] = self._calls.get(key)
+            leader: bool = future is None
+            if leader:
+                future = self._calls[key] = Future()
+        if leader:
+            self._lead(key, future, function)
+            return future.result()
+        return self._follow(future)
+
+    async def ado(self, key: str, function: Callable[[], Awaitable[T]]) -> T:
+        """
+        Awaits ``function``, unless a call for ``key`` is already in flight on the running event loop, and returns its
+        result. Cancelling one of the waiting callers does not cancel the shared call.
+
+        :param key: Identifies equivalent calls.
+        :type key: str
+        :param function: The call to make.
+        :return: The result of the call made for ``key``.
+        """
+
+        task_key: Tuple[int, str] = (id(asyncio.get_running_loop()), key)
+        task: asyncio.Future[T] = self._tasks.get(task_key)
+        if task is None:
+            task = self._tasks[task_key] = asyncio.ensure_future(function())
+            task.add_done_callback(lambda _: self._tasks.pop(task_key, None))
+        return await within_deadline(asyncio.shield(task))
+
+    @property
+    def in_flight(self) -> int:
+        """
+        :return: Number of distinct calls currently in flight.
+        :rtype: int
+        """
+        return len(self._calls) + len(self._tasks)
+
+    def _lead(self, key: str, future: Future[T], function: Callable[[], T]) -> None:
+        try:
+            future.set_result(function())
+        except BaseException as error:  # pylint: disable=broad-except
+            future.set_exception(error)
+        finally:
+            with self._lock:
+                del self._calls[key]
+
+    @staticmethod
+    def _follow(future: Future[T]) -> T:
+        try:
+            return future.result(timeout=check_deadline())
+        except TimeoutError as error:
+            raise DeadlineExceededError("Deadline exceeded while waiting for a coalesced request.") from error
+
+
+_single_flight: SingleFlight = SingleFlight()
+
+
+def get_single_flight() -> SingleFlight:
+    """
+    Returns the process-wide :py:class:`SingleFlight` used to coalesce identical endpoint requests.
+
+    :return: The shared single-flight group.
+    :rtype: SingleFlight
+    """
+
+    return _single_flight
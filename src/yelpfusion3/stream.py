@@ -0,0 +1,215 @@
+"""
+Incremental decoding of the item arrays in large Yelp Fusion responses.
+"""
+
+import codecs
+import json
+import re
+from typing import AsyncIterable, AsyncIterator, Callable, Dict, Iterable, Iterator, List, Optional, Pattern, Tuple
+
+CHUNK_SIZE: int = 64 * 1024
+"""
+Number of bytes read from the response stream at a time.
+"""
+
+_WHITESPACE: Pattern[str] = re.compile(r"[ \t\n\r]*")
+
+
+class ArrayScanner:
+    """
+    A push parser that extracts the items of one top-level array, like ``businesses`` or ``categories``, from a JSON
+    object received in chunks. Only one item (and the yet unparsed rest of the current chunk) is held in memory at a
+    time; other top-level members are skipped.
+    """
+
+    def __init__(self, key: str) -> None:
+        """
+        :param key: Name of the top-level member holding the array.
+        :type key: str
+        """
+
+        self.key: str = key
+        self._decoder: json.JSONDecoder = json.JSONDecoder()
+        self._text_decoder: codecs.IncrementalDecoder = codecs.getincrementaldecoder("utf-8")()
+        self._buffer: str = ""
+        self._state: str = "object"
+        self._member_name: object = None
+        self._final: bool = False
+        self._items: List[dict] = []
+
+    def feed(self, chunk: bytes) -> List[dict]:
+        """
+        Parses the next chunk of the response body.
+
+        :param chunk: Raw bytes of the body.
+        :type chunk: bytes
+        :raise ValueError: If the body is not a JSON object or ``key`` does not hold an array.
+        :return: The items completed by this chunk.
+        :rtype: List[dict]
+        """
+
+        self._buffer += self._text_decoder.decode(chunk)
+        return self._scan(final=False)
+
+    def close(self) -> List[dict]:
+        """
+        Parses whatever is left once the body has been read completely.
+
+        :raise ValueError: If the body ended prematurely.
+        :return: The last items of the array.
+        :rtype: List[dict]
+        """
+
+        self._buffer += self._text_decoder.decode(b"", final=True)
+        items: List[dict] = self._scan(final=True)
+        if self._state != "done":
+            raise ValueError("Unexpected end of JSON response body.")
+        return items
+
+    def _scan(self, final: bool) -> List[dict]:
+        self._final, self._items = final, []
+        position: int = 0
+        while self._state != "done":
+            position = _WHITESPACE.match(self._buffer, position).end()
+            if position == len(self._buffer):
+                break
+            # Each state handler consumes the token at ``position`` and returns the position after it, or None when the
+            # token continues in the next chunk.
+            after: Optional[int] = self._handlers[self._state](self, position)
+            if after is None:
+                break
+            position = after
+        self._buffer = self._buffer[position:]
+        return self._items
+
+    def _object(self, position: int) -> Optional[int]:
+        self._expect(self._buffer[position], "{")
+        self._state = "member"
+        return position + 1
+
+    def _member(self, position: int) -> Optional[int]:
+        if self._buffer[position] == "}":
+            self._state = "done"
+            return position + 1
+        parsed: Optional[Tuple[object, int]] = self._decode(position)
+        if parsed is None:
+            return None
+        self._member_name, position = parsed
+        self._state = "colon"
+        return position
+
+    def _next_member(self, position: int) -> Optional[int]:
+        if self._buffer[position] == "}":
+            self._state = "done"
+            return position + 1
+        self._expect(self._buffer[position], ",")
+        self._state = "member"
+        return position + 1
+
+    def _colon(self, position: int) -> Optional[int]:
+        self._expect(self._buffer[position], ":")
+        self._state = "array" if self._member_name == self.key else "value"
+        return position + 1
+
+    def _array(self, position: int) -> Optional[int]:
+        self._expect(self._buffer[position], "[")
+        self._state = "item"
+        return position + 1
+
+    def _value(self, position: int) -> Optional[int]:
+        parsed: Optional[Tuple[object, int]] = self._decode(position)
+        if parsed is None:
+            return None
+        self._state = "next_member"
+        return parsed[1]
+
+    def _item(self, position: int) -> Optional[int]:
+        if self._buffer[position] == "]":
+            self._state = "next_member"
+            return position + 1
+        parsed: Optional[Tuple[object, int]] = self._decode(position)
+        if parsed is None:
+            return None
+        item, position = parsed
+        if not isinstance(item, dict):
+            raise ValueError(f"Expected an object in the '{self.key}' array.")
+        self._items.append(item)
+        self._state = "next_item"
+        return position
+
+    def _next_item(self, position: int) -> Optional[int]:
+        if self._buffer[position] == "]":
+            self._state = "next_member"
+            return position + 1
+        self._expect(self._buffer[position], ",")
+        self._state = "item"
+        return position + 1
+
+    def _decode(self, position: int) -> Optional[Tuple[object, int]]:
+        try:
+            value, end = self._decoder.raw_decode(self._buffer, position)
+        except json.JSONDecodeError:
+            if self._final:
+                raise
+            return None
+        return None if self._truncated(value, end) else (value, end)
+
+    def _truncated(self, value: object, end: int) -> bool:
+        # A number or literal at the end of the buffer may continue in the next chunk.
+        return end == len(self._buffer) and not self._final and not isinstance(value, (dict, list, str))
+
+    _handlers: Dict[str, Callable[["ArrayScanner", int], Optional[int]]] = {
+        "object": _object,
+        "member": _member,
+        "next_member": _next_member,
+        "colon": _colon,
+        "array": _array,
+        "value": _value,
+        "item": _item,
+        "next_item": _next_item,
+    }
+
+    @staticmethod
+    def _expect(character: str, expected: str) -> None:
+        if character != expected:
+            raise ValueError(f"Expected '{expected}' but found '{character}' in JSON response body.")
+
+
+def iter_items(chunks: Iterable[bytes], key: str) -> Iterator[dict]:
+    """
+    Yields the items of the top-level ``key`` array of a JSON object as its chunks are read.
+
+    :param chunks: The response body, in chunks.
+    :type chunks: Iterable[bytes]
+    :param key: Name of the top-level member holding the array.
+    :type key: str
+    :raise ValueError: If the body is malformed.
+    :return: The items of the array, as dictionaries.
+    :rtype: Iterator[dict]
+    """
+
+    scanner: ArrayScanner = ArrayScanner(key)
+    for chunk in chunks:
+        yield from scanner.feed(chunk)
+    yield from scanner.close()
+
+
+async def aiter_items(chunks: AsyncIterable[bytes], key: str) -> AsyncIterator[dict]:
+    """
+    Asynchronous counterpart of :py:func:`iter_items`.
+
+    :param chunks: The response body, in chunks.
+    :type chunks: AsyncIterable[bytes]
+    :param key: Name of the top-level member holding the array.
+    :type key: str
+    :raise ValueError: If the body is malformed.
+    :return: The items of the array, as dictionaries.
+    :rtype: AsyncIterator[dict]
+    """
+
+    scanner: ArrayScanner = ArrayScanner(key)
+    async for chunk in chunks:
+        for item in scanner.feed(chunk):
+            yield item
+    for item in scanner.close():
+        yield item
@@ -0,0 +1,281 @@
+"""
+Connect/read timeouts and end-to-end deadlines for endpoint requests.
+"""
+
+import asyncio
+import io
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import partial
+from typing import Awaitable, Callable, Iterator, List, Optional, Tuple, TypeVar
+
+import requests
+import urllib3
+from pydantic import BaseModel, PositiveFloat
+from requests import Response
+
+from yelpfusion3.exceptions import DeadlineExceededError
+from yelpfusion3.stream import CHUNK_SIZE
+
+T = TypeVar("T")
+
+_deadline: ContextVar[Optional[float]] = ContextVar("yelpfusion3_deadline", default=None)
+_timeout: ContextVar[Optional["Timeout"]] = ContextVar("yelpfusion3_timeout", default=None)
+
+
+class Timeout(BaseModel):
+    """
+    Socket timeouts applied to a single HTTP request attempt.
+    """
+
+    class Config:  # pylint: disable=C0115,too-few-public-methods
+        allow_mutation = False
+
+    connect: PositiveFloat = 3.05
+    """
+    Seconds to wait for a connection to Yelp to be established.
+    """
+
+    read: PositiveFloat = 20.0
+    """
+    Seconds to wait for the server to send data once connected.
+    """
+
+    def within(self, seconds: Optional[float]) -> "Timeout":
+        """
+        Shortens both timeouts so that neither exceeds ``seconds``.
+
+        :param seconds: Time left before the deadline, or ``None`` if there is no deadline.
+        :type seconds: float
+        :return: The clamped timeouts.
+        :rtype: Timeout
+        """
+
+        if seconds is None or (self.connect <= seconds and self.read <= seconds):
+            return self
+        return Timeout(connect=min(self.connect, seconds), read=min(self.read, seconds))
+
+    def as_tuple(self) -> Tuple[float, float]:
+        """
+        :return: ``(connect, read)``, the format accepted by ``requests``.
+        :rtype: Tuple[float, float]
+        """
+        return self.connect, self.read
+
+    def as_httpx(self) -> Tuple[float, float, float, float]:
+        """
+        :return: ``(connect, read, write, pool)``, the format accepted by ``httpx``. Writes use the read timeout and
+            waiting for a pooled connection uses the connect timeout.
+        :rtype: Tuple[float, float, float, float]
+        """
+        return self.connect, self.read, self.read, self.connect
+
+
+@contextmanager
+def deadline(seconds: float) -> Iterator[None]:
+    """
+    Limits the total time spent by every request made within the ``with`` block, including rate limiting, retries,
+    backoff and waiting on coalesced requests. Requests that cannot finish in time raise
+    :py:class:`~yelpfusion3.exceptions.DeadlineExceededError`. Nested deadlines can only shorten the outer one.
+
+    The deadline follows the context into asyncio tasks and into :py:meth:`~yelpfusion3.client.Client.get_many`
+    workers, where it applies to each request of the batch.
+
+    .. code-block:: python
+
+        with deadline(0.5):
+            autocomplete = Client.autocomplete(text="pizza").get()
+
+    :param seconds: Time budget, in seconds.
+    :type seconds: float
+    """
+
+    expires: float = time.monotonic() + seconds
+    current: Optional[float] = _deadline.get()
+    token = _deadline.set(expires if current is None else min(current, expires))
+    try:
+        yield
+    finally:
+        _deadline.reset(token)
+
+
+@contextmanager
+def timeout(connect: Optional[float] = None, read: Optional[float] = None) -> Iterator[None]:
+    """
+    Overrides the endpoint's default connect and/or read timeouts for requests made within the ``with`` block.
+
+    :param connect: Seconds to wait for a connection to be established.
+    :type connect: float
+    :param read: Seconds to wait for the server to send data once connected.
+    :type read: float
+    """
+
+    token = _timeout.set(Timeout(**{key: value for key, value in {"connect": connect, "read": read}.items() if value}))
+    try:
+        yield
+    finally:
+        _timeout.reset(token)
+
+
+def remaining() -> Optional[float]:
+    """
+    :return: Seconds left before the current deadline, or ``None`` if no deadline is set.
+    :rtype: Optional[float]
+    """
+
+    expires: Optional[float] = _deadline.get()
+    return None if expires is None else expires - time.monotonic()
+
+
+def check_deadline() -> Optional[float]:
+    """
+    Ensures the current deadline has not passed yet.
+
+    :raise DeadlineExceededError: If the deadline has passed.
+    :return: Seconds left before the deadline, or ``None`` if no deadline is set.
+    :rtype: Optional[float]
+    """
+
+    seconds: Optional[float] = remaining()
+    if seconds is not None and seconds <= 0:
+        raise DeadlineExceededError("Deadline exceeded.")
+    return seconds
+
+
+def request_timeout(default: Timeout) -> Timeout:
+    """
+    Resolves the timeouts for the next request attempt: the per-call override set with :py:func:`timeout` if any,
+    otherwise ``default``, shortened to fit the current deadline.
+
+    :param default: The endpoint's default timeouts.
+    :type default: Timeout
+    :raise DeadlineExceededError: If the deadline has passed.
+    :return: Timeouts to apply to the request.
+    :rtype: Timeout
+    """
+
+    override: Optional[Timeout] = _timeout.get()
+    if override is not None:
+        default = Timeout(
+            connect=override.connect if "connect" in override.__fields_set__ else default.connect,
+            read=override.read if "read" in override.__fields_set__ else default.read,
+        )
+    return default.within(check_deadline())
+
+
+def deadline_sleep(delay: float) -> None:
+    """
+    Sleeps for ``delay`` seconds, unless that would overrun the current deadline.
+
+    :param delay: Seconds to sleep.
+    :type delay: float
+    :raise DeadlineExceededError: If the deadline would pass before ``delay`` elapses.
+    """
+
+    check_delay(delay)
+    if delay > 0:
+        time.sleep(delay)
+
+
+async def deadline_asleep(delay: float) -> None:
+    """
+    Suspends the calling task for ``delay`` seconds, unless that would overrun the current deadline.
+
+    :param delay: Seconds to sleep.
+    :type delay: float
+    :raise DeadlineExceededError: If the deadline would pass before ``delay`` elapses.
+    """
+
+    check_delay(delay)
+    if delay > 0:
+        await asyncio.sleep(delay)
+
+
+async def within_deadline(awaitable: Awaitable[T]) -> T:
+    """
+    Awaits ``awaitable``, cancelling it if the current deadline passes first.
+
+    :param awaitable: The operation to await.
+    :raise DeadlineExceededError: If the deadline passes before ``awaitable`` completes.
+    :return: The result of ``awaitable``.
+    """
+
+    seconds: Optional[float] = check_deadline()
+    if seconds is None:
+        return await awaitable
+    try:
+        return await asyncio.wait_for(awaitable, seconds)
+    except asyncio.TimeoutError as error:
+        raise DeadlineExceededError("Deadline exceeded.") from error
+
+
+def read_within_deadline(response: Response) -> Response:
+    """
+    Reads the body of a successful streamed response, giving up when the current deadline passes. Socket timeouts only
+    bound the wait for each read, so a server trickling the body could otherwise hold a request far past its deadline.
+
+    :param response: A response sent with ``stream=True``.
+    :type response: Response
+    :raise DeadlineExceededError: If the deadline passes before the body is read, in which case the response is closed.
+    :return: ``response``, with its body read into memory.
+    :rtype: Response
+    """
+
+    if response.status_code >= 400:
+        return response
+    try:
+        body: bytes = b"".join(_read_body(response))
+    except BaseException:
+        response.close()
+        raise
+    # The connection went back to the pool once the body was drained, and the body is served from memory.
+    response.raw = io.BytesIO(body)
+    return response
+
+
+def _read_body(response: Response) -> List[bytes]:
+    chunks: List[bytes] = []
+    try:
+        _shorten_read_timeout(response, check_deadline())
+        for chunk in _iter_body(response):
+            chunks.append(chunk)
+            _shorten_read_timeout(response, check_deadline())
+    except (requests.RequestException, urllib3.exceptions.HTTPError):
+        # A read that timed out after being shortened to the time left means the deadline has passed.
+        check_deadline()
+        raise
+    return chunks
+
+
+def _iter_body(response: Response) -> Iterator[bytes]:
+    read: Callable[[int], bytes] = response.raw.read
+    if isinstance(response.raw, urllib3.HTTPResponse):
+        # Unlike read, read1 returns whatever part of the body has arrived instead of waiting for a full chunk. It was
+        # added in urllib3 2.
+        read = partial(getattr(response.raw, "read1", response.raw.read), decode_content=True)
+    chunk: bytes = read(CHUNK_SIZE)
+    while chunk:
+        yield chunk
+        chunk = read(CHUNK_SIZE)
+
+
+def _shorten_read_timeout(response: Response, seconds: Optional[float]) -> None:
+    # Bounds the next read to the time left, when the body is read from a socket.
+    sock = getattr(getattr(response.raw, "connection", None), "sock", None)
+    if seconds is not None and sock is not None:
+        sock.settimeout(seconds)
+
+
+def check_delay(delay: float) -> None:
+    """
+    Ensures that waiting ``delay`` seconds would not overrun the current deadline.
+
+    :param delay: Seconds to wait.
+    :type delay: float
+    :raise DeadlineExceededError: If the deadline would pass before ``delay`` elapses.
+    """
+
+    seconds: Optional[float] = check_deadline()
+    if seconds is not None and delay >= seconds:
+        raise DeadlineExceededError(f"Waiting {delay:.3f}s would exceed the deadline.")
@@ -0,0 +1,538 @@
+"""
+Pluggable transports that perform the HTTP requests of every endpoint.
+"""
+
+import asyncio
+import io
+import random
+import time
+from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from fnmatch import fnmatchcase
+from itertools import count
+from threading import Lock, Thread
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterator,
+    Callable,
+    Coroutine,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    TypeVar,
+    Union,
+)
+from urllib.parse import urlsplit
+
+import requests
+from requests import Response
+
+from yelpfusion3.serialization import dumps
+from yelpfusion3.session import create_http2_session, get_async_session, get_session
+from yelpfusion3.settings import get_settings
+from yelpfusion3.timeout import Timeout
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover
+    httpx = None
+
+if TYPE_CHECKING:  # pragma: no cover
+    from httpx import AsyncClient
+
+T = TypeVar("T")
+
+
+class Transport(ABC):
+    """
+    Performs synchronous GET requests on behalf of endpoints, returning a :py:class:`requests.Response`.
+
+    When ``stream`` is ``True``, the body of a successful response is left unread so that it can be consumed
+    incrementally, while the body of an error response is always read.
+    """
+
+    @abstractmethod
+    def get(self, url: str, headers: Dict[str, str], timeout: Timeout, stream: bool = False) -> Response:
+        """
+        Performs a GET request.
+
+        :param url: The URL to request.
+        :type url: str
+        :param headers: Request header fields.
+        :type headers: Dict[str, str]
+        :param timeout: Connect and read timeouts.
+        :type timeout: Timeout
+        :param stream: Whether to leave a successful response body unread.
+        :type stream: bool
+        :return: The response.
+        :rtype: Response
+        """
+
+    def warmup(self, url: str, connections: int, timeout: Timeout) -> int:
+        """
+        Opens up to ``connections`` pooled connections to the host of ``url`` ahead of the first request, so that DNS
+        resolution and the TCP and TLS handshakes are not paid for on the request path. Failures are ignored, as
+        requests open connections on demand anyway. Transports without a connection pool open none.
+
+        :param url: A URL on the host to connect to. It is requested with ``HEAD`` and without credentials.
+        :type url: str
+        :param connections: The number of connections to open.
+        :type connections: int
+        :param timeout: Connect and read timeouts.
+        :type timeout: Timeout
+        :return: The number of connections opened.
+        :rtype: int
+        """
+        return 0
+
+
+class AsyncTransport(ABC):
+    """
+    Performs asynchronous GET requests on behalf of endpoints, returning an :py:class:`httpx.Response`, with the same
+    ``stream`` semantics as :py:class:`Transport`.
+    """
+
+    @abstractmethod
+    async def aget(self, url: str, headers: Dict[str, str], timeout: Timeout, stream: bool = False) -> "httpx.Response":
+        """
+        Performs a GET request without blocking the event loop.
+
+        :param url: The URL to request.
+        :type url: str
+        :param headers: Request header fields.
+        :type headers: Dict[str, str]
+        :param timeout: Connect and read timeouts.
+        :type timeout: Timeout
+        :param stream: Whether to leave a successful response body unread.
+        :type stream: bool
+        :return: The response.
+        :rtype: httpx.Response
+        """
+
+    async def awarmup(self, url: str, connections: int, timeout: Timeout) -> int:
+        """
+        Opens up to ``connections`` pooled connections to the host of ``url`` without blocking the event loop, like
+        :py:meth:`warmup`.
+
+        :param url: A URL on the host to connect to. It is requested with ``HEAD`` and without credentials.
+        :type url: str
+        :param connections: The number of connections to open.
+        :type connections: int
+        :param timeout: Connect and read timeouts.
+        :type timeout: Timeout
+        :return: The number of connections opened.
+        :rtype: int
+        """
+        return 0
+
+
+class RequestsTransport(Transport):
+    """
+    Sends requests with ``requests``, over the shared connection pool from :py:func:`~yelpfusion3.session.get_session`
+    unless a session is given.
+    """
+
+    def __init__(self, session: Optional[requests.Session] = None) -> None:
+        """
+        :param session: Session to send requests with.
+        :type session: requests.Session
+        """
+        self.session: Optional[requests.Session] = session
+
+    def get(self, url: str, headers: Dict[str, str], timeout: Timeout, stream: bool = False) -> Response:
+        session: requests.Session = self.session or get_session()
+        response: Response = session.get(url=url, headers=headers, timeout=timeout.as_tuple(), stream=stream)
+        if stream and response.status_code >= 400:
+            response.content  # pylint: disable=pointless-statement
+        return response
+
+    def warmup(self, url: str, connections: int, timeout: Timeout) -> int:
+        session: requests.Session = self.session or get_session()
+        with ThreadPoolExecutor(max_workers=connections) as executor:
+            responses: List[Response] = [
+                response
+                for response in executor.map(lambda _: _head(session, url, timeout), range(connections))
+                if response is not None
+            ]
+        for response in responses:
+            # Reading the empty body returns the connection to the pool, whereas closing the response would drop it.
+            response.content  # pylint: disable=pointless-statement
+        return len(responses)
+
+
+class HttpxTransport(AsyncTransport):
+    """
+    Sends asynchronous requests with ``httpx``, over the per-event-loop client from
+    :py:func:`~yelpfusion3.session.get_async_session` unless a client is given.
+    """
+
+    def __init__(self, client: Optional["AsyncClient"] = None) -> None:
+        """
+        :param client: Client to send requests with.
+        :type client: httpx.AsyncClient
+        """
+        self.client: Optional["AsyncClient"] = client
+
+    async def aget(self, url: str, headers: Dict[str, str], timeout: Timeout, stream: bool = False) -> "httpx.Response":
+        client: "AsyncClient" = self.client or get_async_session()
+        response: "httpx.Response" = await client.send(
+            client.build_request("GET", url=url, headers=headers, timeout=timeout.as_httpx()), stream=stream
+        )
+        if stream and response.status_code >= 400:
+            await response.aread()
+        return response
+
+    async def awarmup(self, url: str, connections: int, timeout: Timeout) -> int:
+        return await _open_connections(self.client or get_async_session(), url, connections, timeout)
+
+
+class Http2Transport(Transport):
+    """
+    Sends synchronous requests over multiplexed HTTP/2 connections, so that requests made concurrently from many
+    threads share a single connection to Yelp. Requests are handed to an ``httpx`` client running on a private event
+    loop thread, which keeps the connection state consistent across threads. Responses are adapted to
+    :py:class:`requests.Response`, and streamed bodies are read from the connection as they are consumed.
+
+    Used by default when the ``http2`` setting is enabled. Requires the ``http2`` extra.
+    """
+
+    def __init__(self, client: Optional["AsyncClient"] = None) -> None:
+        """
+        :param client: Client to send requests with. Defaults to one created by
+            :py:func:`~yelpfusion3.session.create_http2_session`.
+        :type client: httpx.AsyncClient
+        """
+        self.client: "AsyncClient" = client or create_http2_session()
+        self._loop: asyncio.AbstractEventLoop = asyncio.new_event_loop()
+        self._thread: Thread = Thread(target=self._loop.run_forever, name="yelpfusion3-http2", daemon=True)
+        self._thread.start()
+
+    def get(self, url: str, headers: Dict[str, str], timeout: Timeout, stream: bool = False) -> Response:
+        response: "httpx.Response" = self._run(self._aget(url, headers, timeout, stream))
+        adapted: Response = Response()
+        adapted.status_code = response.status_code
+        adapted.reason = response.reason_phrase
+        adapted.headers.update(response.headers)
+        adapted.url = url
+        if response.is_closed:
+            adapted.raw = io.BytesIO(response.content)
+            adapted.content  # pylint: disable=pointless-statement
+        else:
+            adapted.raw = _HttpxBody(response, self._run)
+        return adapted
+
+    def warmup(self, url: str, connections: int, timeout: Timeout) -> int:
+        # Requests are multiplexed, so a single connection serves them all.
+        return self._run(_open_connections(self.client, url, 1, timeout))
+
+    def close(self) -> None:
+        """
+        Closes the client and its connections, and stops the event loop thread.
+        """
+        if self._loop.is_running():
+            self._run(self.client.aclose())
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join()
+
+    async def _aget(self, url: str, headers: Dict[str, str], timeout: Timeout, stream: bool) -> "httpx.Response":
+        response: "httpx.Response" = await self.client.send(
+            self.client.build_request("GET", url=url, headers=headers, timeout=timeout.as_httpx()), stream=stream
+        )
+        if stream and response.status_code >= 400:
+            await response.aread()
+        return response
+
+    def _run(self, coroutine: Coroutine[Any, Any, T]) -> T:
+        return asyncio.run_coroutine_threadsafe(coroutine, self._loop).result()
+
+
+def _head(session: requests.Session, url: str, timeout: Timeout) -> Optional[Response]:
+    try:
+        # Streamed responses hold on to their connection until closed, so every request opens a new one.
+        return session.head(url, timeout=timeout.as_tuple(), stream=True)
+    except requests.RequestException:
+        return None
+
+
+async def _ahead(client: "AsyncClient", url: str, timeout: Timeout) -> Optional["httpx.Response"]:
+    try:
+        # Streamed responses hold on to their connection until closed, so every request opens a new one.
+        return await client.send(client.build_request("HEAD", url, timeout=timeout.as_httpx()), stream=True)
+    except httpx.HTTPError:
+        return None
+
+
+async def _open_connections(client: "AsyncClient", url: str, connections: int, timeout: Timeout) -> int:
+    responses: List["httpx.Response"] = [
+        response
+        for response in await asyncio.gather(*(_ahead(client, url, timeout) for _ in range(connections)))
+        if response is not None
+    ]
+    for response in responses:
+        # Reading the empty body returns the connection to the pool, whereas closing the response would drop it.
+        await response.aread()
+    return len(responses)
+
+
+class _HttpxBody:
+    """
+    File-like view of a streamed ``httpx`` response body, as read by :py:meth:`requests.Response.iter_content`.
+    """
+
+    def __init__(self, response: "httpx.Response", run: Callable[[Coroutine[Any, Any, Any]], Any]) -> None:
+        self._response: "httpx.Response" = response
+        self._chunks: AsyncIterator[bytes] = response.aiter_bytes()
+        self._run: Callable[[Coroutine[Any, Any, Any]], Any] = run
+        self._buffer: bytes = b""
+        self._exhausted: bool = False
+
+    def read(self, size: int = -1) -> bytes:
+        while not self._exhausted and (size < 0 or len(self._buffer) < size):
+            try:
+                self._buffer += self._run(_next_chunk(self._chunks))
+            except StopAsyncIteration:
+                self._exhausted = True
+        data: bytes = self._buffer if size < 0 else self._buffer[:size]
+        self._buffer = self._buffer[len(data) :]
+        return data
+
+    def close(self) -> None:
+        self._run(self._response.aclose())
+
+
+async def _next_chunk(chunks: AsyncIterator[bytes]) -> bytes:
+    # run_coroutine_threadsafe() takes a coroutine, which __anext__() does not have to return.
+    return await chunks.__anext__()
+
+
+@dataclass
+class StubResponse:
+    """
+    A canned response served by a :py:class:`StubTransport`.
+    """
+
+    payload: Any = None
+    """
+    The response body: ``bytes`` are served as is and anything else is encoded as JSON.
+    """
+
+    status_code: int = 200
+    """
+    HTTP status code of the response.
+    """
+
+    headers: Dict[str, str] = field(default_factory=dict)
+    """
+    Response header fields, like ``Retry-After``.
+    """
+
+    latency: float = 0.0
+    """
+    Seconds to wait before answering, in addition to the transport-wide latency.
+    """
+
+    error: Optional[BaseException] = None
+    """
+    Exception to raise instead of answering, like :py:class:`requests.ConnectionError`.
+    """
+
+    @property
+    def body(self) -> bytes:
+        """
+        :return: The encoded response body.
+        :rtype: bytes
+        """
+        if isinstance(self.payload, bytes):
+            return self.payload
+        return b"" if self.payload is None else dumps(self.payload).encode()
+
+
+StubRoute = Union[StubResponse, dict, Sequence[StubResponse], Callable[[str], Union[StubResponse, dict]]]
+"""
+What a :py:class:`StubTransport` serves for a path: a response, a JSON payload, a sequence of responses served in turn
+(the last one repeating), or a function of the requested URL returning either.
+"""
+
+
+class StubTransport(Transport, AsyncTransport):
+    """
+    Serves canned or generated responses from memory, for offline tests and benchmarks. Routes map URL path patterns,
+    relative to the ``base_url`` setting and matched with :py:func:`fnmatch.fnmatchcase`, to what they serve. The first
+    matching route wins; unmatched paths get a 404 error response.
+
+    .. code-block:: python
+
+        set_transport(
+            StubTransport(
+                routes={
+                    "/businesses/search": {"businesses": [], "total": 0},
+                    "/businesses/*/reviews": [StubResponse(status_code=503), StubResponse(payload=REVIEWS)],
+                },
+                latency=0.05,
+                error_rate=0.01,
+            )
+        )
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        routes: Optional[Dict[str, StubRoute]] = None,
+        latency: Union[float, Callable[[], float]] = 0.0,
+        error_rate: float = 0.0,
+        error: Callable[[], BaseException] = requests.ConnectionError,
+        seed: Optional[int] = None,
+    ) -> None:
+        """
+        :param routes: What to serve, by path pattern.
+        :type routes: Dict[str, StubRoute]
+        :param latency: Seconds to wait before answering each request, or a function returning them.
+        :param error_rate: Share of requests, between 0 and 1, that fail with ``error`` instead of being answered.
+        :type error_rate: float
+        :param error: Creates the exception raised by failing requests.
+        :param seed: Seed of the random choice of failing requests, for reproducible runs.
+        :type seed: int
+        """
+
+        if not 0 <= error_rate <= 1:
+            raise ValueError("'error_rate' must be between 0 and 1.")
+        self.routes: Dict[str, StubRoute] = dict(routes or {})
+        self.latency: Union[float, Callable[[], float]] = latency
+        self.error_rate: float = error_rate
+        self.error: Callable[[], BaseException] = error
+        self.requests: List[str] = []
+        self.request_headers: List[Dict[str, str]] = []
+        self._base_path: str = urlsplit(str(get_settings().base_url)).path.rstrip("/")
+        self._random: random.Random = random.Random(seed)  # nosec B311
+        self._lock: Lock = Lock()
+        self._turns: Dict[str, Iterator[int]] = {}
+
+    def get(self, url: str, headers: Dict[str, str], timeout: Timeout, stream: bool = False) -> Response:
+        stub: StubResponse = self._serve(url, headers)
+        delay: float = self._delay(stub)
+        if delay > 0:
+            time.sleep(delay)
+        if stub.error is not None:
+            raise stub.error
+        response: Response = Response()
+        response.status_code = stub.status_code
+        response.headers.update(stub.headers)
+        response.raw = io.BytesIO(stub.body)
+        response.url = url
+        if not stream:
+            response.content  # pylint: disable=pointless-statement
+        return response
+
+    async def aget(self, url: str, headers: Dict[str, str], timeout: Timeout, stream: bool = False) -> "httpx.Response":
+        stub: StubResponse = self._serve(url, headers)
+        delay: float = self._delay(stub)
+        if delay > 0:
+            await asyncio.sleep(delay)
+        if stub.error is not None:
+            raise stub.error
+        return httpx.Response(
+            stub.status_code, headers=stub.headers, content=stub.body, request=httpx.Request("GET", url)
+        )
+
+    def _serve(self, url: str, headers: Dict[str, str]) -> StubResponse:
+        path: str = self._relative_path(url)
+        with self._lock:
+            self.requests.append(url)
+            self.request_headers.append(dict(headers))
+            failed: bool = self._random.random() < self.error_rate
+            if failed:
+                return StubResponse(error=self.error())
+            pattern: Optional[str] = next((pattern for pattern in self.routes if fnmatchcase(path, pattern)), None)
+            if pattern is not None:
+                return self._resolve(pattern, self.routes[pattern], url)
+        return StubResponse(
+            payload={"error": {"code": "NOT_FOUND", "description": f"No stub route for '{path}'."}}, status_code=404
+        )
+
+    def _relative_path(self, url: str) -> str:
+        path: str = urlsplit(url).path
+        return path[len(self._base_path) :] if self._base_path and path.startswith(self._base_path) else path
+
+    def _resolve(self, pattern: str, route: StubRoute, url: str) -> StubResponse:
+        if callable(route):
+            route = route(url)
+        if isinstance(route, Sequence):
+            turn: int = next(self._turns.setdefault(pattern, count()))
+            route = route[min(turn, len(route) - 1)]
+        return route if isinstance(route, StubResponse) else StubResponse(payload=route)
+
+    def _delay(self, stub: StubResponse) -> float:
+        latency: float = self.latency() if callable(self.latency) else self.latency
+        return latency + stub.latency
+
+
+_lock: Lock = Lock()
+_transport: Optional[Transport] = None
+_async_transport: Optional[AsyncTransport] = None
+
+
+def get_transport() -> Transport:
+    """
+    Returns the transport used by :py:meth:`~yelpfusion3.endpoint.Endpoint.get` and the other synchronous methods of
+    endpoints. Unless replaced with :py:func:`set_transport`, it is an :py:class:`Http2Transport` when the ``http2``
+    setting is enabled, and a :py:class:`RequestsTransport` otherwise.
+
+    :return: The synchronous transport.
+    :rtype: Transport
+    """
+
+    global _transport  # pylint: disable=global-statement
+    if _transport is None:
+        with _lock:
+            if _transport is None:
+                _transport = Http2Transport() if get_settings().http2 else RequestsTransport()
+    return _transport
+
+
+def set_transport(transport: Optional[Transport]) -> None:
+    """
+    Replaces the transport used by synchronous endpoint methods. Pass ``None`` to recreate the default from settings on
+    next use.
+
+    :param transport: The transport to use.
+    :type transport: Transport
+    """
+
+    global _transport  # pylint: disable=global-statement
+    with _lock:
+        if isinstance(_transport, Http2Transport) and _transport is not transport:
+            _transport.close()
+        _transport = transport
+
+
+def get_async_transport() -> AsyncTransport:
+    """
+    Returns the transport used by :py:meth:`~yelpfusion3.endpoint.Endpoint.aget` and the other asynchronous methods of
+    endpoints. Unless replaced with :py:func:`set_async_transport`, it is an :py:class:`HttpxTransport`.
+
+    :return: The asynchronous transport.
+    :rtype: AsyncTransport
+    """
+
+    global _async_transport  # pylint: disable=global-statement
+    if _async_transport is None:
+        with _lock:
+            if _async_transport is None:
+                _async_transport = HttpxTransport()
+    return _async_transport
+
+
+def set_async_transport(transport: Optional[AsyncTransport]) -> None:
+    """
+    Replaces the transport used by asynchronous endpoint methods. Pass ``None`` to restore the default.
+
+    :param transport: The transport to use.
+    :type transport: AsyncTransport
+    """
+
+    global _async_transport  # pylint: disable=global-statement
+    with _lock:
+        _async_transport = transport
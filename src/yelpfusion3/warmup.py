@@ -0,0 +1,70 @@
+"""
+Warm-up of connection pools and lookup tables, so that the first requests after startup run at steady-state latency.
+"""
+
+from typing import Optional
+
+import pycountry
+
+from yelpfusion3.endpoint import SupportedLocales
+from yelpfusion3.serialization import get_json_backend
+from yelpfusion3.settings import Settings, get_settings
+from yelpfusion3.timeout import Timeout
+from yelpfusion3.transport import get_async_transport, get_transport
+
+
+def preload() -> None:
+    """
+    Loads the data that endpoint and model validators look up on first use: the supported locale codes and the
+    ``pycountry`` country database. Also creates the shared JSON backend.
+    """
+
+    SupportedLocales.code_set()
+    pycountry.countries.get(alpha_2="US")
+    get_json_backend()
+
+
+def warmup(connections: Optional[int] = None) -> int:
+    """
+    Prepares the process for synchronous requests: :py:func:`preload` lookup tables, then open pooled connections to
+    ``Settings.base_url`` through the current transport, paying for DNS resolution and the TCP and TLS handshakes
+    ahead of the first request. The connections are opened concurrently with credential-less ``HEAD`` requests, which
+    do not count against the API quota. Failures to connect are ignored.
+
+    :param connections: The number of connections to open. Defaults to the ``warmup_connections`` setting, or to
+        ``pool_maxsize``. More connections than ``pool_maxsize`` would not be kept by the pool.
+    :type connections: int
+    :return: The number of connections opened.
+    :rtype: int
+    """
+
+    settings: Settings = get_settings()
+    preload()
+    return get_transport().warmup(
+        url=settings.base_url, connections=_connections(connections, settings), timeout=Timeout()
+    )
+
+
+async def awarmup(connections: Optional[int] = None) -> int:
+    """
+    Prepares the running event loop for asynchronous requests, like :py:func:`warmup`, opening the connections of its
+    shared asynchronous client.
+
+    :param connections: The number of connections to open. Defaults to the ``warmup_connections`` setting, or to
+        ``pool_maxsize``, and never exceeds ``async_max_connections``.
+    :type connections: int
+    :return: The number of connections opened.
+    :rtype: int
+    """
+
+    settings: Settings = get_settings()
+    preload()
+    return await get_async_transport().awarmup(
+        url=settings.base_url,
+        connections=min(_connections(connections, settings), settings.async_max_connections),
+        timeout=Timeout(),
+    )
+
+
+def _connections(connections: Optional[int], settings: Settings) -> int:
+    return connections or settings.warmup_connections or settings.pool_maxsize
@@ -79,9 +79,9 @@ class TestBusinessMatchesEndpoint:
             country="US",
         )
 
-        assert (
-            business_matches_endpoint.url
-            == "https://api.yelp.com/v3/businesses/matches?name=Gary%20Danko&address1=800%20N%20Point%20St&city=San%20Francisco&state=CA&country=US"
+        assert business_matches_endpoint.url == (
+            "https://api.yelp.com/v3/businesses/matches?name=Gary%20Danko&address1=800%20N%20Point%20St&"
+            "city=San%20Francisco&state=CA&country=US"
         )
 
     def test_country_init_fails_validation(self) -> None:
@@ -117,9 +117,9 @@ class TestBusinessSearchEndpoint:
             price="1,2",
         )
 
-        assert (
-            business_search_endpoint.url
-            == "https://api.yelp.com/v3/businesses/search?term=coffee&location=san%20francisco&radius=25&limit=20&price=1%2C2"
+        assert business_search_endpoint.url == (
+            "https://api.yelp.com/v3/businesses/search?term=coffee&location=san%20francisco&radius=25&limit=20&"
+            "price=1%2C2"
         )
 
     def test_unsupported_fields_ignored(self) -> None:
@@ -133,9 +133,9 @@ class TestBusinessSearchEndpoint:
         )
 
         assert "unsupported" not in [key for key, value in dict(business_search_endpoint).items()]
-        assert (
-            business_search_endpoint.url
-            == "https://api.yelp.com/v3/businesses/search?term=coffee&location=san%20francisco&radius=25&limit=20&price=1%2C2"
+        assert business_search_endpoint.url == (
+            "https://api.yelp.com/v3/businesses/search?term=coffee&location=san%20francisco&radius=25&limit=20&"
+            "price=1%2C2"
         )
 
     @pytest.mark.parametrize("latitude", [-90, 0, 90])
@@ -295,9 +295,9 @@ class TestTransactionSearchEndpoint:
             location="800 N Point St San Francisco CA"
         )
 
-        assert (
-            transaction_search_endpoint.url
-            == "https://api.yelp.com/v3/transactions/delivery/search?location=800%20N%20Point%20St%20San%20Francisco%20CA"
+        assert transaction_search_endpoint.url == (
+            "https://api.yelp.com/v3/transactions/delivery/search?"
+            "location=800%20N%20Point%20St%20San%20Francisco%20CA"
         )
 
     def test_url_latitude_longitude(self) -> None:
@@ -0,0 +1,173 @@
+import asyncio
+from typing import List, Optional
+
+import pytest
+
+from tests.conftest import LOCATION, FakeClock, business
+from yelpfusion3.breaker import reset_circuit_breakers
+from yelpfusion3.business.identity import BusinessIdentityMap, get_business_identity_map, set_business_identity_map
+from yelpfusion3.business.model import Business, BusinessMatch, BusinessSearch
+from yelpfusion3.cache import MemoryCache, set_cache
+from yelpfusion3.client import Client
+from yelpfusion3.transport import StubTransport, set_async_transport, set_transport
+
+
+class TestBusinessIdentityMap:
+    def test_shares_records(self) -> None:
+        identity_map: BusinessIdentityMap = BusinessIdentityMap()
+        first: Business = Business(**business("saucy"))
+
+        assert identity_map.intern(first) is first
+        assert identity_map.intern(Business(**business("saucy"))) is first
+        assert identity_map.get("saucy") is first
+        assert len(identity_map) == 1
+
+    def test_merges(self) -> None:
+        identity_map: BusinessIdentityMap = BusinessIdentityMap()
+        identity_map.intern(Business(**business("saucy", price="$$")))
+
+        record: Business = identity_map.intern(Business(**business("saucy", review_count=2)))
+
+        assert record.review_count == 2
+        assert record.price == "$$"
+
+    def test_distances_are_not_shared(self) -> None:
+        identity_map: BusinessIdentityMap = BusinessIdentityMap()
+        businesses: List[Business] = [Business(**business("saucy", distance=120.0)), Business(**business("fudge"))]
+        identity_map.intern(Business(**business("saucy")))
+
+        distances: List[Optional[float]] = identity_map.intern_all(businesses)
+
+        assert distances == [120.0, None]
+        assert businesses[0] is identity_map.get("saucy")
+        assert businesses[0].distance is None
+        assert "distance" not in businesses[0].dict(exclude_unset=True)
+
+    def test_last_seen(self) -> None:
+        clock: FakeClock = FakeClock()
+        identity_map: BusinessIdentityMap = BusinessIdentityMap(clock=clock)
+        identity_map.intern(Business(**business("saucy")))
+        clock.now += 60
+        identity_map.intern(Business(**business("saucy")))
+
+        assert identity_map.last_seen("saucy") == clock.now
+        assert identity_map.last_seen("fudge") is None
+
+    def test_evicts_least_recently_seen(self) -> None:
+        identity_map: BusinessIdentityMap = BusinessIdentityMap(max_entries=2)
+        for business_id in ("saucy", "fudge", "saucy", "chai"):
+            identity_map.intern(Business(**business(business_id)))
+
+        assert identity_map.get("saucy") is not None
+        assert identity_map.get("fudge") is None
+        assert identity_map.evictions == 1
+
+    def test_models_are_recorded_separately(self) -> None:
+        identity_map: BusinessIdentityMap = BusinessIdentityMap()
+        identity_map.intern(Business(**business("saucy")))
+        match: BusinessMatch = BusinessMatch(id="saucy", alias="saucy", name="Saucy", location=LOCATION, phone="")
+
+        assert identity_map.intern(match) is match
+        assert identity_map.get("saucy", BusinessMatch) is match
+
+    def test_clear(self) -> None:
+        identity_map: BusinessIdentityMap = BusinessIdentityMap()
+        identity_map.intern(Business(**business("saucy")))
+        identity_map.clear()
+
+        assert len(identity_map) == 0
+
+    def test_invalid_max_entries(self) -> None:
+        with pytest.raises(ValueError):
+            BusinessIdentityMap(max_entries=0)
+
+
+class TestEndpointInterning:
+    def setup_method(self) -> None:
+        self.identity_map: BusinessIdentityMap = BusinessIdentityMap()
+        self.transport: StubTransport = StubTransport(
+            routes={
+                "/businesses/search/phone": {"businesses": [business("saucy")], "total": 1},
+                "/businesses/search": {
+                    "businesses": [business("saucy", distance=120.0), business("fudge")],
+                    "total": 2,
+                    "region": {"center": {"latitude": 37.8, "longitude": -122.27}},
+                },
+                "/transactions/delivery/search": {"businesses": [business("fudge")], "total": 1},
+                "/businesses/matches": {
+                    "businesses": [
+                        {"id": "saucy", "alias": "saucy", "name": "Saucy", "location": LOCATION, "phone": ""}
+                    ]
+                },
+            }
+        )
+        set_business_identity_map(self.identity_map)
+        set_transport(self.transport)
+        set_async_transport(self.transport)
+
+    def teardown_method(self) -> None:
+        set_business_identity_map(None)
+        set_cache(None)
+        set_transport(None)
+        set_async_transport(None)
+        reset_circuit_breakers()
+
+    def test_shared_across_endpoints(self) -> None:
+        search: BusinessSearch = Client.business_search(location="Oakland, CA").get()
+        phone: Business = Client.phone_search(phone="+14159083801").get().businesses[0]
+        delivery: Business = Client.transaction_search(location="Oakland, CA").get().businesses[0]
+
+        assert phone is self.identity_map.get("saucy")
+        assert delivery is search.businesses[1]
+        assert search.businesses[0] is phone
+        assert search.distances == [120.0, None]
+        assert len(self.identity_map) == 2
+
+    def test_business_matches(self) -> None:
+        match: BusinessMatch = (
+            Client.business_matches(name="Saucy", address1="1 Main St", city="Oakland", state="CA", country="US")
+            .get()
+            .businesses[0]
+        )
+
+        assert self.identity_map.get("saucy", BusinessMatch) is match
+
+    def test_async(self) -> None:
+        pytest.importorskip("httpx")
+
+        async def run() -> List[Business]:
+            search: BusinessSearch = await Client.business_search(location="Oakland, CA").aget()
+            return [search.businesses[0], (await Client.phone_search(phone="+14159083801").aget()).businesses[0]]
+
+        first, second = asyncio.run(run())
+
+        assert second is self.identity_map.get("saucy")
+        assert second.location is first.location
+
+    def test_cache_hits_are_not_interned_again(self) -> None:
+        clock: FakeClock = FakeClock()
+        identity_map: BusinessIdentityMap = BusinessIdentityMap(clock=clock)
+        set_business_identity_map(identity_map)
+        set_cache(MemoryCache())
+        first: BusinessSearch = Client.business_search(location="Oakland, CA").get()
+        seen: float = clock.now
+        clock.now += 60
+
+        assert Client.business_search(location="Oakland, CA").get() is first
+        assert identity_map.last_seen("saucy") == seen
+
+    def test_disabled_by_default(self) -> None:
+        set_business_identity_map(None)
+
+        first: Business = Client.phone_search(phone="+14159083801").get().businesses[0]
+
+        assert get_business_identity_map() is None
+        assert Client.phone_search(phone="+14159083801").get().businesses[0] is not first
+
+    def test_enabled_by_settings(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv("YELP_BUSINESS_IDENTITY_MAP", "true")
+        monkeypatch.setenv("YELP_BUSINESS_IDENTITY_MAP_SIZE", "10")
+        set_business_identity_map(None)
+
+        assert get_business_identity_map().max_entries == 10
+        assert get_business_identity_map() is get_business_identity_map()
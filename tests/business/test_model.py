@@ -23,7 +23,10 @@ class TestBusiness:
         "name": "Four Barrel Coffee",
         "image_url": "https://s3-media1.fl.yelpcdn.com/bphoto/e_urruIKpneV8yAXkAK9RA/o.jpg",
         "is_closed": False,
-        "url": "https://www.yelp.com/biz/four-barrel-coffee-san-francisco?adjust_creative=iLXKG_naOtwkmDCMRoHImA&utm_campaign=yelp_api_v3&utm_medium=api_v3_business_search&utm_source=iLXKG_naOtwkmDCMRoHImA",
+        "url": (
+            "https://www.yelp.com/biz/four-barrel-coffee-san-francisco?adjust_creative=iLXKG_naOtwkmDCMRoHImA&"
+            "utm_campaign=yelp_api_v3&utm_medium=api_v3_business_search&utm_source=iLXKG_naOtwkmDCMRoHImA"
+        ),
         "review_count": 2154,
         "categories": [{"alias": "coffee", "title": "Coffee & Tea"}],
         "rating": 4.0,
@@ -53,9 +56,9 @@ class TestBusiness:
         assert business.name == "Four Barrel Coffee"
         assert business.image_url == "https://s3-media1.fl.yelpcdn.com/bphoto/e_urruIKpneV8yAXkAK9RA/o.jpg"
         assert not business.is_closed
-        assert (
-            business.url
-            == "https://www.yelp.com/biz/four-barrel-coffee-san-francisco?adjust_creative=iLXKG_naOtwkmDCMRoHImA&utm_campaign=yelp_api_v3&utm_medium=api_v3_business_search&utm_source=iLXKG_naOtwkmDCMRoHImA"
+        assert business.url == (
+            "https://www.yelp.com/biz/four-barrel-coffee-san-francisco?adjust_creative=iLXKG_naOtwkmDCMRoHImA&"
+            "utm_campaign=yelp_api_v3&utm_medium=api_v3_business_search&utm_source=iLXKG_naOtwkmDCMRoHImA"
         )
         assert business.review_count == 2154
         assert business.categories[0].alias == "coffee"
@@ -109,7 +112,10 @@ class TestBusinessDetails:
         "image_url": "https://s3-media2.fl.yelpcdn.com/bphoto/CPc91bGzKBe95aM5edjhhQ/o.jpg",
         "is_claimed": True,
         "is_closed": False,
-        "url": "https://www.yelp.com/biz/gary-danko-san-francisco?adjust_creative=wpr6gw4FnptTrk1CeT8POg&utm_campaign=yelp_api_v3&utm_medium=api_v3_business_lookup&utm_source=wpr6gw4FnptTrk1CeT8POg",  # NOQA
+        "url": (
+            "https://www.yelp.com/biz/gary-danko-san-francisco?adjust_creative=wpr6gw4FnptTrk1CeT8POg&"
+            "utm_campaign=yelp_api_v3&utm_medium=api_v3_business_lookup&utm_source=wpr6gw4FnptTrk1CeT8POg"
+        ),
         "phone": "+14157492060",
         "display_phone": "(415) 749-2060",
         "review_count": 5296,
@@ -187,7 +193,11 @@ class TestBusinessSearch:
                 "name": "Rise & Grind Coffee and Tea",
                 "image_url": "https://s3-media3.fl.yelpcdn.com/bphoto/P3nSiVthgTWO4zZJjMsdkg/o.jpg",
                 "is_closed": False,
-                "url": "https://www.yelp.com/biz/rise-and-grind-coffee-and-tea-san-francisco-6?adjust_creative=iLXKG_naOtwkmDCMRoHImA&utm_campaign=yelp_api_v3&utm_medium=api_v3_business_search&utm_source=iLXKG_naOtwkmDCMRoHImA",
+                "url": (
+                    "https://www.yelp.com/biz/rise-and-grind-coffee-and-tea-san-francisco-6?"
+                    "adjust_creative=iLXKG_naOtwkmDCMRoHImA&utm_campaign=yelp_api_v3&utm_medium=api_v3_business_search&"
+                    "utm_source=iLXKG_naOtwkmDCMRoHImA"
+                ),
                 "review_count": 373,
                 "categories": [{"alias": "coffee", "title": "Coffee & Tea"}],
                 "rating": 4.5,
@@ -214,7 +224,10 @@ class TestBusinessSearch:
                 "name": "The Mill",
                 "image_url": "https://s3-media2.fl.yelpcdn.com/bphoto/3mYaiweH3tRKTLSLj24hVA/o.jpg",
                 "is_closed": False,
-                "url": "https://www.yelp.com/biz/the-mill-san-francisco?adjust_creative=iLXKG_naOtwkmDCMRoHImA&utm_campaign=yelp_api_v3&utm_medium=api_v3_business_search&utm_source=iLXKG_naOtwkmDCMRoHImA",
+                "url": (
+                    "https://www.yelp.com/biz/the-mill-san-francisco?adjust_creative=iLXKG_naOtwkmDCMRoHImA&"
+                    "utm_campaign=yelp_api_v3&utm_medium=api_v3_business_search&utm_source=iLXKG_naOtwkmDCMRoHImA"
+                ),
                 "review_count": 1283,
                 "categories": [
                     {"alias": "coffee", "title": "Coffee & Tea"},
@@ -248,7 +261,11 @@ class TestBusinessSearch:
                 "name": "Flywheel Coffee Roasters",
                 "image_url": "https://s3-media2.fl.yelpcdn.com/bphoto/hNFgdE_XYbZdH_ZcesWurg/o.jpg",
                 "is_closed": False,
-                "url": "https://www.yelp.com/biz/flywheel-coffee-roasters-san-francisco?adjust_creative=iLXKG_naOtwkmDCMRoHImA&utm_campaign=yelp_api_v3&utm_medium=api_v3_business_search&utm_source=iLXKG_naOtwkmDCMRoHImA",
+                "url": (
+                    "https://www.yelp.com/biz/flywheel-coffee-roasters-san-francisco?"
+                    "adjust_creative=iLXKG_naOtwkmDCMRoHImA&utm_campaign=yelp_api_v3&utm_medium=api_v3_business_search&"
+                    "utm_source=iLXKG_naOtwkmDCMRoHImA"
+                ),
                 "review_count": 539,
                 "categories": [
                     {"alias": "coffee", "title": "Coffee & Tea"},
@@ -346,7 +363,10 @@ class TestPhoneSearch:
                 "name": "Gary Danko",
                 "image_url": "https://s3-media0.fl.yelpcdn.com/bphoto/eyYUz3Xl7NtcJeN7x7SQwg/o.jpg",
                 "is_closed": False,
-                "url": "https://www.yelp.com/biz/gary-danko-san-francisco?adjust_creative=iLXKG_naOtwkmDCMRoHImA&utm_campaign=yelp_api_v3&utm_medium=api_v3_phone_search&utm_source=iLXKG_naOtwkmDCMRoHImA",
+                "url": (
+                    "https://www.yelp.com/biz/gary-danko-san-francisco?adjust_creative=iLXKG_naOtwkmDCMRoHImA&"
+                    "utm_campaign=yelp_api_v3&utm_medium=api_v3_phone_search&utm_source=iLXKG_naOtwkmDCMRoHImA"
+                ),
                 "review_count": 5733,
                 "categories": [
                     {"alias": "newamerican", "title": "American (New)"},
@@ -398,9 +418,16 @@ class TestReview:
             "image_url": "https://s3-media3.fl.yelpcdn.com/photo/iwoAD12zkONZxJ94ChAaMg/o.jpg",
             "name": "Ella A.",
         },
-        "text": "Went back again to this place since the last time i visited the bay area 5 months ago, and nothing has changed. Still the sketchy Mission, Still the cashier...",
+        "text": (
+            "Went back again to this place since the last time i visited the bay area 5 months ago, and nothing has "
+            "changed. Still the sketchy Mission, Still the cashier..."
+        ),
         "time_created": "2016-08-29 00:41:13",
-        "url": "https://www.yelp.com/biz/la-palma-mexicatessen-san-francisco?hrid=hp8hAJ-AnlpqxCCu7kyCWA&adjust_creative=0sidDfoTIHle5vvHEBvF0w&utm_campaign=yelp_api_v3&utm_medium=api_v3_business_reviews&utm_source=0sidDfoTIHle5vvHEBvF0w",
+        "url": (
+            "https://www.yelp.com/biz/la-palma-mexicatessen-san-francisco?hrid=hp8hAJ-AnlpqxCCu7kyCWA&"
+            "adjust_creative=0sidDfoTIHle5vvHEBvF0w&utm_campaign=yelp_api_v3&utm_medium=api_v3_business_reviews&"
+            "utm_source=0sidDfoTIHle5vvHEBvF0w"
+        ),
     }
 
     def test_deserialization(self) -> None:
@@ -408,14 +435,15 @@ class TestReview:
 
         assert review.id == "xAG4O7l-t1ubbwVAlPnDKg"
         assert review.rating == 5
-        assert (
-            review.text
-            == "Went back again to this place since the last time i visited the bay area 5 months ago, and nothing has changed. Still the sketchy Mission, Still the cashier..."
+        assert review.text == (
+            "Went back again to this place since the last time i visited the bay area 5 months ago, and nothing "
+            "has changed. Still the sketchy Mission, Still the cashier..."
         )
         assert review.time_created == datetime(2016, 8, 29, 0, 41, 13)
-        assert (
-            review.url
-            == "https://www.yelp.com/biz/la-palma-mexicatessen-san-francisco?hrid=hp8hAJ-AnlpqxCCu7kyCWA&adjust_creative=0sidDfoTIHle5vvHEBvF0w&utm_campaign=yelp_api_v3&utm_medium=api_v3_business_reviews&utm_source=0sidDfoTIHle5vvHEBvF0w"
+        assert review.url == (
+            "https://www.yelp.com/biz/la-palma-mexicatessen-san-francisco?hrid=hp8hAJ-AnlpqxCCu7kyCWA&"
+            "adjust_creative=0sidDfoTIHle5vvHEBvF0w&utm_campaign=yelp_api_v3&utm_medium=api_v3_business_reviews&"
+            "utm_source=0sidDfoTIHle5vvHEBvF0w"
         )
         assert review.user.id == "W8UK02IDdRS2GL_66fuq6w"
         assert review.user.profile_url == "https://www.yelp.com/user_details?userid=W8UK02IDdRS2GL_66fuq6w"
@@ -435,9 +463,16 @@ class TestReviews:
                     "image_url": "https://s3-media3.fl.yelpcdn.com/photo/iwoAD12zkONZxJ94ChAaMg/o.jpg",
                     "name": "Ella A.",
                 },
-                "text": "Went back again to this place since the last time i visited the bay area 5 months ago, and nothing has changed. Still the sketchy Mission, Still the cashier...",
+                "text": (
+                    "Went back again to this place since the last time i visited the bay area 5 months ago, and "
+                    "nothing has changed. Still the sketchy Mission, Still the cashier..."
+                ),
                 "time_created": "2016-08-29 00:41:13",
-                "url": "https://www.yelp.com/biz/la-palma-mexicatessen-san-francisco?hrid=hp8hAJ-AnlpqxCCu7kyCWA&adjust_creative=0sidDfoTIHle5vvHEBvF0w&utm_campaign=yelp_api_v3&utm_medium=api_v3_business_reviews&utm_source=0sidDfoTIHle5vvHEBvF0w",
+                "url": (
+                    "https://www.yelp.com/biz/la-palma-mexicatessen-san-francisco?hrid=hp8hAJ-AnlpqxCCu7kyCWA&"
+                    "adjust_creative=0sidDfoTIHle5vvHEBvF0w&utm_campaign=yelp_api_v3&"
+                    "utm_medium=api_v3_business_reviews&utm_source=0sidDfoTIHle5vvHEBvF0w"
+                ),
             },
             {
                 "id": "1JNmYjJXr9ZbsfZUAgkeXQ",
@@ -448,9 +483,16 @@ class TestReviews:
                     "image_url": None,
                     "name": "Yanni L.",
                 },
-                "text": 'The "restaurant" is inside a small deli so there is no sit down area. Just grab and go.\n\nInside, they sell individually packaged ingredients so that you can...',
+                "text": (
+                    'The "restaurant" is inside a small deli so there is no sit down area. Just grab and '
+                    "go.\n\nInside, they sell individually packaged ingredients so that you can..."
+                ),
                 "time_created": "2016-09-28 08:55:29",
-                "url": "https://www.yelp.com/biz/la-palma-mexicatessen-san-francisco?hrid=fj87uymFDJbq0Cy5hXTHIA&adjust_creative=0sidDfoTIHle5vvHEBvF0w&utm_campaign=yelp_api_v3&utm_medium=api_v3_business_reviews&utm_source=0sidDfoTIHle5vvHEBvF0w",
+                "url": (
+                    "https://www.yelp.com/biz/la-palma-mexicatessen-san-francisco?hrid=fj87uymFDJbq0Cy5hXTHIA&"
+                    "adjust_creative=0sidDfoTIHle5vvHEBvF0w&utm_campaign=yelp_api_v3&"
+                    "utm_medium=api_v3_business_reviews&utm_source=0sidDfoTIHle5vvHEBvF0w"
+                ),
             },
             {
                 "id": "SIoiwwVRH6R2s2ipFfs4Ww",
@@ -461,9 +503,16 @@ class TestReviews:
                     "image_url": None,
                     "name": "Suavecito M.",
                 },
-                "text": "Dear Mission District,\n\nI miss you and your many delicious late night food establishments and vibrant atmosphere.  I miss the way you sound and smell on a...",
+                "text": (
+                    "Dear Mission District,\n\nI miss you and your many delicious late night food establishments and "
+                    "vibrant atmosphere.  I miss the way you sound and smell on a..."
+                ),
                 "time_created": "2016-08-10 07:56:44",
-                "url": "https://www.yelp.com/biz/la-palma-mexicatessen-san-francisco?hrid=m_tnQox9jqWeIrU87sN-IQ&adjust_creative=0sidDfoTIHle5vvHEBvF0w&utm_campaign=yelp_api_v3&utm_medium=api_v3_business_reviews&utm_source=0sidDfoTIHle5vvHEBvF0w",
+                "url": (
+                    "https://www.yelp.com/biz/la-palma-mexicatessen-san-francisco?hrid=m_tnQox9jqWeIrU87sN-IQ&"
+                    "adjust_creative=0sidDfoTIHle5vvHEBvF0w&utm_campaign=yelp_api_v3&"
+                    "utm_medium=api_v3_business_reviews&utm_source=0sidDfoTIHle5vvHEBvF0w"
+                ),
             },
         ],
         "total": 3,
@@ -477,14 +526,15 @@ class TestReviews:
         assert reviews.possible_languages == ["en"]
         assert reviews.reviews[1].id == "1JNmYjJXr9ZbsfZUAgkeXQ"
         assert reviews.reviews[1].rating == 4
-        assert (
-            reviews.reviews[1].text
-            == 'The "restaurant" is inside a small deli so there is no sit down area. Just grab and go.\n\nInside, they sell individually packaged ingredients so that you can...'
+        assert reviews.reviews[1].text == (
+            'The "restaurant" is inside a small deli so there is no sit down area. Just grab and go.\n\nInside, '
+            "they sell individually packaged ingredients so that you can..."
         )
         assert reviews.reviews[1].time_created == datetime(2016, 9, 28, 8, 55, 29)
-        assert (
-            reviews.reviews[1].url
-            == "https://www.yelp.com/biz/la-palma-mexicatessen-san-francisco?hrid=fj87uymFDJbq0Cy5hXTHIA&adjust_creative=0sidDfoTIHle5vvHEBvF0w&utm_campaign=yelp_api_v3&utm_medium=api_v3_business_reviews&utm_source=0sidDfoTIHle5vvHEBvF0w"
+        assert reviews.reviews[1].url == (
+            "https://www.yelp.com/biz/la-palma-mexicatessen-san-francisco?hrid=fj87uymFDJbq0Cy5hXTHIA&"
+            "adjust_creative=0sidDfoTIHle5vvHEBvF0w&utm_campaign=yelp_api_v3&utm_medium=api_v3_business_reviews&"
+            "utm_source=0sidDfoTIHle5vvHEBvF0w"
         )
 
 
@@ -0,0 +1,221 @@
+import asyncio
+import gzip
+import json
+import time
+from pathlib import Path
+from typing import List
+
+import pytest
+
+from tests.conftest import FakeClock
+from yelpfusion3.breaker import reset_circuit_breakers
+from yelpfusion3.cache import get_revalidator
+from yelpfusion3.category.catalog import (
+    BUNDLED_SNAPSHOT,
+    CategoryCatalog,
+    get_category_catalog,
+    reset_category_catalogs,
+)
+from yelpfusion3.category.endpoint import CategoryDetailsEndpoint
+from yelpfusion3.category.model import Category, CategoryDetails
+from yelpfusion3.client import Client
+from yelpfusion3.transport import StubTransport, set_async_transport, set_transport
+
+CATEGORIES: dict = {
+    "categories": [
+        {"alias": "nightlife", "title": "Nightlife", "parent_aliases": []},
+        {"alias": "bars", "title": "Bars", "parent_aliases": ["nightlife"], "country_blacklist": ["XX"]},
+        {"alias": "pubs", "title": "Pubs", "parent_aliases": ["bars"]},
+    ]
+}
+
+
+def wait_for_refresh() -> None:
+    for _ in range(100):
+        if not get_revalidator().pending:
+            return
+        time.sleep(0.01)
+
+
+class TestCategoryCatalog:
+    def setup_method(self) -> None:
+        self.transport: StubTransport = StubTransport(routes={"/categories": CATEGORIES})
+        set_transport(self.transport)
+
+    def teardown_method(self) -> None:
+        wait_for_refresh()
+        set_transport(None)
+        reset_circuit_breakers()
+
+    def test_bundled_snapshot(self) -> None:
+        # The bundled snapshot is stale, so keep its background refresh from replacing it.
+        set_transport(StubTransport())
+        catalog: CategoryCatalog = CategoryCatalog()
+
+        assert catalog.get("restaurants").title == "Restaurants"
+        assert catalog.get("restaurants").parent_aliases == []
+        assert "bars" not in catalog
+        assert catalog.fetched_at == 0
+
+    def test_other_locales_start_empty(self) -> None:
+        set_transport(StubTransport())
+
+        assert CategoryCatalog(locale="en_US").get("restaurants").title == "Restaurants"
+        assert CategoryCatalog(locale="fr_FR").get("restaurants") is None
+
+    def test_refresh(self) -> None:
+        clock: FakeClock = FakeClock()
+        catalog: CategoryCatalog = CategoryCatalog(clock=clock)
+
+        assert catalog.refresh() == 3
+        assert len(catalog) == 3
+        assert catalog.get("bars") == Category(**CATEGORIES["categories"][1])
+        assert catalog.details("pubs") == CategoryDetails(category=CATEGORIES["categories"][2])
+        assert catalog.details("restaurants") is None
+        assert catalog.fetched_at == clock.now
+        assert not catalog.stale
+
+    def test_locale(self) -> None:
+        CategoryCatalog(locale="fr_FR").refresh()
+
+        assert self.transport.requests == ["https://api.yelp.com/v3/categories?locale=fr_FR"]
+
+    def test_saved_snapshot(self, tmp_path: Path) -> None:
+        path: Path = tmp_path / "catalogs" / "categories-all.json.gz"
+        CategoryCatalog(path=path).refresh()
+        set_transport(StubTransport())
+
+        catalog: CategoryCatalog = CategoryCatalog(path=path)
+
+        assert catalog.get("bars") == Category(**CATEGORIES["categories"][1])
+        assert catalog.get("pubs").country_blacklist == []
+        with gzip.open(path, "rt") as file:
+            assert json.load(file)["categories"][1] == ["bars", "Bars", ["nightlife"], [], ["XX"]]
+
+    def test_uncompressed_snapshot(self, tmp_path: Path) -> None:
+        path: Path = tmp_path / "snapshot.json"
+        CategoryCatalog(path=path).refresh()
+        set_transport(StubTransport())
+
+        assert json.loads(path.read_text(encoding="utf-8"))["categories"][1] == [
+            "bars",
+            "Bars",
+            ["nightlife"],
+            [],
+            ["XX"],
+        ]
+        assert CategoryCatalog(path=path).get("bars") == Category(**CATEGORIES["categories"][1])
+
+    def test_damaged_snapshot(self, tmp_path: Path) -> None:
+        path: Path = tmp_path / "categories-all.json.gz"
+        path.write_bytes(b"not gzip")
+
+        assert CategoryCatalog(path=path).get("restaurants").title == "Restaurants"
+
+    def test_scheduled_refresh(self) -> None:
+        clock: FakeClock = FakeClock()
+        catalog: CategoryCatalog = CategoryCatalog(refresh_interval=3600, clock=clock)
+
+        assert catalog.get("bars") is None
+        wait_for_refresh()
+        assert catalog.get("bars").title == "Bars"
+
+        clock.now += 1800
+        catalog.get("bars")
+        clock.now += 1800
+        catalog.get("bars")
+        wait_for_refresh()
+
+        assert len(self.transport.requests) == 2
+
+    def test_failed_refresh_waits_before_retrying(self) -> None:
+        set_transport(StubTransport())
+        clock: FakeClock = FakeClock()
+        catalog: CategoryCatalog = CategoryCatalog(clock=clock)
+
+        for _ in range(3):
+            catalog.get("bars")
+            wait_for_refresh()
+        set_transport(self.transport)
+        clock.now += 60
+        catalog.get("bars")
+        wait_for_refresh()
+
+        assert catalog.get("bars").title == "Bars"
+
+    def test_invalid_refresh_interval(self) -> None:
+        with pytest.raises(ValueError):
+            CategoryCatalog(refresh_interval=0)
+
+    def test_bundled_snapshot_is_valid(self) -> None:
+        snapshot: dict = json.loads(BUNDLED_SNAPSHOT.read_text(encoding="utf-8"))
+
+        fields: List[str] = ["alias", "title", "parent_aliases", "country_whitelist", "country_blacklist"]
+
+        assert all(Category(**dict(zip(fields, row))) for row in snapshot["categories"])
+
+
+class TestCategoryDetailsFromCatalog:
+    def setup_method(self) -> None:
+        self.transport: StubTransport = StubTransport(
+            routes={
+                "/categories": CATEGORIES,
+                "/categories/*": {"category": {"alias": "tapas", "title": "Tapas"}},
+            }
+        )
+        set_transport(self.transport)
+        set_async_transport(self.transport)
+
+    def teardown_method(self) -> None:
+        wait_for_refresh()
+        set_transport(None)
+        reset_circuit_breakers()
+        set_async_transport(None)
+        reset_category_catalogs()
+
+    @pytest.fixture(autouse=True)
+    def enable_catalog(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv("YELP_CATEGORY_CATALOG", "true")
+        monkeypatch.setenv("YELP_CATEGORY_CATALOG_DIR", str(tmp_path))
+
+    def test_answers_from_catalog(self, tmp_path: Path) -> None:
+        get_category_catalog().refresh()
+
+        details: List[CategoryDetails] = [Client.category_details(alias=alias).get() for alias in ("bars", "pubs")]
+
+        assert [category_details.category.title for category_details in details] == ["Bars", "Pubs"]
+        assert self.transport.requests == ["https://api.yelp.com/v3/categories"]
+        assert (tmp_path / "categories-all.json.gz").exists()
+
+    def test_async(self) -> None:
+        pytest.importorskip("httpx")
+        get_category_catalog().refresh()
+
+        async def run() -> CategoryDetails:
+            return await Client.category_details(alias="bars").aget()
+
+        assert asyncio.run(run()).category.title == "Bars"
+        assert len(self.transport.requests) == 1
+
+    def test_unknown_alias_is_requested(self) -> None:
+        get_category_catalog().refresh()
+
+        assert Client.category_details(alias="tapas").get().category.title == "Tapas"
+
+    def test_other_locale_is_requested_until_refreshed(self) -> None:
+        self.transport.routes["/categories/*"] = {"category": {"alias": "active", "title": "Sports et loisirs"}}
+
+        details: CategoryDetails = CategoryDetailsEndpoint(alias="active", locale="fr_FR").get()
+
+        assert details.category.title == "Sports et loisirs"
+        assert "https://api.yelp.com/v3/categories/active?locale=fr_FR" in self.transport.requests
+
+    def test_catalog_per_locale(self) -> None:
+        assert get_category_catalog("fr_FR") is get_category_catalog("fr_FR")
+        assert get_category_catalog("fr_FR") is not get_category_catalog()
+        assert get_category_catalog("fr_FR").path.name == "categories-fr_FR.json.gz"
+
+    def test_disabled(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv("YELP_CATEGORY_CATALOG", "false")
+
+        assert Client.category_details(alias="bars").get().category.title == "Tapas"
@@ -0,0 +1,107 @@
+import json
+from typing import Dict, Iterator, Optional
+
+import pytest
+
+from yelpfusion3.settings import reset_settings
+
+
+class SettingsMonkeyPatch(pytest.MonkeyPatch):
+    """
+    Re-reads the shared settings whenever a test changes the environment.
+    """
+
+    def setenv(self, name: str, value: str, prepend=None) -> None:
+        super().setenv(name, value, prepend)
+        reset_settings()
+
+    def delenv(self, name: str, raising: bool = True) -> None:
+        super().delenv(name, raising)
+        reset_settings()
+
+    def undo(self) -> None:
+        super().undo()
+        reset_settings()
+
+
+@pytest.fixture
+def monkeypatch() -> Iterator[pytest.MonkeyPatch]:
+    patch: SettingsMonkeyPatch = SettingsMonkeyPatch()
+    yield patch
+    patch.undo()
+
+
+@pytest.fixture(autouse=True)
+def fresh_settings() -> Iterator[None]:
+    reset_settings()
+    yield
+    reset_settings()
+
+
+LOCATION: dict = {
+    "city": "Oakland",
+    "state": "CA",
+    "zip_code": "94612",
+    "country": "US",
+    "display_address": ["Oakland, CA 94612"],
+}
+
+
+def business(business_id: str, **fields) -> dict:
+    """
+    A business as returned by the business searches, with ``fields`` added or replaced.
+    """
+
+    return {
+        "id": business_id,
+        "alias": business_id,
+        "name": business_id.title(),
+        "is_closed": False,
+        "url": f"https://www.yelp.com/biz/{business_id}",
+        "display_phone": "",
+        "review_count": 1,
+        "categories": [],
+        "rating": 4.5,
+        "location": LOCATION,
+        "transactions": [],
+        **fields,
+    }
+
+
+class FakeClock:
+    """
+    A clock that only moves when a test advances ``now``.
+    """
+
+    def __init__(self, now: float = 1_700_000_000.0) -> None:
+        self.now: float = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class FakeResponse:
+    """
+    Stands in for a response with the attributes that retries, hedging and circuit breakers read.
+    """
+
+    def __init__(
+        self,
+        status_code: int = 200,
+        payload: Optional[dict] = None,
+        headers: Optional[Dict[str, str]] = None,
+        attempt: int = 0,
+    ) -> None:
+        self.status_code: int = status_code
+        self.payload: Optional[dict] = payload
+        self.headers: Dict[str, str] = headers or {}
+        self.attempt: int = attempt
+
+    @property
+    def content(self) -> bytes:
+        return json.dumps(self.payload).encode()
+
+    def json(self) -> dict:
+        if self.payload is None:
+            raise ValueError("No JSON body.")
+        return self.payload
@@ -37,8 +37,15 @@ class TestEvent:
         "category": "nightlife",
         "cost": None,
         "cost_max": None,
-        "description": 'Come join the Yelp Team and all of Yelpland in celebrating our 3rd Annual Yelp Holiday Party! Just some of the "funny, useful and cool" thrills will include...',
-        "event_site_url": "https://www.yelp.com/events/san-francisco-peace-love-and-yelp-our-3rd-annual-holiday-party?adjust_creative=iLXKG_naOtwkmDCMRoHImA&utm_campaign=yelp_api_v3&utm_medium=api_v3_event_search&utm_source=iLXKG_naOtwkmDCMRoHImA",
+        "description": (
+            "Come join the Yelp Team and all of Yelpland in celebrating our 3rd Annual Yelp Holiday Party! Just some "
+            'of the "funny, useful and cool" thrills will include...'
+        ),
+        "event_site_url": (
+            "https://www.yelp.com/events/san-francisco-peace-love-and-yelp-our-3rd-annual-holiday-party?"
+            "adjust_creative=iLXKG_naOtwkmDCMRoHImA&utm_campaign=yelp_api_v3&utm_medium=api_v3_event_search&"
+            "utm_source=iLXKG_naOtwkmDCMRoHImA"
+        ),
         "id": "san-francisco-peace-love-and-yelp-our-3rd-annual-holiday-party",
         "image_url": "https://s3-media2.fl.yelpcdn.com/ephoto/5Y1VFZBPHF9IIOO_IIpnhQ/o.jpg",
         "interested_count": 73,
@@ -72,9 +79,9 @@ class TestEvent:
         assert event.category == "nightlife"
         assert not event.cost
         assert not event.cost_max
-        assert (
-            event.description
-            == 'Come join the Yelp Team and all of Yelpland in celebrating our 3rd Annual Yelp Holiday Party! Just some of the "funny, useful and cool" thrills will include...'
+        assert event.description == (
+            "Come join the Yelp Team and all of Yelpland in celebrating our 3rd Annual Yelp Holiday Party! Just "
+            'some of the "funny, useful and cool" thrills will include...'
         )
         assert event.id == "san-francisco-peace-love-and-yelp-our-3rd-annual-holiday-party"
         assert event.interested_count == 73
@@ -108,8 +115,15 @@ class TestEventSearch:
                 "category": "nightlife",
                 "cost": None,
                 "cost_max": None,
-                "description": 'Come join the Yelp Team and all of Yelpland in celebrating our 3rd Annual Yelp Holiday Party! Just some of the "funny, useful and cool" thrills will include...',
-                "event_site_url": "https://www.yelp.com/events/san-francisco-peace-love-and-yelp-our-3rd-annual-holiday-party?adjust_creative=iLXKG_naOtwkmDCMRoHImA&utm_campaign=yelp_api_v3&utm_medium=api_v3_event_search&utm_source=iLXKG_naOtwkmDCMRoHImA",
+                "description": (
+                    "Come join the Yelp Team and all of Yelpland in celebrating our 3rd Annual Yelp Holiday Party! "
+                    'Just some of the "funny, useful and cool" thrills will include...'
+                ),
+                "event_site_url": (
+                    "https://www.yelp.com/events/san-francisco-peace-love-and-yelp-our-3rd-annual-holiday-party?"
+                    "adjust_creative=iLXKG_naOtwkmDCMRoHImA&utm_campaign=yelp_api_v3&utm_medium=api_v3_event_search&"
+                    "utm_source=iLXKG_naOtwkmDCMRoHImA"
+                ),
                 "id": "san-francisco-peace-love-and-yelp-our-3rd-annual-holiday-party",
                 "image_url": "https://s3-media2.fl.yelpcdn.com/ephoto/5Y1VFZBPHF9IIOO_IIpnhQ/o.jpg",
                 "interested_count": 73,
@@ -147,9 +161,9 @@ class TestEventSearch:
         assert event_search.events[0].category == "nightlife"
         assert not event_search.events[0].cost
         assert not event_search.events[0].cost_max
-        assert (
-            event_search.events[0].description
-            == 'Come join the Yelp Team and all of Yelpland in celebrating our 3rd Annual Yelp Holiday Party! Just some of the "funny, useful and cool" thrills will include...'
+        assert event_search.events[0].description == (
+            "Come join the Yelp Team and all of Yelpland in celebrating our 3rd Annual Yelp Holiday Party! Just "
+            'some of the "funny, useful and cool" thrills will include...'
         )
         assert event_search.events[0].id == "san-francisco-peace-love-and-yelp-our-3rd-annual-holiday-party"
         assert event_search.events[0].interested_count == 73
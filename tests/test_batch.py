@@ -0,0 +1,84 @@
+import time
+from typing import List
+
+import pytest
+
+from yelpfusion3.batch import Batch, BatchResult, BatchStats
+from yelpfusion3.category.model import Categories
+from yelpfusion3.client import Client
+from yelpfusion3.endpoint import Endpoint
+
+
+class FakeEndpoint(Endpoint):
+    _path: str = "/fake"
+
+    delay: float = 0.0
+    fail: bool = False
+
+    def get(self) -> Categories:
+        time.sleep(self.delay)
+        if self.fail:
+            raise RuntimeError("Request failed.")
+        return Categories(categories=[])
+
+    async def aget(self) -> Categories:
+        return self.get()
+
+
+class TestBatch:
+    def test_ordered(self) -> None:
+        endpoints: List[FakeEndpoint] = [FakeEndpoint(delay=delay) for delay in (0.05, 0.0, 0.02, 0.0)]
+
+        results: List[BatchResult] = list(Client.get_many(endpoints, max_workers=4))
+
+        assert [result.index for result in results] == [0, 1, 2, 3]
+        assert [result.endpoint for result in results] == endpoints
+
+    def test_unordered(self) -> None:
+        endpoints: List[FakeEndpoint] = [FakeEndpoint(delay=0.2), FakeEndpoint(), FakeEndpoint()]
+
+        results: List[BatchResult] = list(Client.get_many(endpoints, max_workers=3, ordered=False))
+
+        assert results[-1].index == 0
+        assert sorted(result.index for result in results) == [0, 1, 2]
+
+    def test_errors_do_not_abort_batch(self) -> None:
+        batch: Batch = Client.get_many([FakeEndpoint(), FakeEndpoint(fail=True), FakeEndpoint()], max_workers=2)
+
+        results: List[BatchResult] = list(batch)
+
+        assert [result.ok for result in results] == [True, False, True]
+        assert isinstance(results[1].error, RuntimeError)
+        assert results[1].result is None
+        assert isinstance(results[0].result, Categories)
+        assert batch.stats.succeeded == 2
+        assert batch.stats.failed == 1
+
+    def test_lazy_iterable(self) -> None:
+        batch: Batch = Client.get_many((FakeEndpoint() for _ in range(100)), max_workers=4)
+
+        assert sum(1 for _ in batch) == 100
+        assert batch.stats.completed == 100
+        assert batch.stats.throughput > 0
+
+    def test_invalid_max_workers(self) -> None:
+        with pytest.raises(ValueError):
+            Batch([], max_workers=0)
+
+
+class TestBatchStats:
+    def test_percentile(self) -> None:
+        stats: BatchStats = BatchStats(succeeded=4, elapsed=2.0, latencies=[0.4, 0.1, 0.3, 0.2])
+
+        assert stats.throughput == 2.0
+        assert stats.mean_latency == pytest.approx(0.25)
+        assert stats.percentile(50) == 0.2
+        assert stats.percentile(99) == 0.4
+        assert stats.percentile(0) == 0.1
+
+    def test_empty(self) -> None:
+        stats: BatchStats = BatchStats()
+
+        assert stats.throughput == 0.0
+        assert stats.mean_latency == 0.0
+        assert stats.percentile(99) == 0.0
@@ -0,0 +1,194 @@
+import asyncio
+import time
+
+import pytest
+import requests
+
+from tests.conftest import FakeClock, FakeResponse
+from yelpfusion3.breaker import (
+    CircuitBreaker,
+    CircuitState,
+    circuit_breakers,
+    get_circuit_breaker,
+    reset_circuit_breakers,
+)
+from yelpfusion3.exceptions import CircuitOpenError, DeadlineExceededError
+from yelpfusion3.settings import get_settings
+from yelpfusion3.timeout import deadline
+
+
+def trip(circuit_breaker: CircuitBreaker, calls: int = 4) -> None:
+    for _ in range(calls):
+        circuit_breaker.record(failed=True, duration=0.1)
+
+
+class TestCircuitBreaker:
+    def test_opens_on_failure_rate(self) -> None:
+        circuit_breaker: CircuitBreaker = CircuitBreaker(path="/events", window_size=4, minimum_calls=4)
+
+        circuit_breaker.record(failed=False, duration=0.1)
+        circuit_breaker.record(failed=True, duration=0.1)
+        circuit_breaker.record(failed=False, duration=0.1)
+        assert circuit_breaker.state is CircuitState.CLOSED
+
+        circuit_breaker.record(failed=True, duration=0.1)
+        assert circuit_breaker.state is CircuitState.OPEN
+        assert circuit_breaker.failure_rate == 0.5
+
+    def test_opens_on_slow_call_rate(self) -> None:
+        circuit_breaker: CircuitBreaker = CircuitBreaker(
+            path="/events", slow_call_duration=1.0, slow_call_rate_threshold=0.5, window_size=2, minimum_calls=2
+        )
+
+        circuit_breaker.record(failed=False, duration=2.0)
+        circuit_breaker.record(failed=False, duration=3.0)
+
+        assert circuit_breaker.state is CircuitState.OPEN
+        assert circuit_breaker.slow_call_rate == 1.0
+
+    def test_rejects_while_open(self) -> None:
+        clock: FakeClock = FakeClock()
+        circuit_breaker: CircuitBreaker = CircuitBreaker(
+            path="/events", window_size=4, minimum_calls=4, open_duration=30.0, clock=clock
+        )
+        trip(circuit_breaker)
+        clock.now += 10
+
+        with pytest.raises(CircuitOpenError) as error:
+            circuit_breaker.before_call()
+
+        assert error.value.path == "/events"
+        assert error.value.retry_after == pytest.approx(20.0)
+
+    def test_half_open_probe_closes(self) -> None:
+        clock: FakeClock = FakeClock()
+        circuit_breaker: CircuitBreaker = CircuitBreaker(
+            path="/events", window_size=4, minimum_calls=4, open_duration=30.0, clock=clock
+        )
+        trip(circuit_breaker)
+        clock.now += 30
+
+        assert circuit_breaker.state is CircuitState.HALF_OPEN
+        circuit_breaker.before_call()
+        with pytest.raises(CircuitOpenError):
+            circuit_breaker.before_call()
+
+        circuit_breaker.record(failed=False, duration=0.1)
+        assert circuit_breaker.state is CircuitState.CLOSED
+        assert circuit_breaker.failure_rate == 0.0
+
+    def test_half_open_probe_reopens(self) -> None:
+        clock: FakeClock = FakeClock()
+        circuit_breaker: CircuitBreaker = CircuitBreaker(
+            path="/events", window_size=4, minimum_calls=4, open_duration=30.0, clock=clock
+        )
+        trip(circuit_breaker)
+        clock.now += 30
+        circuit_breaker.before_call()
+
+        circuit_breaker.record(failed=True, duration=0.1)
+
+        assert circuit_breaker.state is CircuitState.OPEN
+
+    def test_call_records_server_errors_and_exceptions(self) -> None:
+        circuit_breaker: CircuitBreaker = CircuitBreaker(path="/events", window_size=4, minimum_calls=4)
+
+        assert circuit_breaker.call(lambda: FakeResponse(200)).status_code == 200
+        assert circuit_breaker.call(lambda: FakeResponse(404)).status_code == 404
+        assert circuit_breaker.call(lambda: FakeResponse(503)).status_code == 503
+        with pytest.raises(requests.ConnectionError):
+            circuit_breaker.call(lambda: (_ for _ in ()).throw(requests.ConnectionError()))
+
+        assert circuit_breaker.state is CircuitState.OPEN
+
+    def test_acall(self) -> None:
+        circuit_breaker: CircuitBreaker = CircuitBreaker(path="/events", window_size=1, minimum_calls=1)
+
+        async def send() -> FakeResponse:
+            return FakeResponse(500)
+
+        asyncio.run(circuit_breaker.acall(send))
+
+        assert circuit_breaker.state is CircuitState.OPEN
+        with pytest.raises(CircuitOpenError):
+            asyncio.run(circuit_breaker.acall(send))
+
+    def test_deadline_is_not_recorded(self) -> None:
+        clock: FakeClock = FakeClock()
+        circuit_breaker: CircuitBreaker = CircuitBreaker(
+            path="/events", window_size=1, minimum_calls=1, open_duration=30.0, clock=clock
+        )
+        trip(circuit_breaker, calls=1)
+        clock.now += 30
+
+        with pytest.raises(DeadlineExceededError):
+            circuit_breaker.call(lambda: (_ for _ in ()).throw(DeadlineExceededError()))
+
+        assert circuit_breaker.state is CircuitState.HALF_OPEN
+        assert circuit_breaker.call(lambda: FakeResponse(200)).status_code == 200
+        assert circuit_breaker.state is CircuitState.CLOSED
+
+    def test_timeout_shortened_by_deadline_is_not_recorded(self) -> None:
+        circuit_breaker: CircuitBreaker = CircuitBreaker(path="/events", window_size=1, minimum_calls=1)
+
+        def send() -> FakeResponse:
+            time.sleep(0.02)
+            raise requests.ReadTimeout()
+
+        with deadline(0.01), pytest.raises(requests.ReadTimeout):
+            circuit_breaker.call(send)
+        assert circuit_breaker.state is CircuitState.CLOSED
+
+        with pytest.raises(requests.ReadTimeout):
+            circuit_breaker.call(send)
+        assert circuit_breaker.state is CircuitState.OPEN
+
+    def test_cancellation_is_not_recorded(self) -> None:
+        circuit_breaker: CircuitBreaker = CircuitBreaker(path="/events", window_size=1, minimum_calls=1)
+
+        async def run() -> None:
+            task: asyncio.Task = asyncio.ensure_future(circuit_breaker.acall(lambda: asyncio.sleep(1)))
+            await asyncio.sleep(0)
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+
+        asyncio.run(run())
+
+        assert circuit_breaker.state is CircuitState.CLOSED
+        assert circuit_breaker.failure_rate == 0.0
+
+    def test_reset(self) -> None:
+        circuit_breaker: CircuitBreaker = CircuitBreaker(path="/events", window_size=4, minimum_calls=4)
+        trip(circuit_breaker)
+
+        circuit_breaker.reset()
+
+        assert circuit_breaker.state is CircuitState.CLOSED
+
+    @pytest.mark.parametrize(
+        "arguments", [{"failure_rate_threshold": 0}, {"slow_call_rate_threshold": 1.5}, {"minimum_calls": 30}]
+    )
+    def test_invalid_arguments(self, arguments: dict) -> None:
+        with pytest.raises(ValueError):
+            CircuitBreaker(path="/events", **arguments)
+
+
+class TestCircuitBreakerRegistry:
+    def teardown_method(self) -> None:
+        reset_circuit_breakers()
+
+    def test_one_breaker_per_path(self) -> None:
+        search: CircuitBreaker = get_circuit_breaker("/businesses/search")
+
+        assert get_circuit_breaker("/businesses/search") is search
+        assert get_circuit_breaker("/events") is not search
+        assert set(circuit_breakers()) == {"/businesses/search", "/events"}
+
+    def test_from_settings(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv("YELP_BREAKER_OPEN_DURATION", "5")
+
+        assert get_circuit_breaker("/categories").open_duration == 5.0
+
+    def test_opt_in(self) -> None:
+        assert not get_settings().circuit_breaker
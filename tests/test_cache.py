@@ -0,0 +1,884 @@
+import asyncio
+import json
+import time
+import zlib
+from multiprocessing import get_context
+from pathlib import Path
+from threading import Thread, current_thread, main_thread
+from typing import List, Optional
+
+import pytest
+
+from tests.conftest import FakeClock
+from yelpfusion3.business.endpoint import (
+    BusinessDetailsEndpoint,
+    BusinessSearchEndpoint,
+    PhoneSearchEndpoint,
+    TransactionSearchEndpoint,
+)
+from yelpfusion3.business.model import PhoneSearch
+from yelpfusion3.cache import (
+    Cache,
+    CacheEntry,
+    CacheStats,
+    CompressedMemoryCache,
+    MemoryCache,
+    SqliteCache,
+    caching,
+    caching_enabled,
+    canonical_key,
+    get_cache,
+    get_revalidator,
+    normalize_location,
+    set_cache,
+    snap,
+)
+from yelpfusion3.category.endpoint import AllCategoriesEndpoint, CategoryDetailsEndpoint
+from yelpfusion3.category.model import CategoryDetails
+from yelpfusion3.client import Client
+from yelpfusion3.event.endpoint import EventLookupEndpoint, EventSearchEndpoint
+from yelpfusion3.exceptions import ApiError
+from yelpfusion3.model import NegativeResult
+from yelpfusion3.transport import StubResponse, StubTransport, set_async_transport, set_transport
+
+BARS: dict = {"category": {"alias": "bars", "title": "Bars"}}
+PUBS: dict = {"category": {"alias": "bars", "title": "Pubs"}}
+
+
+def write_and_read(path: Path, worker: int) -> int:
+    cache: SqliteCache = SqliteCache(path=path, sweep_interval=10)
+    hits: int = 0
+    for index in range(50):
+        cache.set(f"{worker}:{index}", CacheEntry.create(f"{worker}:{index}".encode(), ttl=60))
+        hits += sum(cache.get(f"{other}:{index}") is not None for other in range(4))
+    return hits
+
+
+class TestCacheEntry:
+    def test_expiry(self) -> None:
+        assert not CacheEntry.create(b"{}", ttl=60).expired
+        assert CacheEntry.create(b"{}", ttl=0).expired
+
+    def test_parse_once(self) -> None:
+        entry: CacheEntry = CacheEntry.create(json.dumps(BARS).encode(), ttl=60)
+
+        category_details: CategoryDetails = entry.parse(CategoryDetails)
+
+        assert category_details.category.alias == "bars"
+        assert entry.parse(CategoryDetails) is category_details
+
+    def test_negative(self) -> None:
+        entry: CacheEntry = CacheEntry.create(b'{"status_code": 404}', ttl=60, negative=True)
+
+        assert entry.negative
+        assert entry.parse(NegativeResult) == NegativeResult(status_code=404)
+
+    def test_stale_until(self) -> None:
+        assert CacheEntry(body=b"{}", expires_at=10.0).stale_until == 10.0
+
+        entry: CacheEntry = CacheEntry.create(b"{}", ttl=0, max_stale=60)
+
+        assert entry.expired
+        assert entry.usable
+
+    def test_validators(self) -> None:
+        entry: CacheEntry = CacheEntry.create(b"{}", ttl=60, etag='"v1"', last_modified="Tue, 15 Nov 1994 08:12:31 GMT")
+
+        assert entry.validators == {"If-None-Match": '"v1"', "If-Modified-Since": "Tue, 15 Nov 1994 08:12:31 GMT"}
+        assert entry.keep_until - entry.expires_at == 60
+        assert entry.stale_until == entry.expires_at
+        assert CacheEntry.create(b"{}", ttl=60).validators == {}
+
+    def test_renew(self) -> None:
+        entry: CacheEntry = CacheEntry.create(json.dumps(BARS).encode(), ttl=0, etag='"v1"')
+        category_details: CategoryDetails = entry.parse(CategoryDetails)
+
+        renewed: CacheEntry = entry.renew(60, etag='"v2"')
+
+        assert not renewed.expired
+        assert renewed.etag == '"v2"'
+        assert renewed.parse(CategoryDetails) is category_details
+
+
+class TestMemoryCache:
+    def test_get_and_set(self) -> None:
+        cache: MemoryCache = MemoryCache()
+        entry: CacheEntry = CacheEntry.create(b"{}", ttl=60)
+        cache.set("a", entry)
+
+        assert cache.get("a") is entry
+        assert cache.get("b") is None
+        assert cache.stats == CacheStats(hits=1, misses=1)
+        assert cache.stats.hit_rate == 0.5
+
+    def test_is_a_cache(self) -> None:
+        assert isinstance(MemoryCache(), Cache)
+        with pytest.raises(TypeError):
+            Cache()
+
+    def test_expired_entries_are_dropped(self) -> None:
+        cache: MemoryCache = MemoryCache()
+        cache.set("a", CacheEntry.create(b"{}", ttl=0.01))
+        time.sleep(0.02)
+
+        assert cache.get("a") is None
+        assert len(cache) == 0
+
+    def test_stale_entries(self) -> None:
+        cache: MemoryCache = MemoryCache()
+        cache.set("a", CacheEntry.create(b"{}", ttl=0, max_stale=0.05))
+
+        assert cache.get("a").expired
+        assert cache.stats == CacheStats(hits=1, stale=1)
+        time.sleep(0.06)
+        assert cache.get("a") is None
+
+    def test_entries_kept_for_revalidation_are_misses(self) -> None:
+        cache: MemoryCache = MemoryCache()
+        cache.set("a", CacheEntry.create(b"{}", ttl=0.05, max_stale=0.01, etag='"v1"'))
+        time.sleep(0.07)
+
+        assert cache.get("a").etag == '"v1"'
+        assert cache.stats == CacheStats(misses=1)
+
+    def test_lru_eviction(self) -> None:
+        cache: MemoryCache = MemoryCache(max_entries=2)
+        for key in ("a", "b"):
+            cache.set(key, CacheEntry.create(b"{}", ttl=60))
+        cache.get("a")
+        cache.set("c", CacheEntry.create(b"{}", ttl=60))
+
+        assert cache.get("b") is None
+        assert cache.get("a") is not None
+        assert cache.get("c") is not None
+        assert cache.stats.evictions == 1
+
+    def test_delete_and_clear(self) -> None:
+        cache: MemoryCache = MemoryCache()
+        for key in ("a", "b"):
+            cache.set(key, CacheEntry.create(b"{}", ttl=60))
+        cache.delete("a")
+        cache.delete("missing")
+
+        assert cache.get("a") is None
+        cache.clear()
+        assert len(cache) == 0
+
+    def test_invalid_max_entries(self) -> None:
+        with pytest.raises(ValueError):
+            MemoryCache(max_entries=0)
+
+
+class TestCompressedMemoryCache:
+    def test_get_and_set(self) -> None:
+        cache: CompressedMemoryCache = CompressedMemoryCache()
+        body: bytes = json.dumps([BARS] * 50).encode()
+        cache.set("a", CacheEntry.create(body, ttl=60, negative=True))
+
+        entry: CacheEntry = cache.get("a")
+
+        assert entry.body == body
+        assert entry.negative
+        assert cache.size < len(body)
+        assert cache.get("b") is None
+        assert cache.stats == CacheStats(hits=1, misses=1)
+
+    def test_parses_on_each_hit(self) -> None:
+        cache: CompressedMemoryCache = CompressedMemoryCache()
+        body: bytes = json.dumps(BARS).encode()
+        cache.set("a", CacheEntry.create(body, ttl=60, model=CategoryDetails(**BARS)))
+
+        first: CategoryDetails = cache.get("a").parse(CategoryDetails)
+        second: CategoryDetails = cache.get("a").parse(CategoryDetails)
+
+        assert first == second
+        assert first is not second
+
+    def test_byte_budget(self) -> None:
+        body: bytes = b"x" * 100
+        footprint: int = len("a") + len(zlib.compress(body, 1))
+        cache: CompressedMemoryCache = CompressedMemoryCache(max_bytes=footprint * 2)
+        for key in ("a", "b"):
+            cache.set(key, CacheEntry.create(body, ttl=60))
+        cache.get("a")
+        cache.set("c", CacheEntry.create(body, ttl=60))
+
+        assert cache.get("b") is None
+        assert cache.get("a") is not None
+        assert cache.size == footprint * 2
+        assert cache.stats.evictions == 1
+
+    def test_oversized_entry_is_kept_alone(self) -> None:
+        cache: CompressedMemoryCache = CompressedMemoryCache(max_bytes=1, compression_level=0)
+        cache.set("a", CacheEntry.create(b"{}", ttl=60))
+        cache.set("b", CacheEntry.create(b"{}", ttl=60))
+
+        assert len(cache) == 1
+        assert cache.get("b").body == b"{}"
+
+    def test_expired_entries_are_dropped(self) -> None:
+        cache: CompressedMemoryCache = CompressedMemoryCache()
+        cache.set("a", CacheEntry.create(b"{}", ttl=0.01))
+        time.sleep(0.02)
+
+        assert cache.get("a") is None
+        assert cache.size == 0
+
+    def test_entries_kept_for_revalidation_are_misses(self) -> None:
+        cache: CompressedMemoryCache = CompressedMemoryCache()
+        cache.set("a", CacheEntry.create(b"{}", ttl=0.05, etag='"v1"'))
+        time.sleep(0.06)
+
+        assert cache.get("a").etag == '"v1"'
+        assert cache.stats == CacheStats(misses=1)
+
+    def test_replace_delete_and_clear(self) -> None:
+        cache: CompressedMemoryCache = CompressedMemoryCache(compression_level=0)
+        for key in ("a", "a", "b"):
+            cache.set(key, CacheEntry.create(b"{}", ttl=60))
+        size: int = cache.size
+        cache.delete("a")
+        cache.delete("missing")
+
+        assert cache.size == size / 2
+        cache.clear()
+        assert (len(cache), cache.size) == (0, 0)
+
+    def test_invalid_arguments(self) -> None:
+        with pytest.raises(ValueError):
+            CompressedMemoryCache(max_bytes=0)
+        with pytest.raises(ValueError):
+            CompressedMemoryCache(compression_level=10)
+
+
+class TestSqliteCache:
+    def test_get_and_set(self, tmp_path: Path) -> None:
+        cache: SqliteCache = SqliteCache(path=tmp_path / "cache.db")
+        body: bytes = json.dumps(BARS).encode() * 100
+        cache.set("a", CacheEntry(body=body, stored_at=10.0, expires_at=time.time() + 60))
+
+        entry: CacheEntry = cache.get("a")
+
+        assert entry.body == body
+        assert entry.stored_at == 10.0
+        assert cache.get("b") is None
+        assert cache.stats == CacheStats(hits=1, misses=1)
+        assert 0 < cache.size < len(body) / 10
+
+    def test_expiry(self, tmp_path: Path) -> None:
+        clock: FakeClock = FakeClock()
+        cache: SqliteCache = SqliteCache(path=tmp_path / "cache.db", clock=clock)
+        cache.set("a", CacheEntry(body=b"{}", expires_at=clock.now + 60))
+
+        assert cache.get("a") is not None
+        clock.now += 60
+        assert cache.get("a") is None
+
+    def test_stale_entries(self, tmp_path: Path) -> None:
+        clock: FakeClock = FakeClock()
+        cache: SqliteCache = SqliteCache(path=tmp_path / "cache.db", clock=clock)
+        cache.set("a", CacheEntry(body=b"{}", expires_at=clock.now + 60, stale_until=clock.now + 120))
+        clock.now += 90
+
+        assert cache.get("a").stale_until == clock.now + 30
+        assert cache.stats.stale == 1
+        clock.now += 30
+        assert cache.get("a") is None
+        assert cache.sweep() == 1
+
+    def test_entries_kept_for_revalidation_are_misses(self, tmp_path: Path) -> None:
+        clock: FakeClock = FakeClock()
+        cache: SqliteCache = SqliteCache(path=tmp_path / "cache.db", clock=clock)
+        cache.set("a", CacheEntry(body=b"{}", expires_at=clock.now + 60, keep_until=clock.now + 120, etag='"v1"'))
+        clock.now += 90
+
+        assert cache.get("a").etag == '"v1"'
+        assert cache.stats == CacheStats(misses=1)
+        clock.now += 30
+        assert cache.get("a") is None
+        assert cache.sweep() == 1
+
+    def test_validators(self, tmp_path: Path) -> None:
+        cache: SqliteCache = SqliteCache(path=tmp_path / "cache.db")
+        cache.set("a", CacheEntry.create(b"{}", ttl=60, etag='"v1"', last_modified="Tue, 15 Nov 1994 08:12:31 GMT"))
+
+        entry: CacheEntry = cache.get("a")
+
+        assert (entry.etag, entry.last_modified) == ('"v1"', "Tue, 15 Nov 1994 08:12:31 GMT")
+
+    def test_shared_between_instances(self, tmp_path: Path) -> None:
+        SqliteCache(path=tmp_path / "cache.db").set("a", CacheEntry.create(b"{}", ttl=60))
+
+        assert SqliteCache(path=tmp_path / "cache.db").get("a").body == b"{}"
+
+    def test_shared_between_processes(self, tmp_path: Path) -> None:
+        with get_context("spawn").Pool(processes=4) as pool:
+            hits: List[int] = pool.starmap(write_and_read, [(tmp_path / "cache.db", worker) for worker in range(4)])
+
+        assert len(SqliteCache(path=tmp_path / "cache.db")) == 200
+        assert sum(hits) >= 200
+
+    def test_sweep(self, tmp_path: Path) -> None:
+        clock: FakeClock = FakeClock()
+        size: int = len(zlib.compress(b"x" * 10, 0))
+        cache: SqliteCache = SqliteCache(
+            path=tmp_path / "cache.db", max_bytes=3 * size, compression_level=0, clock=clock
+        )
+        cache.set("expired", CacheEntry(body=b"x" * 10, expires_at=clock.now))
+        for index in range(5):
+            cache.set(f"{index}", CacheEntry(body=b"x" * 10, expires_at=clock.now + 60 + index))
+
+        assert cache.sweep() == 3
+        assert cache.size == 3 * size
+        assert [cache.get(f"{index}") is not None for index in range(5)] == [False, False, True, True, True]
+        assert cache.stats.evictions == 2
+
+    def test_sweep_interval(self, tmp_path: Path) -> None:
+        cache: SqliteCache = SqliteCache(path=tmp_path / "cache.db", max_bytes=1, sweep_interval=3)
+        for index in range(3):
+            cache.set(f"{index}", CacheEntry.create(b"{}", ttl=60))
+
+        assert len(cache) == 0
+
+    def test_delete_and_clear(self, tmp_path: Path) -> None:
+        cache: SqliteCache = SqliteCache(path=tmp_path / "cache.db")
+        for key in ("a", "b"):
+            cache.set(key, CacheEntry.create(b"{}", ttl=60))
+        cache.delete("a")
+
+        assert cache.get("a") is None
+        cache.clear()
+        assert len(cache) == 0
+
+    def test_invalid_arguments(self, tmp_path: Path) -> None:
+        with pytest.raises(ValueError):
+            SqliteCache(path=tmp_path / "cache.db", max_bytes=0)
+        with pytest.raises(ValueError):
+            SqliteCache(path=tmp_path / "cache.db", compression_level=10)
+
+
+class TestCacheRegistry:
+    def teardown_method(self) -> None:
+        set_cache(None)
+
+    def test_disabled_by_default(self) -> None:
+        assert get_cache() is None
+
+    def test_from_settings(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv("YELP_CACHE", "memory")
+        monkeypatch.setenv("YELP_CACHE_MAX_ENTRIES", "5")
+
+        cache = get_cache()
+
+        assert isinstance(cache, MemoryCache)
+        assert cache.max_entries == 5
+        assert get_cache() is cache
+
+    def test_compressed_from_settings(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv("YELP_CACHE", "compressed")
+        monkeypatch.setenv("YELP_CACHE_MAX_MEMORY", "1024")
+
+        cache = get_cache()
+
+        assert isinstance(cache, CompressedMemoryCache)
+        assert cache.max_bytes == 1024
+
+    def test_sqlite_from_settings(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv("YELP_CACHE", "sqlite")
+        monkeypatch.setenv("YELP_CACHE_PATH", str(tmp_path / "cache.db"))
+        monkeypatch.setenv("YELP_CACHE_MAX_BYTES", "1024")
+
+        cache = get_cache()
+
+        assert isinstance(cache, SqliteCache)
+        assert cache.path == tmp_path / "cache.db"
+        assert cache.max_bytes == 1024
+
+    def test_sqlite_requires_path(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv("YELP_CACHE", "sqlite")
+
+        with pytest.raises(ValueError):
+            get_cache()
+
+    def test_caching(self) -> None:
+        assert caching_enabled()
+        with caching(False):
+            assert not caching_enabled()
+        assert caching_enabled()
+
+
+class TestCanonicalKey:
+    def test_sorts_and_drops_parameters(self) -> None:
+        assert canonical_key(
+            "https://api.yelp.com/v3/events", {"limit": 5, "is_free": None, "categories": "music"}
+        ) == ("https://api.yelp.com/v3/events?categories=music&limit=5")
+        assert canonical_key("https://api.yelp.com/v3/events", {"is_free": None}) == "https://api.yelp.com/v3/events"
+
+    def test_normalize_location(self) -> None:
+        assert normalize_location(" San  Francisco,CA ") == "san francisco, ca"
+        assert normalize_location("SAN FRANCISCO, , CA") == "san francisco, ca"
+
+    def test_snap(self) -> None:
+        assert snap(37.77491, 0.001) == snap(37.77490, 0.001) == 37.775
+        assert snap(-122.41941, 0.01) == -122.42
+
+    def test_grid(self) -> None:
+        url: str = "https://api.yelp.com/v3/businesses/search"
+        near: dict = {"latitude": 37.77491, "longitude": -122.41942}
+        nearer: dict = {"longitude": -122.41941, "latitude": 37.77490}
+
+        assert canonical_key(url, near) != canonical_key(url, nearer)
+        assert canonical_key(url, near, grid=0.001) == canonical_key(url, nearer, grid=0.001)
+        assert canonical_key(url, near, grid=0.001) == f"{url}?latitude=37.775&longitude=-122.419"
+
+    def test_search_endpoints(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv("YELP_CACHE_KEY_GRID", "0.001")
+
+        assert (
+            BusinessSearchEndpoint(location="San Francisco,CA", term="bars").cache_key
+            == BusinessSearchEndpoint(term="bars", location="san francisco, ca").cache_key
+        )
+        assert (
+            EventSearchEndpoint(latitude=37.77491, longitude=-122.41942).cache_key
+            == EventSearchEndpoint(latitude=37.77490, longitude=-122.41941).cache_key
+        )
+        assert EventLookupEndpoint(id="oakland-saucy").cache_key == EventLookupEndpoint(id="oakland-saucy").url
+
+    def test_nearby_searches_share_response(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv("YELP_CACHE_KEY_GRID", "0.001")
+        transport: StubTransport = StubTransport(
+            routes={"/transactions/delivery/search": {"total": 0, "businesses": []}}
+        )
+        set_cache(MemoryCache())
+        set_transport(transport)
+        try:
+            for latitude in (37.77491, 37.77490, 37.7751):
+                Client.transaction_search(latitude=latitude, longitude=-122.41942).get()
+        finally:
+            set_cache(None)
+            set_transport(None)
+
+        assert len(transport.requests) == 1
+        assert "latitude=37.77491" in transport.requests[0]
+        assert TransactionSearchEndpoint._canonical_cache_key
+
+
+class TestEndpointCaching:
+    def setup_method(self) -> None:
+        self.cache: MemoryCache = MemoryCache()
+        self.transport: StubTransport = StubTransport(
+            routes={"/categories/bars": BARS, "/categories": {"categories": []}}
+        )
+        set_cache(self.cache)
+        set_transport(self.transport)
+        set_async_transport(self.transport)
+
+    def teardown_method(self) -> None:
+        set_cache(None)
+        set_transport(None)
+        set_async_transport(None)
+
+    def test_hit_skips_network_and_parsing(self) -> None:
+        first: CategoryDetails = Client.category_details(alias="bars").get()
+        second: CategoryDetails = Client.category_details(alias="bars").get()
+
+        assert second is first
+        assert len(self.transport.requests) == 1
+        assert json.loads(self.cache.get(CategoryDetailsEndpoint(alias="bars").cache_key).body) == BARS
+
+    def test_async_hit(self) -> None:
+        pytest.importorskip("httpx")
+
+        async def run() -> List[CategoryDetails]:
+            return [await Client.category_details(alias="bars").aget() for _ in range(2)]
+
+        first, second = asyncio.run(run())
+
+        assert second is first
+        assert len(self.transport.requests) == 1
+
+    def test_per_endpoint_ttl(self) -> None:
+        Client.category_details(alias="bars").get()
+        entry: CacheEntry = self.cache.get(CategoryDetailsEndpoint(alias="bars").cache_key)
+
+        assert entry.expires_at - entry.stored_at == CategoryDetailsEndpoint._cache_ttl
+        assert AllCategoriesEndpoint._cache_ttl > BusinessSearchEndpoint._cache_ttl
+
+    def test_uncached_endpoint(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(CategoryDetailsEndpoint, "_cache_ttl", None)
+
+        Client.category_details(alias="bars").get()
+        Client.category_details(alias="bars").get()
+
+        assert len(self.transport.requests) == 2
+        assert len(self.cache) == 0
+
+    def test_opt_out(self) -> None:
+        Client.category_details(alias="bars").get()
+        with caching(False):
+            Client.category_details(alias="bars").get()
+
+        assert len(self.transport.requests) == 2
+
+    def test_invalidate(self) -> None:
+        endpoint: CategoryDetailsEndpoint = Client.category_details(alias="bars")
+        endpoint.get()
+        endpoint.invalidate()
+        endpoint.get()
+
+        assert len(self.transport.requests) == 2
+
+    def test_sqlite_cache(self, tmp_path: Path) -> None:
+        set_cache(SqliteCache(path=tmp_path / "cache.db"))
+        Client.category_details(alias="bars").get()
+        set_cache(SqliteCache(path=tmp_path / "cache.db"))
+
+        assert Client.category_details(alias="bars").get().category.title == "Bars"
+        assert len(self.transport.requests) == 1
+
+    def test_async_sqlite_cache_off_the_event_loop(self, tmp_path: Path) -> None:
+        pytest.importorskip("httpx")
+        threads: List[Thread] = []
+
+        class RecordingCache(SqliteCache):
+            def get(self, key: str) -> Optional[CacheEntry]:
+                threads.append(current_thread())
+                return super().get(key)
+
+            def set(self, key: str, entry: CacheEntry) -> None:
+                threads.append(current_thread())
+                super().set(key, entry)
+
+        set_cache(RecordingCache(path=tmp_path / "cache.db"))
+
+        async def run() -> List[CategoryDetails]:
+            return [await Client.category_details(alias="bars").aget() for _ in range(2)]
+
+        first, second = asyncio.run(run())
+
+        assert second == first
+        assert len(self.transport.requests) == 1
+        assert len(threads) == 3
+        assert main_thread() not in threads
+
+    def test_compressed_cache(self) -> None:
+        set_cache(CompressedMemoryCache())
+        first: CategoryDetails = Client.category_details(alias="bars").get()
+        second: CategoryDetails = Client.category_details(alias="bars").get()
+
+        assert second == first
+        assert second is not first
+        assert len(self.transport.requests) == 1
+
+    def test_streams_bypass_cache(self) -> None:
+        list(Client.all_categories().stream())
+
+        assert len(self.cache) == 0
+
+
+class TestStaleWhileRevalidate:
+    def setup_method(self) -> None:
+        self.transport: StubTransport = StubTransport(
+            routes={"/categories/bars": [BARS, StubResponse(PUBS, latency=0.05)]}
+        )
+        set_cache(MemoryCache())
+        set_transport(self.transport)
+        set_async_transport(self.transport)
+
+    def teardown_method(self) -> None:
+        self.wait_for_refresh()
+        set_cache(None)
+        set_transport(None)
+        set_async_transport(None)
+
+    @staticmethod
+    def wait_for_refresh() -> None:
+        for _ in range(100):
+            if not get_revalidator().pending:
+                return
+            time.sleep(0.01)
+
+    @pytest.fixture(autouse=True)
+    def expire_quickly(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv("YELP_CACHE_STALE_WHILE_REVALIDATE", "true")
+        monkeypatch.setattr(CategoryDetailsEndpoint, "_cache_ttl", 0.02)
+
+    def test_serves_stale_and_refreshes_once(self) -> None:
+        Client.category_details(alias="bars").get()
+        time.sleep(0.03)
+
+        titles: List[str] = [Client.category_details(alias="bars").get().category.title for _ in range(5)]
+        self.wait_for_refresh()
+
+        assert titles == ["Bars"] * 5
+        assert Client.category_details(alias="bars").get().category.title == "Pubs"
+        assert len(self.transport.requests) == 2
+
+    def test_async_refresh(self) -> None:
+        pytest.importorskip("httpx")
+
+        async def run() -> List[str]:
+            await Client.category_details(alias="bars").aget()
+            await asyncio.sleep(0.03)
+            stale: CategoryDetails = await Client.category_details(alias="bars").aget()
+            while get_revalidator().pending:
+                await asyncio.sleep(0.01)
+            fresh: CategoryDetails = await Client.category_details(alias="bars").aget()
+            return [stale.category.title, fresh.category.title]
+
+        assert asyncio.run(run()) == ["Bars", "Pubs"]
+        assert len(self.transport.requests) == 2
+
+    def test_max_staleness(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(CategoryDetailsEndpoint, "_cache_max_stale", 0.02)
+        Client.category_details(alias="bars").get()
+        time.sleep(0.05)
+
+        assert Client.category_details(alias="bars").get().category.title == "Pubs"
+
+    def test_disabled(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv("YELP_CACHE_STALE_WHILE_REVALIDATE", "false")
+        Client.category_details(alias="bars").get()
+        time.sleep(0.03)
+
+        assert Client.category_details(alias="bars").get().category.title == "Pubs"
+
+    def test_failed_refresh_keeps_stale_entry(self) -> None:
+        set_transport(StubTransport(routes={"/categories/bars": [BARS, StubResponse(status_code=404)]}))
+        failures: int = get_revalidator().failures
+        Client.category_details(alias="bars").get()
+        time.sleep(0.03)
+
+        Client.category_details(alias="bars").get()
+        self.wait_for_refresh()
+
+        assert get_revalidator().failures == failures + 1
+        assert Client.category_details(alias="bars").get().category.title == "Bars"
+
+
+class TestNegativeCaching:
+    def setup_method(self) -> None:
+        self.cache: MemoryCache = MemoryCache()
+        self.transport: StubTransport = StubTransport(
+            routes={
+                "/businesses/search/phone": {"businesses": [], "total": 0},
+                "/businesses/matches": {"businesses": []},
+                "/businesses/gone": StubResponse(
+                    {"error": {"code": "BUSINESS_NOT_FOUND", "description": "Business not found."}}, status_code=404
+                ),
+            }
+        )
+        set_cache(self.cache)
+        set_transport(self.transport)
+        set_async_transport(self.transport)
+
+    def teardown_method(self) -> None:
+        set_cache(None)
+        set_transport(None)
+        set_async_transport(None)
+
+    @pytest.fixture(autouse=True)
+    def cache_negatives(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv("YELP_CACHE_NEGATIVE", "true")
+
+    def test_not_found(self) -> None:
+        errors: List[ApiError] = []
+        for _ in range(2):
+            with pytest.raises(ApiError) as error:
+                Client.business_details(business_id="gone").get()
+            errors.append(error.value)
+
+        assert [(error.status_code, error.code) for error in errors] == [(404, "BUSINESS_NOT_FOUND")] * 2
+        assert errors[1].description == "Business not found."
+        assert len(self.transport.requests) == 1
+
+    def test_async_not_found(self) -> None:
+        pytest.importorskip("httpx")
+
+        async def run() -> None:
+            for _ in range(2):
+                with pytest.raises(ApiError, match="BUSINESS_NOT_FOUND"):
+                    await Client.business_details(business_id="gone").aget()
+
+        asyncio.run(run())
+
+        assert len(self.transport.requests) == 1
+
+    def test_empty_results(self) -> None:
+        for _ in range(2):
+            assert Client.phone_search(phone="+14159083801").get().businesses == []
+            assert (
+                Client.business_matches(
+                    name="Nowhere", address1="1 Main St", city="Springfield", state="IL", country="US"
+                )
+                .get()
+                .businesses
+                == []
+            )
+
+        assert len(self.transport.requests) == 2
+
+    def test_empty_results_shorter_ttl(self) -> None:
+        endpoint: PhoneSearchEndpoint = Client.phone_search(phone="+14159083801")
+        endpoint.get()
+        entry: CacheEntry = self.cache.get(endpoint.cache_key)
+
+        assert not entry.negative
+        assert entry.expires_at - entry.stored_at == PhoneSearchEndpoint._negative_ttl
+
+    def test_shorter_ttl(self) -> None:
+        endpoint: BusinessDetailsEndpoint = Client.business_details(business_id="gone")
+        with pytest.raises(ApiError):
+            endpoint.get()
+        entry: CacheEntry = self.cache.get(endpoint.cache_key)
+
+        assert entry.negative
+        assert entry.expires_at - entry.stored_at == BusinessDetailsEndpoint._negative_ttl
+        assert BusinessDetailsEndpoint._negative_ttl < BusinessDetailsEndpoint._cache_ttl
+
+    def test_disabled(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv("YELP_CACHE_NEGATIVE", "false")
+
+        with pytest.raises(ApiError) as error:
+            Client.business_details(business_id="gone").get()
+        phone_search: PhoneSearch = Client.phone_search(phone="+14159083801").get()
+
+        assert error.value.status_code == 404
+        assert phone_search.businesses == []
+
+    def test_other_errors_are_raised(self) -> None:
+        set_transport(StubTransport(routes={"/businesses/*": StubResponse(status_code=400)}))
+
+        with pytest.raises(ApiError):
+            Client.business_details(business_id="bad").get()
+        assert len(self.cache) == 0
+
+    def test_endpoints_without_negative_ttl(self) -> None:
+        with pytest.raises(ApiError):
+            Client.category_details(alias="missing").get()
+
+    def test_sqlite_cache(self, tmp_path: Path) -> None:
+        set_cache(SqliteCache(path=tmp_path / "cache.db"))
+        with pytest.raises(ApiError):
+            Client.business_details(business_id="gone").get()
+        set_cache(SqliteCache(path=tmp_path / "cache.db"))
+
+        with pytest.raises(ApiError) as error:
+            Client.business_details(business_id="gone").get()
+        assert error.value.status_code == 404
+        assert len(self.transport.requests) == 1
+
+
+class TestConditionalRequests:
+    def setup_method(self) -> None:
+        self.cache: MemoryCache = MemoryCache()
+        set_cache(self.cache)
+
+    def teardown_method(self) -> None:
+        self.wait_for_refresh()
+        set_cache(None)
+        set_transport(None)
+        set_async_transport(None)
+
+    @staticmethod
+    def wait_for_refresh() -> None:
+        for _ in range(100):
+            if not get_revalidator().pending:
+                return
+            time.sleep(0.01)
+
+    @pytest.fixture(autouse=True)
+    def expire_quickly(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(CategoryDetailsEndpoint, "_cache_ttl", 0.1)
+
+    def serve(self, *responses: StubResponse) -> StubTransport:
+        transport: StubTransport = StubTransport(routes={"/categories/bars": list(responses)})
+        set_transport(transport)
+        set_async_transport(transport)
+        return transport
+
+    def test_not_modified(self) -> None:
+        transport: StubTransport = self.serve(
+            StubResponse(BARS, headers={"ETag": '"v1"'}), StubResponse(status_code=304)
+        )
+        endpoint: CategoryDetailsEndpoint = Client.category_details(alias="bars")
+        first: CategoryDetails = endpoint.get()
+        time.sleep(0.12)
+
+        second: CategoryDetails = endpoint.get()
+
+        assert second is first
+        assert transport.request_headers[1]["If-None-Match"] == '"v1"'
+        assert not self.cache.get(endpoint.cache_key).expired
+        assert self.cache.get(endpoint.cache_key).etag == '"v1"'
+
+    def test_modified(self) -> None:
+        self.serve(StubResponse(BARS, headers={"ETag": '"v1"'}), StubResponse(PUBS, headers={"ETag": '"v2"'}))
+        endpoint: CategoryDetailsEndpoint = Client.category_details(alias="bars")
+        endpoint.get()
+        time.sleep(0.12)
+
+        assert endpoint.get().category.title == "Pubs"
+        assert self.cache.get(endpoint.cache_key).etag == '"v2"'
+
+    def test_last_modified(self) -> None:
+        transport: StubTransport = self.serve(
+            StubResponse(BARS, headers={"Last-Modified": "Tue, 15 Nov 1994 08:12:31 GMT"}),
+            StubResponse(status_code=304),
+        )
+        Client.category_details(alias="bars").get()
+        time.sleep(0.12)
+
+        assert Client.category_details(alias="bars").get().category.title == "Bars"
+        assert transport.request_headers[1]["If-Modified-Since"] == "Tue, 15 Nov 1994 08:12:31 GMT"
+        assert "If-None-Match" not in transport.request_headers[1]
+
+    def test_without_validators(self) -> None:
+        transport: StubTransport = self.serve(StubResponse(BARS), StubResponse(PUBS))
+        Client.category_details(alias="bars").get()
+        time.sleep(0.12)
+
+        assert Client.category_details(alias="bars").get().category.title == "Pubs"
+        assert "If-None-Match" not in transport.request_headers[1]
+        assert "If-Modified-Since" not in transport.request_headers[1]
+
+    def test_async(self) -> None:
+        pytest.importorskip("httpx")
+        transport: StubTransport = self.serve(
+            StubResponse(BARS, headers={"ETag": '"v1"'}), StubResponse(status_code=304)
+        )
+
+        async def run() -> List[CategoryDetails]:
+            first: CategoryDetails = await Client.category_details(alias="bars").aget()
+            await asyncio.sleep(0.12)
+            return [first, await Client.category_details(alias="bars").aget()]
+
+        first, second = asyncio.run(run())
+
+        assert second is first
+        assert transport.request_headers[1]["If-None-Match"] == '"v1"'
+
+    def test_stale_while_revalidate(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv("YELP_CACHE_STALE_WHILE_REVALIDATE", "true")
+        transport: StubTransport = self.serve(
+            StubResponse(BARS, headers={"ETag": '"v1"'}), StubResponse(status_code=304)
+        )
+        endpoint: CategoryDetailsEndpoint = Client.category_details(alias="bars")
+        endpoint.get()
+        time.sleep(0.12)
+
+        assert endpoint.get().category.title == "Bars"
+        self.wait_for_refresh()
+        assert not self.cache.get(endpoint.cache_key).expired
+        assert len(transport.requests) == 2
+
+    def test_sqlite_cache(self, tmp_path: Path) -> None:
+        set_cache(SqliteCache(path=tmp_path / "cache.db"))
+        transport: StubTransport = self.serve(
+            StubResponse(BARS, headers={"ETag": '"v1"'}), StubResponse(status_code=304)
+        )
+        Client.category_details(alias="bars").get()
+        time.sleep(0.12)
+
+        assert Client.category_details(alias="bars").get().category.title == "Bars"
+        assert transport.request_headers[1]["If-None-Match"] == '"v1"'
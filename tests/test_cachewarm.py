@@ -0,0 +1,135 @@
+import time
+from pathlib import Path
+from typing import List
+
+import pytest
+from pydantic import ValidationError
+
+from tests.conftest import business
+from yelpfusion3.breaker import reset_circuit_breakers
+from yelpfusion3.business.endpoint import BusinessDetailsEndpoint, BusinessSearchEndpoint
+from yelpfusion3.cache import MemoryCache, set_cache
+from yelpfusion3.cachewarm import CacheWarmer, WarmProgress, read_targets
+from yelpfusion3.exceptions import QuotaExceededError
+from yelpfusion3.transport import StubResponse, StubTransport, set_transport
+
+
+def details(url: str) -> dict:
+    return business(url.rsplit("/", 1)[1], is_claimed=True, phone="", price="$$")
+
+
+REVIEWS: dict = {"total": 0, "possible_languages": ["en"], "reviews": []}
+SEARCH: dict = {"total": 0, "businesses": [], "region": {"center": {"latitude": 37.8, "longitude": -122.27}}}
+
+
+class TestReadTargets:
+    def test_read_targets(self, tmp_path: Path) -> None:
+        path: Path = tmp_path / "targets.txt"
+        path.write_text('# Warm before launch\nsaucy\n\n{"location": "Oakland, CA", "term": "pizza"}\n  fudge  \n')
+
+        assert list(read_targets(path)) == ["saucy", {"location": "Oakland, CA", "term": "pizza"}, "fudge"]
+
+
+class TestCacheWarmer:
+    def setup_method(self) -> None:
+        self.cache: MemoryCache = MemoryCache()
+        self.transport: StubTransport = StubTransport(
+            routes={
+                "/businesses/search": SEARCH,
+                "/businesses/gone": StubResponse(status_code=404),
+                "/businesses/gone/reviews": StubResponse(status_code=404),
+                "/businesses/broken": StubResponse(status_code=400),
+                "/businesses/*/reviews": REVIEWS,
+                "/businesses/*": details,
+            }
+        )
+        set_cache(self.cache)
+        set_transport(self.transport)
+
+    def teardown_method(self) -> None:
+        set_cache(None)
+        set_transport(None)
+        reset_circuit_breakers()
+
+    def test_fills_cache(self) -> None:
+        progress: WarmProgress = CacheWarmer(["saucy", {"location": "Oakland, CA"}]).run()
+
+        assert progress.warmed == 2
+        assert progress.requests == 3
+        assert self.cache.get(BusinessDetailsEndpoint(business_id="saucy").cache_key) is not None
+        assert self.cache.get(BusinessSearchEndpoint(location="Oakland, CA").cache_key) is not None
+        assert len(self.cache) == 3
+
+    def test_skips_cached(self) -> None:
+        CacheWarmer(["saucy"]).run()
+        progress: WarmProgress = CacheWarmer(["saucy", "fudge"], reviews=False).run()
+
+        assert (progress.skipped, progress.warmed, progress.requests) == (1, 1, 1)
+        assert len(self.transport.requests) == 3
+
+    def test_progress(self) -> None:
+        reports: List[int] = []
+
+        CacheWarmer(["saucy", "fudge", "gone"], on_progress=lambda progress: reports.append(progress.completed)).run()
+
+        assert reports == [1, 2, 3]
+
+    def test_failures_are_not_checkpointed(self, tmp_path: Path) -> None:
+        checkpoint: Path = tmp_path / "warm.checkpoint"
+
+        first: WarmProgress = CacheWarmer(["saucy", "broken", "gone"], reviews=False, checkpoint=checkpoint).run()
+
+        assert (first.warmed, first.failed) == (2, 1)
+        assert first.errors[0].status_code == 400
+        assert checkpoint.read_text().split() == ["saucy", "gone"]
+
+    def test_resumes_from_checkpoint(self, tmp_path: Path) -> None:
+        checkpoint: Path = tmp_path / "warm.checkpoint"
+        targets: List[str] = ["saucy", "fudge", "chai", "boba"]
+
+        interrupted: WarmProgress = CacheWarmer(targets, max_requests=4, checkpoint=checkpoint).run()
+        set_cache(MemoryCache())
+        resumed: WarmProgress = CacheWarmer(targets, checkpoint=checkpoint).run()
+
+        assert interrupted.warmed == 2
+        assert (resumed.skipped, resumed.warmed, resumed.requests) == (2, 2, 4)
+        assert checkpoint.read_text().split() == targets
+
+    def test_invalid_target_fails_alone(self) -> None:
+        progress: WarmProgress = CacheWarmer([{"location": "Oakland, CA", "limit": 100}, "saucy"], reviews=False).run()
+
+        assert (progress.failed, progress.warmed) == (1, 1)
+        assert isinstance(progress.errors[0], ValidationError)
+
+    def test_partly_requested_target_fails(self, tmp_path: Path) -> None:
+        checkpoint: Path = tmp_path / "warm.checkpoint"
+
+        progress: WarmProgress = CacheWarmer(["saucy", "fudge"], max_requests=3, checkpoint=checkpoint).run()
+
+        assert (progress.warmed, progress.failed, progress.completed) == (1, 1, 2)
+        assert checkpoint.read_text().split() == ["saucy"]
+
+    def test_rate(self) -> None:
+        start: float = time.monotonic()
+
+        CacheWarmer(["saucy", "fudge"], per_second=50, max_workers=1).run()
+
+        assert time.monotonic() - start >= 3 / 50
+
+    def test_stops_when_quota_is_exceeded(self) -> None:
+        set_transport(StubTransport(routes={"/businesses/*": StubResponse(error=QuotaExceededError())}))
+
+        progress: WarmProgress = CacheWarmer([f"business-{index}" for index in range(100)], max_workers=1).run()
+
+        assert progress.requests < 10
+        assert isinstance(progress.errors[0], QuotaExceededError)
+
+    def test_requires_cache(self) -> None:
+        set_cache(None)
+
+        with pytest.raises(ValueError):
+            CacheWarmer(["saucy"]).run()
+
+    def test_invalid_max_requests(self) -> None:
+        with pytest.raises(ValueError):
+            CacheWarmer([], max_requests=-1)
@@ -1,3 +1,4 @@
+import asyncio
 import os
 
 import pytest
@@ -22,9 +23,10 @@ from yelpfusion3.business.model import (
 )
 from yelpfusion3.category.endpoint import AllCategoriesEndpoint, CategoryDetailsEndpoint
 from yelpfusion3.category.model import Categories, CategoryDetails
-from yelpfusion3.client import Client
+from yelpfusion3.client import AsyncClient, Client
 from yelpfusion3.event.endpoint import EventLookupEndpoint, EventSearchEndpoint, FeaturedEventEndpoint
 from yelpfusion3.event.model import Event, EventSearch
+from yelpfusion3.transport import HttpxTransport
 
 
 @pytest.mark.skipif(condition=not os.getenv("YELP_API_KEY"), reason="API key not configured")
@@ -222,7 +224,7 @@ class TestClient:
     def test_featured_event_location(self) -> None:
         featured_event_endpoint: FeaturedEventEndpoint = Client.featured_event(location="San Francisco, CA")
 
-        event: Event = featured_event_endpoint.get()
+        featured_event_endpoint.get()
 
         # TODO: Something broke on the Yelp side. Put this back once it's resolved.
         # assert event.id
@@ -235,7 +237,7 @@ class TestClient:
             latitude=37.7726402, longitude=-122.4099154
         )
 
-        event: Event = featured_event_endpoint.get()
+        featured_event_endpoint.get()
 
         # TODO: Something broke on the Yelp side. Put this back once it's resolved.
         # assert event.id
@@ -274,3 +276,30 @@ class TestClient:
 
         assert len(categories.categories) > 0
         # Not much else can viably do here since the collection of categories is massive.
+
+
+class TestAsyncClient:
+    def test_mirrors_client_factories(self) -> None:
+        business_details_endpoint: BusinessDetailsEndpoint = AsyncClient.business_details(
+            business_id="WavvLdfdP6g8aZTtbBQHTw"
+        )
+
+        assert business_details_endpoint.url == "https://api.yelp.com/v3/businesses/WavvLdfdP6g8aZTtbBQHTw"
+
+    def test_aget(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        httpx = pytest.importorskip("httpx")
+        session = httpx.AsyncClient(
+            transport=httpx.MockTransport(
+                lambda request: httpx.Response(200, json={"category": {"alias": "hotdogs", "title": "Fast Food"}})
+            )
+        )
+        monkeypatch.setattr("yelpfusion3.endpoint.get_async_transport", lambda: HttpxTransport(session))
+
+        async def run() -> CategoryDetails:
+            async with AsyncClient() as client:
+                return await client.category_details(alias="hotdogs").aget()
+
+        category_details: CategoryDetails = asyncio.run(run())
+
+        assert category_details.category.alias == "hotdogs"
+        assert category_details.category.title == "Fast Food"
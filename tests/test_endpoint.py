@@ -37,3 +37,8 @@ class TestSupportedLocales:
     )
     def test_codes(self, code: str) -> None:
         assert code in SupportedLocales.codes()
+        assert code in SupportedLocales.code_set()
+
+    def test_code_set_is_built_once(self) -> None:
+        assert SupportedLocales.code_set() is SupportedLocales.code_set()
+        assert SupportedLocales.code_set() == frozenset(SupportedLocales.codes())
@@ -0,0 +1,192 @@
+import asyncio
+import time
+from itertools import count
+from threading import Thread, current_thread
+from typing import Callable, Iterator, List
+
+import pytest
+import requests
+
+from tests.conftest import FakeResponse
+from yelpfusion3.category.endpoint import CategoryDetailsEndpoint
+from yelpfusion3.hedge import Hedger, HedgeStats, get_hedger, hedgers, hedging, hedging_enabled, reset_hedgers
+
+
+def warm(hedger: Hedger, latency: float = 0.01) -> Hedger:
+    for _ in range(hedger.minimum_samples):
+        hedger.record(latency)
+    return hedger
+
+
+def slow_first(delay: float = 0.5) -> Callable[[], FakeResponse]:
+    attempts: Iterator[int] = count()
+
+    def send() -> FakeResponse:
+        attempt: int = next(attempts)
+        if attempt == 0:
+            time.sleep(delay)
+        return FakeResponse(attempt=attempt)
+
+    return send
+
+
+class ASlowFirst:
+    """
+    Like :py:func:`slow_first`, for :py:meth:`~yelpfusion3.hedge.Hedger.acall`, recording the cancelled attempts.
+    """
+
+    def __init__(self, delay: float = 0.5) -> None:
+        self.delay: float = delay
+        self.cancelled: List[int] = []
+        self._attempts: Iterator[int] = count()
+
+    async def __call__(self) -> FakeResponse:
+        attempt: int = next(self._attempts)
+        try:
+            if attempt == 0:
+                await asyncio.sleep(self.delay)
+            return FakeResponse(attempt=attempt)
+        except asyncio.CancelledError:
+            self.cancelled.append(attempt)
+            raise
+
+
+class TestHedger:
+    def test_no_delay_without_samples(self) -> None:
+        hedger: Hedger = Hedger(path="/events", minimum_samples=5)
+
+        assert hedger.delay is None
+        assert hedger.call(slow_first(0.05)).attempt == 0
+        assert hedger.stats == HedgeStats(requests=1, hedged=0, wins=0)
+
+    def test_delay_is_percentile(self) -> None:
+        hedger: Hedger = Hedger(path="/events", percentile=90, min_delay=0.0, window_size=10, minimum_samples=10)
+        for latency in range(1, 11):
+            hedger.record(latency / 10)
+
+        assert hedger.delay == pytest.approx(0.9)
+
+    def test_delay_has_floor(self) -> None:
+        assert warm(Hedger(path="/events", min_delay=0.2)).delay == 0.2
+
+    def test_hedge_wins(self) -> None:
+        hedger: Hedger = warm(Hedger(path="/events", min_delay=0.0, max_ratio=1.0))
+
+        start: float = time.monotonic()
+        response: FakeResponse = hedger.call(slow_first())
+
+        assert response.attempt == 1
+        assert time.monotonic() - start < 0.4
+        assert hedger.stats == HedgeStats(requests=1, hedged=1, wins=1)
+        assert hedger.stats.win_rate == 1.0
+
+    def test_fast_request_is_not_hedged(self) -> None:
+        hedger: Hedger = warm(Hedger(path="/events", min_delay=0.2, max_ratio=1.0))
+
+        assert hedger.call(lambda: FakeResponse()).attempt == 0
+        assert hedger.stats.hedged == 0
+
+    def test_unhedged_request_is_sent_on_calling_thread(self) -> None:
+        hedger: Hedger = warm(Hedger(path="/events", min_delay=0.0, max_ratio=0.05))
+        threads: List[Thread] = []
+
+        def send() -> FakeResponse:
+            threads.append(current_thread())
+            return FakeResponse()
+
+        hedger.call(send)
+
+        assert threads == [current_thread()]
+
+    def test_fast_request_keeps_hedge(self) -> None:
+        hedger: Hedger = warm(Hedger(path="/events", min_delay=0.2, max_ratio=0.5))
+        for _ in range(2):
+            hedger.call(lambda: FakeResponse())
+        hedger.min_delay = 0.0
+
+        assert hedger.call(slow_first()).attempt == 1
+        assert hedger.stats.hedged == 1
+
+    def test_budget_caps_hedges(self) -> None:
+        hedger: Hedger = warm(Hedger(path="/events", percentile=50, min_delay=0.0, max_ratio=0.25, minimum_samples=50))
+
+        for _ in range(8):
+            hedger.call(slow_first(0.05))
+
+        assert hedger.stats.hedged == 2
+        assert hedger.stats.hedge_rate == 0.25
+
+    def test_failed_hedge_falls_back_to_primary(self) -> None:
+        hedger: Hedger = warm(Hedger(path="/events", min_delay=0.0, max_ratio=1.0))
+        attempts: Iterator[int] = count()
+
+        def send() -> FakeResponse:
+            if next(attempts) == 0:
+                time.sleep(0.1)
+                return FakeResponse()
+            raise requests.ConnectionError()
+
+        assert hedger.call(send).attempt == 0
+        assert hedger.stats.wins == 0
+
+    def test_both_failing_raises(self) -> None:
+        hedger: Hedger = warm(Hedger(path="/events", min_delay=0.0, max_ratio=1.0))
+
+        def send() -> FakeResponse:
+            time.sleep(0.05)
+            raise requests.ConnectionError()
+
+        with pytest.raises(requests.ConnectionError):
+            hedger.call(send)
+
+    def test_acall_hedge_wins_and_cancels_primary(self) -> None:
+        hedger: Hedger = warm(Hedger(path="/events", min_delay=0.0, max_ratio=1.0))
+        send: ASlowFirst = ASlowFirst()
+
+        async def run() -> FakeResponse:
+            response: FakeResponse = await hedger.acall(send)
+            await asyncio.sleep(0)
+            return response
+
+        assert asyncio.run(run()).attempt == 1
+        assert send.cancelled == [0]
+        assert hedger.stats.wins == 1
+
+    @pytest.mark.parametrize("arguments", [{"percentile": 100}, {"max_ratio": 0}, {"minimum_samples": 200}])
+    def test_invalid_arguments(self, arguments: dict) -> None:
+        with pytest.raises(ValueError):
+            Hedger(path="/events", **arguments)
+
+
+class TestHedging:
+    def teardown_method(self) -> None:
+        reset_hedgers()
+
+    def test_opt_in(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        assert not hedging_enabled()
+        with hedging():
+            assert hedging_enabled()
+        monkeypatch.setenv("YELP_HEDGE_REQUESTS", "true")
+        assert hedging_enabled()
+        with hedging(enabled=False):
+            assert not hedging_enabled()
+
+    def test_registry_from_settings(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv("YELP_HEDGE_PERCENTILE", "99")
+
+        hedger: Hedger = get_hedger("/events")
+
+        assert hedger.percentile == 99.0
+        assert get_hedger("/events") is hedger
+        assert hedgers() == {"/events": hedger}
+
+    def test_get_hedges(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(CategoryDetailsEndpoint, "_send", lambda self: FakeResponse())
+        endpoint: CategoryDetailsEndpoint = CategoryDetailsEndpoint(alias="bars")
+
+        endpoint._get()
+        assert hedgers() == {}
+
+        with hedging():
+            endpoint._get()
+        assert hedgers()["/categories/{alias}"].stats.requests == 1
@@ -0,0 +1,113 @@
+import asyncio
+from multiprocessing import get_context
+from pathlib import Path
+from threading import Thread, current_thread, main_thread
+from typing import Callable, List
+
+import pytest
+
+from tests.conftest import FakeClock
+from yelpfusion3.exceptions import DeadlineExceededError, QuotaExceededError
+from yelpfusion3.quota import QuotaCoordinator, get_quota_coordinator, set_quota_coordinator
+from yelpfusion3.timeout import deadline
+
+
+def reserve_until_exhausted(path: Path) -> int:
+    quota_coordinator: QuotaCoordinator = QuotaCoordinator(path=path, per_day=50, api_key="key")
+    reserved: int = 0
+    try:
+        for _ in range(50):
+            quota_coordinator.reserve()
+            reserved += 1
+    except QuotaExceededError:
+        pass
+    return reserved
+
+
+class TestQuotaCoordinator:
+    def test_daily_budget(self, tmp_path: Path) -> None:
+        quota_coordinator: QuotaCoordinator = QuotaCoordinator(path=tmp_path / "quota.db", per_day=2, api_key="key")
+
+        quota_coordinator.acquire()
+        quota_coordinator.acquire()
+
+        assert quota_coordinator.used_today() == 2
+        with pytest.raises(QuotaExceededError):
+            quota_coordinator.acquire()
+        assert quota_coordinator.used_today() == 2
+
+    def test_budget_is_shared_between_instances(self, tmp_path: Path) -> None:
+        first: QuotaCoordinator = QuotaCoordinator(path=tmp_path / "quota.db", per_day=3, api_key="key")
+        second: QuotaCoordinator = QuotaCoordinator(path=tmp_path / "quota.db", per_day=3, api_key="key")
+        other_key: QuotaCoordinator = QuotaCoordinator(path=tmp_path / "quota.db", per_day=3, api_key="other")
+
+        first.acquire()
+        second.acquire()
+        other_key.acquire()
+
+        assert first.used_today() == 2
+        assert other_key.used_today() == 1
+
+    def test_per_second_budget(self, tmp_path: Path) -> None:
+        clock: FakeClock = FakeClock(1_700_000_000.25)
+        quota_coordinator: QuotaCoordinator = QuotaCoordinator(
+            path=tmp_path / "quota.db", per_second=2, api_key="key", clock=clock
+        )
+
+        delays: List[float] = [quota_coordinator.reserve() for _ in range(5)]
+
+        assert delays == pytest.approx([0.0, 0.0, 0.75, 0.75, 1.75])
+
+    def test_nothing_reserved_past_deadline(self, tmp_path: Path) -> None:
+        clock: FakeClock = FakeClock(1_700_000_000.25)
+        quota_coordinator: QuotaCoordinator = QuotaCoordinator(
+            path=tmp_path / "quota.db", per_day=10, per_second=1, api_key="key", clock=clock
+        )
+        quota_coordinator.reserve()
+
+        with deadline(0.5), pytest.raises(DeadlineExceededError):
+            quota_coordinator.acquire()
+
+        assert quota_coordinator.used_today() == 1
+        assert quota_coordinator.reserve() == pytest.approx(0.75)
+
+    def test_aacquire_reserves_off_the_event_loop(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        quota_coordinator: QuotaCoordinator = QuotaCoordinator(path=tmp_path / "quota.db", per_day=2, api_key="key")
+        reserve: Callable[[], float] = quota_coordinator.reserve
+        threads: List[Thread] = []
+
+        def record_thread() -> float:
+            threads.append(current_thread())
+            return reserve()
+
+        monkeypatch.setattr(quota_coordinator, "reserve", record_thread)
+        asyncio.run(quota_coordinator.aacquire())
+
+        assert threads and threads[0] is not main_thread()
+        assert quota_coordinator.used_today() == 1
+
+    def test_budget_is_shared_between_processes(self, tmp_path: Path) -> None:
+        with get_context("spawn").Pool(processes=4) as pool:
+            reserved: List[int] = pool.map(reserve_until_exhausted, [tmp_path / "quota.db"] * 4)
+
+        assert sum(reserved) == 50
+
+
+class TestSharedQuotaCoordinator:
+    def teardown_method(self) -> None:
+        set_quota_coordinator(None)
+
+    def test_disabled_by_default(self) -> None:
+        set_quota_coordinator(None)
+
+        assert get_quota_coordinator() is None
+
+    def test_from_settings(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv("YELP_QUOTA_PATH", str(tmp_path / "quota.db"))
+        monkeypatch.setenv("YELP_QUOTA_PER_DAY", "5000")
+        set_quota_coordinator(None)
+
+        quota_coordinator: QuotaCoordinator = get_quota_coordinator()
+
+        assert quota_coordinator.path == tmp_path / "quota.db"
+        assert quota_coordinator.per_day == 5000
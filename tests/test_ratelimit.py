@@ -0,0 +1,99 @@
+import asyncio
+import time
+from typing import List
+
+import pytest
+
+from tests.conftest import FakeClock
+from yelpfusion3.exceptions import DeadlineExceededError, QuotaExceededError
+from yelpfusion3.ratelimit import RateLimiter, get_rate_limiter, set_rate_limiter
+from yelpfusion3.timeout import deadline
+
+
+class TestRateLimiter:
+    def test_unlimited(self) -> None:
+        rate_limiter: RateLimiter = RateLimiter()
+
+        assert all(rate_limiter.reserve() == 0.0 for _ in range(100))
+
+    def test_slots_are_reserved_in_order(self) -> None:
+        rate_limiter: RateLimiter = RateLimiter(per_second=10, clock=FakeClock(100.0))
+
+        delays: List[float] = [rate_limiter.reserve() for _ in range(4)]
+
+        assert delays == pytest.approx([0.0, 0.1, 0.2, 0.3])
+
+    def test_burst(self) -> None:
+        clock: FakeClock = FakeClock(100.0)
+        rate_limiter: RateLimiter = RateLimiter(per_second=10, burst=3, clock=clock)
+
+        assert [rate_limiter.reserve() for _ in range(4)] == pytest.approx([0.0, 0.0, 0.0, 0.1])
+
+        clock.now += 10
+        assert [rate_limiter.reserve() for _ in range(3)] == pytest.approx([0.0, 0.0, 0.0])
+
+    def test_daily_budget(self) -> None:
+        rate_limiter: RateLimiter = RateLimiter(per_day=2)
+
+        rate_limiter.acquire()
+        rate_limiter.acquire()
+
+        assert rate_limiter.used_today == 2
+        with pytest.raises(QuotaExceededError):
+            rate_limiter.acquire()
+
+    def test_nothing_reserved_past_deadline(self) -> None:
+        rate_limiter: RateLimiter = RateLimiter(per_second=1, per_day=10, clock=FakeClock(100.0))
+        rate_limiter.reserve()
+
+        with deadline(0.5), pytest.raises(DeadlineExceededError):
+            rate_limiter.acquire()
+
+        assert rate_limiter.used_today == 1
+        assert rate_limiter.reserve() == pytest.approx(1.0)
+
+    def test_acquire_waits(self) -> None:
+        rate_limiter: RateLimiter = RateLimiter(per_second=20)
+        start: float = time.monotonic()
+
+        for _ in range(3):
+            rate_limiter.acquire()
+
+        assert time.monotonic() - start >= 0.09
+
+    def test_aacquire_waits(self) -> None:
+        rate_limiter: RateLimiter = RateLimiter(per_second=20)
+
+        async def run() -> float:
+            start: float = time.monotonic()
+            await asyncio.gather(*(rate_limiter.aacquire() for _ in range(3)))
+            return time.monotonic() - start
+
+        assert asyncio.run(run()) >= 0.09
+
+    @pytest.mark.parametrize("arguments", [{"per_second": 0}, {"burst": 0}, {"per_day": 0}])
+    def test_invalid_arguments(self, arguments: dict) -> None:
+        with pytest.raises(ValueError):
+            RateLimiter(**arguments)
+
+
+class TestSharedRateLimiter:
+    def teardown_method(self) -> None:
+        set_rate_limiter(None)
+
+    def test_from_settings(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv("YELP_RATE_LIMIT_PER_SECOND", "5")
+        monkeypatch.setenv("YELP_RATE_LIMIT_PER_DAY", "5000")
+        set_rate_limiter(None)
+
+        rate_limiter: RateLimiter = get_rate_limiter()
+
+        assert rate_limiter.per_second == 5
+        assert rate_limiter.per_day == 5000
+        assert get_rate_limiter() is rate_limiter
+
+    def test_set_rate_limiter(self) -> None:
+        rate_limiter: RateLimiter = RateLimiter(per_second=1)
+        set_rate_limiter(rate_limiter)
+
+        assert get_rate_limiter() is rate_limiter
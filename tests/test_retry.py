@@ -0,0 +1,155 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from typing import Iterator, List, Optional, Union
+
+import pytest
+import requests
+
+from tests.conftest import FakeResponse
+from yelpfusion3.category.endpoint import CategoryDetailsEndpoint
+from yelpfusion3.category.model import CategoryDetails
+from yelpfusion3.exceptions import ApiError
+from yelpfusion3.retry import RetryPolicy, check_response, get_retry_policy, parse_retry_after, set_retry_policy
+
+
+class FakeSend:
+    def __init__(self, *outcomes: Union[FakeResponse, Exception]) -> None:
+        self.outcomes: Iterator[Union[FakeResponse, Exception]] = iter(outcomes)
+        self.calls: int = 0
+
+    def __call__(self) -> FakeResponse:
+        self.calls += 1
+        outcome: Union[FakeResponse, Exception] = next(self.outcomes)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+    async def asend(self) -> FakeResponse:
+        return self()
+
+
+NO_WAIT: RetryPolicy = RetryPolicy(max_attempts=3, backoff_base=0.001, backoff_max=0.001)
+
+
+class TestParseRetryAfter:
+    @pytest.mark.parametrize("value, expected", [("3", 3.0), ("0.5", 0.5), ("-1", 0.0), (None, None), ("soon", None)])
+    def test_seconds(self, value: Optional[str], expected: Optional[float]) -> None:
+        assert parse_retry_after(value) == expected
+
+    def test_http_date(self) -> None:
+        value: str = format_datetime(datetime.now(tz=timezone.utc) + timedelta(seconds=30), usegmt=True)
+
+        assert 28 <= parse_retry_after(value) <= 30
+
+
+class TestCheckResponse:
+    def test_success(self) -> None:
+        response: FakeResponse = FakeResponse(200, {})
+
+        assert check_response(response) is response
+
+    def test_error_payload(self) -> None:
+        response: FakeResponse = FakeResponse(
+            404, {"error": {"code": "BUSINESS_NOT_FOUND", "description": "The requested business could not be found."}}
+        )
+
+        with pytest.raises(ApiError) as error:
+            check_response(response)
+
+        assert error.value.status_code == 404
+        assert error.value.code == "BUSINESS_NOT_FOUND"
+        assert error.value.description == "The requested business could not be found."
+
+    def test_error_without_payload(self) -> None:
+        with pytest.raises(ApiError) as error:
+            check_response(FakeResponse(502))
+
+        assert error.value.status_code == 502
+        assert error.value.code is None
+
+
+class TestRetryPolicy:
+    def test_backoff_is_capped(self) -> None:
+        policy: RetryPolicy = RetryPolicy(backoff_base=1.0, backoff_max=4.0)
+
+        delays: List[float] = [policy.backoff(retry) for retry in range(1, 10) for _ in range(20)]
+
+        assert all(0.0 <= delay <= 4.0 for delay in delays)
+
+    def test_backoff_honors_retry_after(self) -> None:
+        assert RetryPolicy().backoff(1, retry_after=7.0) == 7.0
+
+    def test_retries_retryable_status(self) -> None:
+        send: FakeSend = FakeSend(FakeResponse(503), FakeResponse(429), FakeResponse(200, {}))
+
+        assert NO_WAIT.call(send).status_code == 200
+        assert send.calls == 3
+
+    def test_retries_transient_errors(self) -> None:
+        send: FakeSend = FakeSend(requests.ConnectionError(), FakeResponse(200, {}))
+
+        assert NO_WAIT.call(send).status_code == 200
+        assert send.calls == 2
+
+    def test_gives_up_after_max_attempts(self) -> None:
+        send: FakeSend = FakeSend(FakeResponse(503), FakeResponse(503), FakeResponse(503), FakeResponse(200, {}))
+
+        with pytest.raises(ApiError) as error:
+            NO_WAIT.call(send)
+
+        assert error.value.status_code == 503
+        assert send.calls == 3
+
+    def test_reraises_last_transient_error(self) -> None:
+        send: FakeSend = FakeSend(requests.Timeout(), requests.Timeout(), requests.Timeout())
+
+        with pytest.raises(requests.Timeout):
+            NO_WAIT.call(send)
+
+    def test_fails_fast_on_client_error(self) -> None:
+        send: FakeSend = FakeSend(FakeResponse(400), FakeResponse(200, {}))
+
+        with pytest.raises(ApiError):
+            NO_WAIT.call(send)
+
+        assert send.calls == 1
+
+    def test_gives_up_when_retry_after_exceeds_budget(self) -> None:
+        policy: RetryPolicy = RetryPolicy(retry_budget=5.0)
+        send: FakeSend = FakeSend(FakeResponse(429, headers={"Retry-After": "60"}), FakeResponse(200, {}))
+
+        with pytest.raises(ApiError) as error:
+            policy.call(send)
+
+        assert error.value.status_code == 429
+        assert send.calls == 1
+
+    def test_acall(self) -> None:
+        send: FakeSend = FakeSend(FakeResponse(500), FakeResponse(200, {}))
+
+        assert asyncio.run(NO_WAIT.acall(send.asend)).status_code == 200
+        assert send.calls == 2
+
+
+class TestEndpointRetries:
+    def teardown_method(self) -> None:
+        set_retry_policy(None)
+
+    def test_get_retries(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        set_retry_policy(NO_WAIT)
+        send: FakeSend = FakeSend(
+            FakeResponse(503), FakeResponse(200, {"category": {"alias": "bars", "title": "Bars"}})
+        )
+        monkeypatch.setattr(CategoryDetailsEndpoint, "_send", lambda self: send())
+
+        category_details: CategoryDetails = CategoryDetailsEndpoint(alias="bars").get()
+
+        assert category_details.category.title == "Bars"
+        assert send.calls == 2
+
+    def test_from_settings(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv("YELP_RETRY_MAX_ATTEMPTS", "5")
+        set_retry_policy(None)
+
+        assert get_retry_policy().max_attempts == 5
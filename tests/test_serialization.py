@@ -0,0 +1,115 @@
+import json
+from datetime import datetime
+from typing import Any, List
+
+import pytest
+
+from yelpfusion3.business.model import Review
+from yelpfusion3.serialization import (
+    JsonBackend,
+    OrjsonBackend,
+    dumps,
+    get_json_backend,
+    loads,
+    set_json_backend,
+)
+
+REVIEW: dict = {
+    "id": "xAG4O7l-t1ubbwVAlPnDKg",
+    "rating": 5,
+    "user": {
+        "id": "W8UK02IDdRS2GL_66fuq6w",
+        "profile_url": "https://www.yelp.com/user_details?userid=W8UK02IDdRS2GL_66fuq6w",
+        "image_url": "https://s3-media3.fl.yelpcdn.com/photo/iwoAD12zkONZxJ94ChAaMg/o.jpg",
+        "name": "Ella A.",
+    },
+    "text": "Went back again to this place since the last time I visited the Bay Area 5 months ago — café au lait.",
+    "time_created": "2016-08-29 00:41:13",
+    "url": "https://www.yelp.com/biz/la-palma-mexicatessen-san-francisco?hrid=hp8hAJ-AnlpqxCCu7kyCWA",
+}
+
+
+def backends() -> List[JsonBackend]:
+    pytest.importorskip("orjson")
+    return [JsonBackend(), OrjsonBackend()]
+
+
+class SpyBackend(JsonBackend):
+    def __init__(self) -> None:
+        self.calls: List[str] = []
+
+    def loads(self, data: Any) -> Any:
+        self.calls.append("loads")
+        return super().loads(data)
+
+    def dumps(self, value: Any, **kwargs: Any) -> str:
+        self.calls.append("dumps")
+        return super().dumps(value, **kwargs)
+
+
+class TestJsonBackend:
+    def teardown_method(self) -> None:
+        set_json_backend(None)
+
+    @pytest.mark.parametrize("index", [0, 1])
+    def test_round_trip(self, index: int) -> None:
+        backend: JsonBackend = backends()[index]
+        value: dict = {"name": "Café", "rating": 4.5, "tags": [1, None, True]}
+
+        assert backend.loads(backend.dumps(value)) == value
+        assert backend.loads(json.dumps(value).encode()) == value
+
+    @pytest.mark.parametrize("index", [0, 1])
+    def test_options(self, index: int) -> None:
+        backend: JsonBackend = backends()[index]
+
+        assert backend.dumps({"b": 1, "a": 2}, sort_keys=True).replace(" ", "") == '{"a":2,"b":1}'
+        assert backend.dumps({"a": [1]}, indent=2) == json.dumps({"a": [1]}, indent=2)
+        assert backend.dumps({"a": [1]}, indent=4) == json.dumps({"a": [1]}, indent=4)
+
+    @pytest.mark.parametrize("index", [0, 1])
+    def test_default(self, index: int) -> None:
+        backend: JsonBackend = backends()[index]
+
+        assert backend.loads(backend.dumps({"value": {1, 2}}, default=sorted)) == {"value": [1, 2]}
+
+    @pytest.mark.parametrize("index", [0, 1])
+    def test_invalid(self, index: int) -> None:
+        with pytest.raises(ValueError):
+            backends()[index].loads(b"{")
+
+    def test_defaults_to_orjson(self) -> None:
+        pytest.importorskip("orjson")
+
+        assert get_json_backend().name == "orjson"
+
+    def test_from_settings(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv("YELP_JSON_BACKEND", "stdlib")
+
+        assert get_json_backend().name == "stdlib"
+        assert loads("[1]") == [1]
+        assert dumps([1]) == "[1]"
+
+
+class TestModelSerialization:
+    def teardown_method(self) -> None:
+        set_json_backend(None)
+
+    def test_uses_backend(self) -> None:
+        spy: SpyBackend = SpyBackend()
+        set_json_backend(spy)
+
+        review: Review = Review.parse_raw(json.dumps(REVIEW))
+        review.json()
+
+        assert spy.calls == ["loads", "dumps"]
+
+    def test_backends_agree(self) -> None:
+        review: Review = Review(**REVIEW)
+        outputs: List[str] = []
+        for backend in backends():
+            set_json_backend(backend)
+            outputs.append(review.json())
+
+        assert json.loads(outputs[0]) == json.loads(outputs[1])
+        assert json.loads(outputs[0])["time_created"] == datetime(2016, 8, 29, 0, 41, 13).isoformat()
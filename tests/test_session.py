@@ -0,0 +1,66 @@
+import asyncio
+
+import pytest
+from requests import Session
+from requests.adapters import HTTPAdapter
+
+from yelpfusion3.session import (
+    aclose_session,
+    close_session,
+    create_async_session,
+    create_http2_session,
+    create_session,
+    get_async_session,
+    get_session,
+)
+from yelpfusion3.settings import Settings
+
+
+class TestSession:
+    def teardown_method(self) -> None:
+        close_session()
+
+    def test_create_session(self) -> None:
+        session: Session = create_session(Settings(pool_connections=2, pool_maxsize=32, pool_block=True))
+        adapter: HTTPAdapter = session.get_adapter("https://api.yelp.com/v3")
+
+        assert adapter._pool_connections == 2
+        assert adapter._pool_maxsize == 32
+        assert adapter._pool_block is True
+        assert session.headers["Connection"] == "keep-alive"
+
+    def test_create_session_without_keep_alive(self) -> None:
+        session: Session = create_session(Settings(keep_alive=False))
+
+        assert session.headers["Connection"] == "close"
+
+    def test_get_session_is_shared(self) -> None:
+        assert get_session() is get_session()
+
+    def test_close_session(self) -> None:
+        session: Session = get_session()
+        close_session()
+
+        assert get_session() is not session
+
+    def test_get_async_session_per_event_loop(self) -> None:
+        pytest.importorskip("httpx")
+
+        async def run() -> object:
+            session = get_async_session()
+            assert get_async_session() is session
+            await aclose_session()
+            return session
+
+        assert asyncio.run(run()) is not asyncio.run(run())
+
+    def test_http2_sessions(self) -> None:
+        pytest.importorskip("h2")
+
+        http2_session = create_http2_session(Settings(async_max_connections=4))
+        async_session = create_async_session(Settings(http2=True))
+
+        assert http2_session._transport._pool._http2
+        assert http2_session._transport._pool._max_connections == 4
+        assert async_session._transport._pool._http2
+        assert not create_async_session(Settings())._transport._pool._http2
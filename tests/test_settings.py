@@ -1,6 +1,7 @@
 import os
 
-from yelpfusion3.settings import Settings
+from yelpfusion3.cache import set_cache
+from yelpfusion3.settings import Settings, get_settings, reset_settings
 
 
 class TestSettings:
@@ -9,3 +10,19 @@ class TestSettings:
         settings: Settings = Settings()
 
         assert settings.headers == {"Authorization": "Bearer TESTAPIKEY"}
+
+    def test_shared_until_reset(self) -> None:
+        settings: Settings = get_settings()
+        os.environ["YELP_HEDGE_REQUESTS"] = str(not settings.hedge_requests).lower()
+        try:
+            assert get_settings() is settings
+            reset_settings()
+            assert get_settings().hedge_requests is not settings.hedge_requests
+        finally:
+            del os.environ["YELP_HEDGE_REQUESTS"]
+
+    def test_kept_by_registries(self) -> None:
+        settings: Settings = get_settings()
+        set_cache(None)
+
+        assert get_settings() is settings
@@ -0,0 +1,110 @@
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from threading import Event
+from typing import List, Optional
+
+import pytest
+
+from yelpfusion3.cache import CacheEntry
+from yelpfusion3.category.endpoint import CategoryDetailsEndpoint
+from yelpfusion3.category.model import CategoryDetails
+from yelpfusion3.singleflight import SingleFlight
+
+
+class TestSingleFlight:
+    def test_do_coalesces_concurrent_calls(self) -> None:
+        single_flight: SingleFlight = SingleFlight()
+        release: Event = Event()
+        calls: List[int] = []
+
+        def slow() -> object:
+            calls.append(1)
+            release.wait(timeout=5)
+            return object()
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            futures = [executor.submit(single_flight.do, "key", slow) for _ in range(8)]
+            time.sleep(0.1)
+            release.set()
+            results = [future.result() for future in futures]
+
+        assert len(calls) == 1
+        assert all(result is results[0] for result in results)
+        assert single_flight.in_flight == 0
+
+    def test_do_shares_exceptions(self) -> None:
+        single_flight: SingleFlight = SingleFlight()
+
+        def fail() -> None:
+            raise RuntimeError("Request failed.")
+
+        with pytest.raises(RuntimeError):
+            single_flight.do("key", fail)
+        assert single_flight.do("key", lambda: 42) == 42
+
+    def test_ado_coalesces_concurrent_calls(self) -> None:
+        single_flight: SingleFlight = SingleFlight()
+        calls: List[int] = []
+
+        async def slow() -> object:
+            calls.append(1)
+            await asyncio.sleep(0.05)
+            return object()
+
+        async def run() -> list:
+            return await asyncio.gather(*(single_flight.ado("key", slow) for _ in range(8)))
+
+        results: list = asyncio.run(run())
+
+        assert len(calls) == 1
+        assert all(result is results[0] for result in results)
+        assert single_flight.in_flight == 0
+
+    def test_ado_different_keys(self) -> None:
+        single_flight: SingleFlight = SingleFlight()
+
+        async def value(number: int) -> int:
+            await asyncio.sleep(0)
+            return number
+
+        async def run() -> list:
+            return await asyncio.gather(
+                single_flight.ado("a", lambda: value(1)), single_flight.ado("b", lambda: value(2))
+            )
+
+        assert asyncio.run(run()) == [1, 2]
+
+
+class TestEndpointCoalescing:
+    def test_get_shares_one_request(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        calls: List[int] = []
+
+        def load(self: CategoryDetailsEndpoint, model: type, entry: Optional[CacheEntry] = None) -> CategoryDetails:
+            calls.append(1)
+            time.sleep(0.1)
+            return model(category={"alias": self.alias, "title": "Bars"})
+
+        monkeypatch.setattr(CategoryDetailsEndpoint, "_load", load)
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            results = list(executor.map(lambda _: CategoryDetailsEndpoint(alias="bars").get(), range(4)))
+
+        assert len(calls) == 1
+        assert all(result is results[0] for result in results)
+
+    def test_get_without_coalescing(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv("YELP_COALESCE_REQUESTS", "false")
+        calls: List[int] = []
+
+        def load(self: CategoryDetailsEndpoint, model: type, entry: Optional[CacheEntry] = None) -> CategoryDetails:
+            calls.append(1)
+            time.sleep(0.1)
+            return model(category={"alias": self.alias, "title": "Bars"})
+
+        monkeypatch.setattr(CategoryDetailsEndpoint, "_load", load)
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            list(executor.map(lambda _: CategoryDetailsEndpoint(alias="bars").get(), range(4)))
+
+        assert len(calls) == 4
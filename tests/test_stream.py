@@ -0,0 +1,135 @@
+import asyncio
+import io
+import json
+from typing import Any, AsyncIterator, Dict, List
+
+import pytest
+import requests
+
+from yelpfusion3.business.endpoint import BusinessSearchEndpoint
+from yelpfusion3.business.model import Business
+from yelpfusion3.category.endpoint import AllCategoriesEndpoint
+from yelpfusion3.category.model import Category
+from yelpfusion3.exceptions import ApiError
+from yelpfusion3.stream import ArrayScanner, aiter_items, iter_items
+from yelpfusion3.transport import HttpxTransport
+
+BUSINESS: Dict[str, Any] = {
+    "id": "WavvLdfdP6g8aZTtbBQHTw",
+    "alias": "gary-danko-san-francisco",
+    "name": "Gary Danko",
+    "image_url": "https://s3-media3.fl.yelpcdn.com/bphoto/eyYUz3Xl7NtcJeN7x7SQwg/o.jpg",
+    "is_closed": False,
+    "url": "https://www.yelp.com/biz/gary-danko-san-francisco",
+    "review_count": 5748,
+    "categories": [{"alias": "newamerican", "title": "American (New)"}],
+    "rating": 4.5,
+    "coordinates": {"latitude": 37.80587, "longitude": -122.42058},
+    "transactions": [],
+    "location": {
+        "address1": "800 N Point St",
+        "city": "San Francisco",
+        "zip_code": "94109",
+        "country": "US",
+        "state": "CA",
+        "display_address": ["800 N Point St", "San Francisco, CA 94109"],
+    },
+    "phone": "+14157492060",
+    "display_phone": "(415) 749-2060",
+}
+
+BODY: bytes = json.dumps(
+    {
+        "total": 1234,
+        "region": {"center": {"latitude": 37.8, "longitude": -122.4}},
+        "businesses": [{"index": index, "name": "Café"} for index in range(20)],
+        "extra": [1, 2.5, True, None, "]"],
+    }
+).encode()
+
+
+def chunked(body: bytes, size: int) -> List[bytes]:
+    return [body[start : start + size] for start in range(0, len(body), size)]
+
+
+def fake_response(status_code: int, body: bytes) -> requests.Response:
+    response: requests.Response = requests.Response()
+    response.status_code = status_code
+    response.raw = io.BytesIO(body)
+    return response
+
+
+class TestIterItems:
+    @pytest.mark.parametrize("size", [1, 3, 17, 4096])
+    def test_any_chunk_size(self, size: int) -> None:
+        items: List[dict] = list(iter_items(chunked(BODY, size), "businesses"))
+
+        assert items == [{"index": index, "name": "Café"} for index in range(20)]
+
+    def test_missing_or_empty_array(self) -> None:
+        assert not list(iter_items([b'{"total": 0}'], "businesses"))
+        assert not list(iter_items([b'{"categories": [ ]}'], "categories"))
+
+    def test_yields_before_body_ends(self) -> None:
+        scanner: ArrayScanner = ArrayScanner("categories")
+
+        assert scanner.feed(b'{"categories": [{"alias": "bars"}, {"alias": "caf') == [{"alias": "bars"}]
+        assert scanner.feed(b'es"}]}') == [{"alias": "cafes"}]
+        assert not scanner.close()
+
+    @pytest.mark.parametrize(
+        "body", [b'["businesses"]', b'{"businesses": {}}', b'{"businesses": [1]}', b'{"businesses": [{}', b"{"]
+    )
+    def test_malformed(self, body: bytes) -> None:
+        with pytest.raises(ValueError):
+            list(iter_items([body], "businesses"))
+
+    def test_aiter_items(self) -> None:
+        async def chunks() -> AsyncIterator[bytes]:
+            for chunk in chunked(BODY, 5):
+                yield chunk
+
+        async def run() -> List[dict]:
+            return [item async for item in aiter_items(chunks(), "businesses")]
+
+        assert len(asyncio.run(run())) == 20
+
+
+class TestEndpointStream:
+    def test_stream(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        body: bytes = json.dumps({"total": 2, "businesses": [BUSINESS, BUSINESS]}).encode()
+        calls: List[Dict[str, Any]] = []
+
+        def send(self: BusinessSearchEndpoint, stream: bool = False) -> requests.Response:
+            calls.append({"stream": stream})
+            return fake_response(200, body)
+
+        monkeypatch.setattr(BusinessSearchEndpoint, "_send", send)
+
+        businesses: List[Business] = list(BusinessSearchEndpoint(location="San Francisco").stream())
+
+        assert calls == [{"stream": True}]
+        assert [business.id for business in businesses] == ["WavvLdfdP6g8aZTtbBQHTw"] * 2
+        assert all(isinstance(business, Business) for business in businesses)
+
+    def test_stream_error(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        body: bytes = json.dumps({"error": {"code": "VALIDATION_ERROR", "description": "Bad location."}}).encode()
+        monkeypatch.setattr(BusinessSearchEndpoint, "_send", lambda self, stream=False: fake_response(400, body))
+
+        with pytest.raises(ApiError) as error:
+            list(BusinessSearchEndpoint(location="Nowhere").stream())
+
+        assert error.value.code == "VALIDATION_ERROR"
+
+    def test_astream(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        httpx = pytest.importorskip("httpx")
+        body: bytes = json.dumps({"categories": [{"alias": "bars", "title": "Bars"}]}).encode()
+        session = httpx.AsyncClient(transport=httpx.MockTransport(lambda request: httpx.Response(200, content=body)))
+        monkeypatch.setattr("yelpfusion3.endpoint.get_async_transport", lambda: HttpxTransport(session))
+
+        async def run() -> List[Category]:
+            return [category async for category in AllCategoriesEndpoint().astream()]
+
+        categories: List[Category] = asyncio.run(run())
+
+        assert [category.alias for category in categories] == ["bars"]
@@ -0,0 +1,193 @@
+import asyncio
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from threading import Thread
+from typing import Any, Dict, Iterator, List
+
+import pytest
+import requests
+
+from tests.conftest import FakeResponse
+from yelpfusion3.batch import Batch, BatchResult
+from yelpfusion3.business.endpoint import AutocompleteEndpoint, BusinessSearchEndpoint
+from yelpfusion3.category.endpoint import CategoryDetailsEndpoint
+from yelpfusion3.exceptions import DeadlineExceededError
+from yelpfusion3.retry import RetryPolicy
+from yelpfusion3.timeout import (
+    Timeout,
+    check_deadline,
+    deadline,
+    deadline_asleep,
+    deadline_sleep,
+    remaining,
+    request_timeout,
+    timeout,
+    within_deadline,
+)
+from yelpfusion3.transport import RequestsTransport
+
+
+class SlowBody(BaseHTTPRequestHandler):
+    """
+    Sends a 20-byte body one byte every 50 ms.
+    """
+
+    def do_GET(self) -> None:  # pylint: disable=invalid-name
+        self.send_response(200)
+        self.send_header("Content-Length", "20")
+        self.end_headers()
+        try:
+            for _ in range(20):
+                time.sleep(0.05)
+                self.wfile.write(b" ")
+                self.wfile.flush()
+        except OSError:
+            pass
+
+    def log_message(self, *args: Any) -> None:
+        pass
+
+
+@pytest.fixture
+def slow_body_server() -> Iterator[str]:
+    server: ThreadingHTTPServer = ThreadingHTTPServer(("127.0.0.1", 0), SlowBody)
+    Thread(target=server.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{server.server_address[1]}/v3"
+    server.shutdown()
+    server.server_close()
+
+
+class FakeSession:
+    def __init__(self) -> None:
+        self.calls: List[Dict[str, Any]] = []
+
+    def get(self, **kwargs: Any) -> FakeResponse:
+        self.calls.append(kwargs)
+        return FakeResponse(503)
+
+
+class TestTimeout:
+    def test_defaults(self) -> None:
+        assert Timeout().as_tuple() == (3.05, 20.0)
+        assert Timeout(connect=1, read=2).as_httpx() == (1, 2, 2, 1)
+
+    def test_within(self) -> None:
+        default: Timeout = Timeout(connect=1, read=5)
+
+        assert default.within(None) is default
+        assert default.within(10) is default
+        assert default.within(2).as_tuple() == (1, 2)
+
+    def test_endpoint_defaults(self) -> None:
+        assert AutocompleteEndpoint._timeout.read < CategoryDetailsEndpoint._timeout.read
+        assert BusinessSearchEndpoint._timeout.read > CategoryDetailsEndpoint._timeout.read
+
+
+class TestRequestTimeout:
+    def test_default(self) -> None:
+        assert request_timeout(Timeout(connect=1, read=5)).as_tuple() == (1, 5)
+
+    def test_override(self) -> None:
+        with timeout(read=7):
+            assert request_timeout(Timeout(connect=1, read=5)).as_tuple() == (1, 7)
+        with timeout(connect=2, read=3):
+            assert request_timeout(Timeout(connect=1, read=5)).as_tuple() == (2, 3)
+
+    def test_clamped_to_deadline(self) -> None:
+        with deadline(0.5):
+            clamped: Timeout = request_timeout(Timeout(connect=1, read=5))
+
+        assert clamped.connect <= 0.5
+        assert clamped.read <= 0.5
+
+
+class TestDeadline:
+    def test_remaining(self) -> None:
+        assert remaining() is None
+        with deadline(5):
+            assert 4 < remaining() <= 5
+        assert remaining() is None
+
+    def test_nested_deadline_only_shortens(self) -> None:
+        with deadline(1):
+            with deadline(10):
+                assert remaining() <= 1
+            with deadline(0.1):
+                assert remaining() <= 0.1
+
+    def test_check_deadline(self) -> None:
+        with deadline(0.01):
+            time.sleep(0.02)
+            with pytest.raises(DeadlineExceededError):
+                check_deadline()
+
+    def test_deadline_sleep(self) -> None:
+        with deadline(0.1):
+            deadline_sleep(0.01)
+            with pytest.raises(DeadlineExceededError):
+                deadline_sleep(1)
+
+    def test_deadline_asleep(self) -> None:
+        async def run() -> None:
+            with deadline(0.1):
+                await deadline_asleep(0.01)
+                await deadline_asleep(1)
+
+        with pytest.raises(DeadlineExceededError):
+            asyncio.run(run())
+
+    def test_within_deadline(self) -> None:
+        async def run() -> None:
+            with deadline(0.05):
+                assert await within_deadline(asyncio.sleep(0, result=1)) == 1
+                await within_deadline(asyncio.sleep(1))
+
+        with pytest.raises(DeadlineExceededError):
+            asyncio.run(run())
+
+    def test_deadline_exceeded_is_timeout_error(self) -> None:
+        assert issubclass(DeadlineExceededError, TimeoutError)
+
+
+class TestEndpointTimeouts:
+    def test_send_passes_timeouts(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        session: FakeSession = FakeSession()
+        monkeypatch.setattr("yelpfusion3.endpoint.get_transport", lambda: RequestsTransport(session))
+
+        AutocompleteEndpoint(text="pizza")._send()
+        with timeout(read=2):
+            AutocompleteEndpoint(text="pizza")._send()
+
+        assert session.calls[0]["timeout"] == AutocompleteEndpoint._timeout.as_tuple()
+        assert session.calls[1]["timeout"] == (AutocompleteEndpoint._timeout.connect, 2)
+
+    def test_retries_stop_at_deadline(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        session: FakeSession = FakeSession()
+        monkeypatch.setattr("yelpfusion3.endpoint.get_transport", lambda: RequestsTransport(session))
+        monkeypatch.setattr(
+            "yelpfusion3.endpoint.get_retry_policy",
+            lambda: RetryPolicy(max_attempts=10, backoff_base=0.2, backoff_max=0.2),
+        )
+
+        with deadline(0.3), pytest.raises(Exception):
+            CategoryDetailsEndpoint(alias="bars")._get()
+
+        assert len(session.calls) < 10
+
+    def test_batch_propagates_deadline(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(CategoryDetailsEndpoint, "_load", lambda self, model, entry=None: remaining())
+
+        with deadline(5):
+            results: List[BatchResult] = list(Batch([CategoryDetailsEndpoint(alias="bars")], max_workers=1))
+
+        assert results[0].result is not None
+
+    def test_deadline_bounds_slow_body(self, monkeypatch: pytest.MonkeyPatch, slow_body_server: str) -> None:
+        monkeypatch.setenv("BASE_URL", slow_body_server)
+        monkeypatch.setattr("yelpfusion3.endpoint.get_transport", lambda: RequestsTransport(requests.Session()))
+
+        start: float = time.monotonic()
+        with deadline(0.3), pytest.raises(DeadlineExceededError):
+            CategoryDetailsEndpoint(alias="bars")._get()
+
+        assert time.monotonic() - start < 0.6
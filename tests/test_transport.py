@@ -0,0 +1,234 @@
+import asyncio
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import List
+
+import pytest
+import requests
+
+from yelpfusion3.breaker import reset_circuit_breakers
+from yelpfusion3.category.model import Category, CategoryDetails
+from yelpfusion3.client import AsyncClient, Client
+from yelpfusion3.exceptions import ApiError
+from yelpfusion3.retry import RetryPolicy, set_retry_policy
+from yelpfusion3.timeout import Timeout
+from yelpfusion3.transport import (
+    AsyncTransport,
+    Http2Transport,
+    HttpxTransport,
+    RequestsTransport,
+    StubResponse,
+    StubTransport,
+    Transport,
+    get_async_transport,
+    get_transport,
+    set_async_transport,
+    set_transport,
+)
+
+BARS: dict = {"category": {"alias": "bars", "title": "Bars"}}
+URL: str = "https://api.yelp.com/v3/categories/bars"
+
+
+class TestStubTransport:
+    def test_routes(self) -> None:
+        stub: StubTransport = StubTransport(routes={"/categories/bars": BARS, "/categories/*": StubResponse(b"{}")})
+
+        assert stub.get(URL, {}, Timeout()).json() == BARS
+        assert stub.get("https://api.yelp.com/v3/categories/pubs", {}, Timeout()).content == b"{}"
+        assert stub.requests == [URL, "https://api.yelp.com/v3/categories/pubs"]
+
+    def test_unmatched_path(self) -> None:
+        response: requests.Response = StubTransport().get(URL, {}, Timeout())
+
+        assert response.status_code == 404
+        assert response.json()["error"]["code"] == "NOT_FOUND"
+
+    def test_sequence(self) -> None:
+        stub: StubTransport = StubTransport(
+            routes={"/categories/*": [StubResponse(status_code=503, headers={"Retry-After": "1"}), StubResponse(BARS)]}
+        )
+
+        first: requests.Response = stub.get(URL, {}, Timeout())
+        assert first.status_code == 503
+        assert first.headers["Retry-After"] == "1"
+        assert [stub.get(URL, {}, Timeout()).status_code for _ in range(2)] == [200, 200]
+
+    def test_generated(self) -> None:
+        stub: StubTransport = StubTransport(
+            routes={"/categories/*": lambda url: {"category": {"alias": url.rsplit("/", 1)[1], "title": "Generated"}}}
+        )
+
+        assert stub.get(URL, {}, Timeout()).json()["category"]["alias"] == "bars"
+
+    def test_latency(self) -> None:
+        stub: StubTransport = StubTransport(routes={"/categories/*": StubResponse(BARS, latency=0.02)}, latency=0.03)
+
+        start: float = time.monotonic()
+        stub.get(URL, {}, Timeout())
+
+        assert time.monotonic() - start >= 0.05
+
+    def test_errors(self) -> None:
+        stub: StubTransport = StubTransport(routes={"/categories/*": BARS}, error_rate=0.5, seed=1)
+        failures: int = 0
+        for _ in range(100):
+            try:
+                stub.get(URL, {}, Timeout())
+            except requests.ConnectionError:
+                failures += 1
+
+        assert 30 < failures < 70
+        with pytest.raises(requests.Timeout):
+            StubTransport(routes={"/categories/*": StubResponse(error=requests.Timeout())}).get(URL, {}, Timeout())
+
+    def test_stream(self) -> None:
+        response: requests.Response = StubTransport(routes={"/categories/*": BARS}).get(URL, {}, Timeout(), stream=True)
+
+        assert json.loads(b"".join(response.iter_content(chunk_size=4))) == BARS
+
+    def test_aget(self) -> None:
+        pytest.importorskip("httpx")
+        stub: StubTransport = StubTransport(routes={"/categories/*": StubResponse(BARS, status_code=201)})
+
+        response = asyncio.run(stub.aget(URL, {}, Timeout()))
+
+        assert response.status_code == 201
+        assert response.json() == BARS
+
+    def test_invalid_error_rate(self) -> None:
+        with pytest.raises(ValueError):
+            StubTransport(error_rate=2)
+
+
+class TestRequestsTransport:
+    def test_uses_session(self) -> None:
+        calls: List[dict] = []
+
+        class FakeSession:
+            def get(self, **kwargs: object) -> requests.Response:
+                calls.append(kwargs)
+                response: requests.Response = requests.Response()
+                response.status_code = 200
+                return response
+
+        RequestsTransport(FakeSession()).get(URL, {"Authorization": "Bearer key"}, Timeout(connect=1, read=2))
+
+        assert calls == [{"url": URL, "headers": {"Authorization": "Bearer key"}, "timeout": (1, 2), "stream": False}]
+
+    def test_sync_only(self) -> None:
+        assert not isinstance(RequestsTransport(), AsyncTransport)
+        with pytest.raises(TypeError):
+            Transport()
+        with pytest.raises(TypeError):
+            AsyncTransport()
+
+
+class TestHttp2Transport:
+    def setup_method(self) -> None:
+        httpx = pytest.importorskip("httpx")
+        self.requests: List[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            self.requests.append(request)
+            if request.url.path.endswith("/missing"):
+                return httpx.Response(404, json={"error": {"code": "NOT_FOUND"}})
+            return httpx.Response(200, json=BARS, headers={"RateLimit-Remaining": "10"})
+
+        self.transport: Http2Transport = Http2Transport(httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+
+    def teardown_method(self) -> None:
+        self.transport.close()
+
+    def test_adapts_response(self) -> None:
+        response: requests.Response = self.transport.get(
+            URL, {"Authorization": "Bearer key"}, Timeout(connect=1, read=2)
+        )
+
+        assert response.status_code == 200
+        assert response.headers["ratelimit-remaining"] == "10"
+        assert response.json() == BARS
+        assert self.requests[0].headers["Authorization"] == "Bearer key"
+        assert self.requests[0].extensions["timeout"] == {"connect": 1, "read": 2, "write": 2, "pool": 1}
+
+    def test_stream(self) -> None:
+        response: requests.Response = self.transport.get(URL, {}, Timeout(), stream=True)
+
+        assert json.loads(b"".join(response.iter_content(chunk_size=4))) == BARS
+
+    def test_stream_reads_error_body(self) -> None:
+        response: requests.Response = self.transport.get(
+            "https://api.yelp.com/v3/categories/missing", {}, Timeout(), stream=True
+        )
+
+        assert response.status_code == 404
+        assert response.json()["error"]["code"] == "NOT_FOUND"
+
+    def test_concurrent_requests(self) -> None:
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            responses: List[requests.Response] = list(
+                executor.map(lambda _: self.transport.get(URL, {}, Timeout()), range(32))
+            )
+
+        assert all(response.json() == BARS for response in responses)
+
+    def test_close(self) -> None:
+        self.transport.close()
+
+        assert self.transport.client.is_closed
+        self.transport.close()
+
+
+class TestTransportRegistry:
+    def teardown_method(self) -> None:
+        set_transport(None)
+        set_async_transport(None)
+        set_retry_policy(None)
+        reset_circuit_breakers()
+
+    def test_defaults(self) -> None:
+        assert isinstance(get_transport(), RequestsTransport)
+        assert isinstance(get_async_transport(), HttpxTransport)
+
+    def test_http2_setting(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        pytest.importorskip("h2")
+        monkeypatch.setenv("YELP_HTTP2", "true")
+
+        transport: Transport = get_transport()
+
+        assert isinstance(transport, Http2Transport)
+        set_transport(None)
+        assert transport.client.is_closed
+
+    def test_endpoints_go_through_transport(self) -> None:
+        stub: StubTransport = StubTransport(routes={"/categories/bars": BARS, "/categories": {"categories": []}})
+        set_transport(stub)
+
+        category_details: CategoryDetails = Client.category_details(alias="bars").get()
+        categories: List[Category] = list(Client.all_categories().stream())
+
+        assert category_details.category.title == "Bars"
+        assert categories == []
+        assert stub.requests == [URL, "https://api.yelp.com/v3/categories"]
+
+    def test_retries_stub_status_codes(self) -> None:
+        set_retry_policy(RetryPolicy(backoff_base=0.001, backoff_max=0.001))
+        set_transport(StubTransport(routes={"/categories/*": [StubResponse(status_code=503), StubResponse(BARS)]}))
+
+        assert Client.category_details(alias="bars").get().category.alias == "bars"
+
+        set_transport(StubTransport())
+        with pytest.raises(ApiError) as error:
+            Client.category_details(alias="bars").get()
+        assert error.value.status_code == 404
+
+    def test_async_endpoints_go_through_transport(self) -> None:
+        pytest.importorskip("httpx")
+        set_async_transport(StubTransport(routes={"/categories/bars": BARS}))
+
+        async def run() -> CategoryDetails:
+            async with AsyncClient() as client:
+                return await client.category_details(alias="bars").aget()
+
+        assert asyncio.run(run()).category.title == "Bars"
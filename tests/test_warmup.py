@@ -0,0 +1,111 @@
+import asyncio
+from typing import List, Tuple
+
+import pycountry
+import pytest
+import requests
+
+from yelpfusion3.client import AsyncClient, Client
+from yelpfusion3.timeout import Timeout
+from yelpfusion3.transport import (
+    Http2Transport,
+    HttpxTransport,
+    RequestsTransport,
+    StubTransport,
+    set_async_transport,
+    set_transport,
+)
+from yelpfusion3.warmup import preload, warmup
+
+URL: str = "https://api.yelp.com/v3"
+
+
+class RecordingTransport(StubTransport):
+    def __init__(self) -> None:
+        super().__init__()
+        self.calls: List[Tuple[str, int]] = []
+
+    def warmup(self, url: str, connections: int, timeout: Timeout) -> int:
+        self.calls.append((url, connections))
+        return connections
+
+    async def awarmup(self, url: str, connections: int, timeout: Timeout) -> int:
+        return self.warmup(url, connections, timeout)
+
+
+class TestWarmup:
+    def setup_method(self) -> None:
+        self.transport: RecordingTransport = RecordingTransport()
+        set_transport(self.transport)
+        set_async_transport(self.transport)
+
+    def teardown_method(self) -> None:
+        set_transport(None)
+        set_async_transport(None)
+
+    def test_preload(self) -> None:
+        preload()
+
+        assert pycountry.countries._is_loaded  # pylint: disable=protected-access
+
+    def test_defaults_to_pool_size(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv("YELP_POOL_MAXSIZE", "7")
+
+        assert Client.warmup() == 7
+        assert self.transport.calls == [(URL, 7)]
+
+    def test_connections(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv("YELP_WARMUP_CONNECTIONS", "3")
+
+        assert warmup() == 3
+        assert warmup(connections=5) == 5
+
+    def test_awarmup_capped_by_async_pool(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv("YELP_ASYNC_MAX_CONNECTIONS", "2")
+
+        assert asyncio.run(AsyncClient.awarmup(connections=10)) == 2
+
+
+class TestTransportWarmup:
+    def test_without_pool(self) -> None:
+        assert StubTransport().warmup(URL, 4, Timeout()) == 0
+
+    def test_requests(self) -> None:
+        calls: List[str] = []
+
+        class FakeSession:
+            def head(self, url: str, **kwargs: object) -> requests.Response:
+                calls.append(url)
+                if len(calls) == 1:
+                    raise requests.ConnectionError()
+                response: requests.Response = requests.Response()
+                response.status_code = 404
+                response._content = b""  # pylint: disable=protected-access
+                return response
+
+        assert RequestsTransport(FakeSession()).warmup(URL, 4, Timeout()) == 3
+        assert calls == [URL] * 4
+
+    def test_httpx(self) -> None:
+        httpx = pytest.importorskip("httpx")
+        methods: List[str] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            methods.append(request.method)
+            return httpx.Response(200)
+
+        client: httpx.AsyncClient = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+        assert asyncio.run(HttpxTransport(client).awarmup(URL, 4, Timeout())) == 4
+        assert methods == ["HEAD"] * 4
+
+    def test_http2_opens_one_connection(self) -> None:
+        httpx = pytest.importorskip("httpx")
+        transport: Http2Transport = Http2Transport(
+            httpx.AsyncClient(transport=httpx.MockTransport(lambda request: httpx.Response(200)))
+        )
+
+        try:
+            assert transport.warmup(URL, 4, Timeout()) == 1
+        finally:
+            transport.close()